@@ -8,6 +8,7 @@ import requests
 import requests.adapters
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
+from urllib3.util.request import ACCEPT_ENCODING
 import json
 import sqlite3
 import os
@@ -15,7 +16,9 @@ import subprocess
 import threading
 import concurrent.futures
 import datetime
+import calendar
 import time
+import math
 import random
 import logging
 from logging.handlers import RotatingFileHandler
@@ -34,23 +37,37 @@ from markdown.extensions.tables import TableExtension
 from markdown.extensions.toc import TocExtension
 from markdown.extensions.extra import ExtraExtension
 import html
-import base64
 from bs4 import BeautifulSoup
+try:
+    # Optional C-backed HTML parser; BeautifulSoup is used when unavailable
+    from selectolax.parser import HTMLParser as FastHTMLParser
+except ImportError:
+    FastHTMLParser = None
+try:
+    # Optional fast JSON decoder for large registry documents
+    import orjson
+except ImportError:
+    orjson = None
 import queue
 import hashlib
 import zlib
+import mmap
+import tempfile
 from functools import lru_cache, partial
 import tkinter.font as tkfont
 import mimetypes
-import tempfile
 import shutil
+import glob
 from pathlib import Path
-import humanize
+from collections import OrderedDict, deque
 import dateutil.parser
 from dateutil.relativedelta import relativedelta
 import tarfile
 import zipfile
 import io
+from array import array
+from bisect import bisect_right
+from itertools import islice
 
 # Configure logging with rotation
 logging.basicConfig(
@@ -68,12 +85,67 @@ CACHE_DB = "npm_cache.db"
 SEARCH_HISTORY_DB = "search_history.db"
 SETTINGS_FILE = "npm_analyzer_settings.ini"
 CACHE_TTL_DAYS = 7
+DIST_TAG_TTL_SECONDS = 300  # dist-tags move; published name@version data never does
 DEFAULT_MAX_CONCURRENT_REQUESTS = 40  # Increased from 20 to 40
 REQUEST_TIMEOUT = 30
 DEFAULT_MAX_RESULTS = 50000
 MAX_SEARCH_HISTORY = 20
-DEFAULT_DOWNLOAD_DIR = os.path.join(os.path.expanduser("~"), "npm_packages")
+# Registry search qualifier prepended to the query for each search mode
+MODE_PREFIX = {
+    "keywords": "keywords:",
+    "author": "author:",
+    "maintainer": "maintainer:",
+    "scope": "scope:",
+    "exact package": "package:",
+}
+MODE_EXPLANATIONS = {
+    "general": "Search across package names, descriptions, and keywords. Best for broad discovery.",
+    "exact package": "Search for exact package name matches only. Use when you know the exact name.",
+    "keywords": "Search only in package keywords. Find packages with specific functionality tags.",
+    "author": "Search by package author name. Find all packages by a specific developer.",
+    "maintainer": "Search by package maintainer name. Find packages maintained by specific people.",
+    "scope": "Search within specific npm scopes (e.g., @angular, @react). Find packages from organizations."
+}
+# Search history combo entries look like "query (mode)"
+_HIST_RE = re.compile(r"^(.*) \(([^()]+)\)$")
+# How far back each "Updated Since" option reaches
+DATE_DELTA = {
+    "last week": datetime.timedelta(days=7),
+    "last month": datetime.timedelta(days=30),
+    "last year": datetime.timedelta(days=365),
+}
+ETAG_CACHE_MAX_ENTRIES = 256  # Registry responses kept for If-None-Match revalidation
+ETAG_CACHE_MAX_BYTES = 64 * 1024 * 1024  # Total body bytes kept for revalidation
+HIGHLIGHT_MAX_BYTES = 200_000  # Larger files are shown without syntax highlighting
+MARKDOWN_MAX_CHARS = 50_000  # Longer READMEs are shown as plain text instead of rendered markdown
+HIGHLIGHT_MAX_LINE_LENGTH = 5000  # Longer lines mean minified code, also shown plain
+OPEN_ARCHIVE_CACHE_SIZE = 4  # Package archives FileTreeViewer keeps open and indexed
+RESULT_ROW_HEIGHT = 24  # Pixel height of a results row; the viewport size is derived from it
+RESULT_FLUSH_INTERVAL_MS = 50  # Streamed search results are handed to the UI at most this often
+RESULT_FLUSH_BATCH = 500  # Max results added to the list per UI tick
+PROGRESS_REFRESH_MS = 33  # Search progress is redrawn at most ~30 times a second
+MARKDOWN_SEGMENTS_PER_TICK = 200  # README segments inserted per event-loop tick
+DEPS_DISPLAY_LIMIT = 500  # Rows shown per dependencies/dependents tree
+KEYWORDS_SHOWN = 20  # Keywords listed in the overview before the rest are summarized
+INFO_FIELD_WIDTH = 160  # Pixel width of the field name column in the overview info table
+README_PRELOAD_LINES = 200  # README lines inserted up front; the rest follows as the user scrolls
+README_CACHE_SIZE = 64  # Parsed README segment lists kept, keyed by package name and version
+JSON_CHUNK_BYTES = 64 * 1024  # JSON tab text read at a time; more is appended as the user scrolls down
+CLIENT_EXECUTOR_WORKERS = 32  # Worker threads kept warm per NPMClient pool
+DETAIL_EXECUTOR_WORKERS = 4  # Threads loading the package shown in the details panel
+DOWNLOADS_BULK_LIMIT = 128  # Max package names per bulk downloads API call
+HTTP_POOL_CONNECTIONS = 32  # Per-host connection pools kept alive
+# Keep-alive connections per host: one for every client pool worker plus headroom for
+# download and UI threads, so no worker's connection is discarded after use
+HTTP_POOL_MAXSIZE = 2 * CLIENT_EXECUTOR_WORKERS + 16
+TARBALL_STREAM_BUFSIZE = 64 * 1024  # Larger reads mean fewer loop iterations when skipping member bodies
+USER_HOME = os.path.expanduser("~")
+DEFAULT_DOWNLOAD_DIR = os.path.join(USER_HOME, "npm_packages")
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+README_ELEMENT_TAGS = frozenset([
+    'p', 'pre', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'ul', 'ol', 'li',
+    'blockquote', 'code', 'table', 'tr', 'td', 'th'
+])
 
 # Platform detection
 IS_WINDOWS = platform.system() == "Windows"
@@ -133,8 +205,27 @@ class Theme:
             'operator': cls.CODE_KEYWORD,
         }
 
+@lru_cache(maxsize=None)
+def _shared_font(family: str, size: int, weight: str = "normal", slant: str = "roman") -> tkfont.Font:
+    """One Font object per spec, so widgets and tags reuse an already-resolved font"""
+    return tkfont.Font(family=family, size=size, weight=weight, slant=slant)
+
+class _SegmentBuffer:
+    """Stand-in for a Text widget that records (text, tags) inserts instead of drawing them"""
+    def __init__(self):
+        self.segments: List[Tuple[str, tuple]] = []
+
+    def insert(self, index, chars: str, tags=()):
+        self.segments.append((chars, tags))
+
 class MarkdownRenderer:
     """Enhanced Markdown renderer with syntax highlighting and proper styling"""
+    # Inline patterns for the plain-text fallback, compiled once for every README
+    _BOLD_RE = re.compile(r'\*\*(.*?)\*\*')
+    _ITALIC_RE = re.compile(r'\*(.*?)\*')
+    _CODE_RE = re.compile(r'`(.*?)`')
+    _LINK_RE = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+
     def __init__(self, text_widget: tk.Text):
         self.text_widget = text_widget
         self._setup_tags()
@@ -142,27 +233,27 @@ class MarkdownRenderer:
     def _setup_tags(self):
         """Setup text widget tags for markdown styling"""
         # Headers
-        self.text_widget.tag_config("h1", foreground=Theme.ACCENT, font=("Segoe UI", 18, "bold"), spacing3=10)
-        self.text_widget.tag_config("h2", foreground=Theme.ACCENT, font=("Segoe UI", 16, "bold"), spacing3=8)
-        self.text_widget.tag_config("h3", foreground=Theme.ACCENT, font=("Segoe UI", 14, "bold"), spacing3=6)
-        self.text_widget.tag_config("h4", foreground=Theme.ACCENT, font=("Segoe UI", 12, "bold"), spacing3=4)
-        self.text_widget.tag_config("h5", foreground=Theme.ACCENT, font=("Segoe UI", 11, "bold"))
-        self.text_widget.tag_config("h6", foreground=Theme.ACCENT, font=("Segoe UI", 10, "bold"))
+        self.text_widget.tag_config("h1", foreground=Theme.ACCENT, font=_shared_font("Segoe UI", 18, "bold"), spacing3=10)
+        self.text_widget.tag_config("h2", foreground=Theme.ACCENT, font=_shared_font("Segoe UI", 16, "bold"), spacing3=8)
+        self.text_widget.tag_config("h3", foreground=Theme.ACCENT, font=_shared_font("Segoe UI", 14, "bold"), spacing3=6)
+        self.text_widget.tag_config("h4", foreground=Theme.ACCENT, font=_shared_font("Segoe UI", 12, "bold"), spacing3=4)
+        self.text_widget.tag_config("h5", foreground=Theme.ACCENT, font=_shared_font("Segoe UI", 11, "bold"))
+        self.text_widget.tag_config("h6", foreground=Theme.ACCENT, font=_shared_font("Segoe UI", 10, "bold"))
 
         # Text styles
-        self.text_widget.tag_config("bold", font=("Segoe UI", 10, "bold"))
-        self.text_widget.tag_config("italic", font=("Segoe UI", 10, "italic"))
-        self.text_widget.tag_config("bold_italic", font=("Segoe UI", 10, "bold italic"))
+        self.text_widget.tag_config("bold", font=_shared_font("Segoe UI", 10, "bold"))
+        self.text_widget.tag_config("italic", font=_shared_font("Segoe UI", 10, slant="italic"))
+        self.text_widget.tag_config("bold_italic", font=_shared_font("Segoe UI", 10, "bold", slant="italic"))
         self.text_widget.tag_config("strikethrough", overstrike=True)
         self.text_widget.tag_config("link", foreground=Theme.ACCENT, underline=True)
 
         # Code styles
-        self.text_widget.tag_config("code", background=Theme.CODE_BG, foreground=Theme.CODE_FG, font=("Consolas", 10), spacing3=2)
-        self.text_widget.tag_config("codeblock", background=Theme.CODE_BG, foreground=Theme.CODE_FG, font=("Consolas", 10), lmargin1=20, lmargin2=20, spacing3=5)
+        self.text_widget.tag_config("code", background=Theme.CODE_BG, foreground=Theme.CODE_FG, font=_shared_font("Consolas", 10), spacing3=2)
+        self.text_widget.tag_config("codeblock", background=Theme.CODE_BG, foreground=Theme.CODE_FG, font=_shared_font("Consolas", 10), lmargin1=20, lmargin2=20, spacing3=5)
 
         # Block styles
         self.text_widget.tag_config("blockquote", lmargin1=20, lmargin2=20, spacing3=5, foreground=Theme.TEXT_SECONDARY)
-        self.text_widget.tag_config("pre", background=Theme.BG_TERTIARY, font=("Consolas", 10))
+        self.text_widget.tag_config("pre", background=Theme.BG_TERTIARY, font=_shared_font("Consolas", 10))
 
         # List styles
         self.text_widget.tag_config("list_item", lmargin1=20, lmargin2=20)
@@ -171,7 +262,7 @@ class MarkdownRenderer:
 
         # Table styles
         self.text_widget.tag_config("table", spacing3=5)
-        self.text_widget.tag_config("table_header", font=("Segoe UI", 10, "bold"), background=Theme.BG_TERTIARY)
+        self.text_widget.tag_config("table_header", font=_shared_font("Segoe UI", 10, "bold"), background=Theme.BG_TERTIARY)
         self.text_widget.tag_config("table_cell", spacing3=2)
 
         # Syntax highlighting tags
@@ -182,11 +273,25 @@ class MarkdownRenderer:
         """Render markdown text in the widget with full styling"""
         self.text_widget.config(state=tk.NORMAL)
         self.text_widget.delete(1.0, tk.END)
+        self.insert_segments(self.to_segments(markdown_text))
+
+    def insert_segments(self, segments: Sequence[Tuple[str, tuple]]):
+        """Append parsed segments to the widget with a single Tk call"""
+        args: List[Any] = []
+        for chars, tags in segments:
+            args.extend((chars, tags))
+
+        self.text_widget.config(state=tk.NORMAL)
+        if args:
+            self.text_widget.insert(tk.END, *args)
+        self.text_widget.config(state=tk.DISABLED)
 
+    def to_segments(self, markdown_text: str) -> List[Tuple[str, tuple]]:
+        """Parse markdown into (text, tags) segments; makes no Tk calls, so it can run off the UI thread"""
+        buffer = _SegmentBuffer()
         if not markdown_text or not markdown_text.strip():
-            self.text_widget.insert(tk.END, "(No README available)")
-            self.text_widget.config(state=tk.DISABLED)
-            return
+            buffer.insert(tk.END, "(No README available)")
+            return buffer.segments
 
         try:
             # Convert markdown to HTML with extensions
@@ -205,15 +310,16 @@ class MarkdownRenderer:
 
             # Parse HTML and apply tags
             soup = BeautifulSoup(html_content, 'html.parser')
-            self._parse_html(soup, self.text_widget)
+            self._parse_html(soup, buffer)
         except Exception as e:
             logger.error(f"Error rendering markdown: {e}")
             # Fallback to plain text with basic formatting
-            self._render_as_plain_text(markdown_text)
+            buffer = _SegmentBuffer()
+            self._render_as_plain_text(markdown_text, buffer)
 
-        self.text_widget.config(state=tk.DISABLED)
+        return buffer.segments
 
-    def _render_as_plain_text(self, text: str):
+    def _render_as_plain_text(self, text: str, widget):
         """Render as plain text with basic formatting"""
         lines = text.split('\n')
         in_code_block = False
@@ -223,8 +329,8 @@ class MarkdownRenderer:
             if line.strip().startswith('```'):
                 if in_code_block:
                     # End of code block
-                    self.text_widget.insert(tk.END, '\n'.join(code_block_content), "codeblock")
-                    self.text_widget.insert(tk.END, '\n')
+                    widget.insert(tk.END, '\n'.join(code_block_content), "codeblock")
+                    widget.insert(tk.END, '\n')
                     code_block_content = []
                     in_code_block = False
                 else:
@@ -238,51 +344,51 @@ class MarkdownRenderer:
 
             # Handle headers
             if line.startswith('# '):
-                self.text_widget.insert(tk.END, '\n', ())
-                self.text_widget.insert(tk.END, line[2:] + '\n', "h1")
+                widget.insert(tk.END, '\n', ())
+                widget.insert(tk.END, line[2:] + '\n', "h1")
             elif line.startswith('## '):
-                self.text_widget.insert(tk.END, '\n', ())
-                self.text_widget.insert(tk.END, line[3:] + '\n', "h2")
+                widget.insert(tk.END, '\n', ())
+                widget.insert(tk.END, line[3:] + '\n', "h2")
             elif line.startswith('### '):
-                self.text_widget.insert(tk.END, '\n', ())
-                self.text_widget.insert(tk.END, line[4:] + '\n', "h3")
+                widget.insert(tk.END, '\n', ())
+                widget.insert(tk.END, line[4:] + '\n', "h3")
             elif line.startswith('#### '):
-                self.text_widget.insert(tk.END, '\n', ())
-                self.text_widget.insert(tk.END, line[5:] + '\n', "h4")
+                widget.insert(tk.END, '\n', ())
+                widget.insert(tk.END, line[5:] + '\n', "h4")
             elif line.startswith('##### '):
-                self.text_widget.insert(tk.END, '\n', ())
-                self.text_widget.insert(tk.END, line[6:] + '\n', "h5")
+                widget.insert(tk.END, '\n', ())
+                widget.insert(tk.END, line[6:] + '\n', "h5")
             elif line.startswith('###### '):
-                self.text_widget.insert(tk.END, '\n', ())
-                self.text_widget.insert(tk.END, line[7:] + '\n', "h6")
+                widget.insert(tk.END, '\n', ())
+                widget.insert(tk.END, line[7:] + '\n', "h6")
             elif line.strip().startswith('>'):
                 # Blockquote
-                self.text_widget.insert(tk.END, '\n', ())
-                self.text_widget.insert(tk.END, line.strip()[1:] + '\n', "blockquote")
+                widget.insert(tk.END, '\n', ())
+                widget.insert(tk.END, line.strip()[1:] + '\n', "blockquote")
             elif line.strip().startswith('- ') or line.strip().startswith('* '):
                 # List item
-                self.text_widget.insert(tk.END, '• ' + line.strip()[2:] + '\n', "list_item")
+                widget.insert(tk.END, '• ' + line.strip()[2:] + '\n', "list_item")
             elif line.strip().startswith('1. '):
                 # Ordered list
-                self.text_widget.insert(tk.END, line + '\n', "ordered_list")
+                widget.insert(tk.END, line + '\n', "ordered_list")
             elif line.strip() == '':
-                self.text_widget.insert(tk.END, '\n', ())
+                widget.insert(tk.END, '\n', ())
             else:
                 # Regular text with inline formatting
                 formatted_line = self._format_inline_text(line)
-                self.text_widget.insert(tk.END, formatted_line + '\n', ())
+                widget.insert(tk.END, formatted_line + '\n', ())
 
     def _format_inline_text(self, text: str) -> str:
         """Format inline text with bold, italic, code, and links"""
         # Simple regex-based formatting
         # Bold text **text**
-        text = re.sub(r'\*\*(.*?)\*\*', lambda m: f'**{m.group(1)}**', text)
+        text = self._BOLD_RE.sub(r'**\1**', text)
         # Italic text *text*
-        text = re.sub(r'\*(.*?)\*', lambda m: f'*{m.group(1)}*', text)
+        text = self._ITALIC_RE.sub(r'*\1*', text)
         # Inline code `code`
-        text = re.sub(r'`(.*?)`', lambda m: f'`{m.group(1)}`', text)
+        text = self._CODE_RE.sub(r'`\1`', text)
         # Links [text](url)
-        text = re.sub(r'\[([^\]]+)\]\(([^)]+)\)', lambda m: f'[{m.group(1)}]({m.group(2)})', text)
+        text = self._LINK_RE.sub(r'[\1](\2)', text)
         return text
 
     def _parse_html(self, element, widget, tag_stack=None, in_code_block=False):
@@ -388,6 +494,28 @@ class MarkdownRenderer:
                     text = ' '.join(text.split())
                     widget.insert(tk.END, text, tuple(tag_stack))
 
+# Patterns used when rendering every result row
+_NON_NUMERIC_RE = re.compile(r'[^\d.]')
+_SIZE_UNIT_RE = re.compile(r'[A-Za-z]+')
+_FIRST_NUMBER_RE = re.compile(r'(\d+)')
+
+# Size colors: unit -> (color at zero, color at the cap, size in that unit where the cap is reached)
+SIZE_GRADIENTS = {
+    'KB': (Theme.SIZE_KB, Theme.ACCENT_DARK, 100),
+    'MB': (Theme.SIZE_MB, "#7C3AED", 10),
+    'GB': (Theme.SIZE_GB, Theme.ERROR_DARK, 1),
+}
+SIZE_COLOR_STEPS = 8  # Each size gradient is quantized to this many result-row tags
+TIME_BUCKET_COLORS = {
+    'recent': Theme.TIME_RECENT,
+    'day': Theme.TIME_DAY,
+    'week': Theme.TIME_WEEK,
+    'month': Theme.TIME_MONTH,
+    'muted': Theme.TEXT_MUTED,
+}
+
+_SKIP_VALUES = frozenset(('Unknown', 'N/A', '0'))  # Overview values not worth a row
+
 @dataclass
 class PackageInfo:
     """Enhanced NPM package information structure with caching and validation"""
@@ -437,6 +565,7 @@ class PackageInfo:
         """Initialize and validate fields"""
         self.last_fetched = time.time()
         self.cache_key = self._generate_cache_key()
+        self._overview_rows: Optional[List[Tuple[str, str]]] = None
 
     def _generate_cache_key(self) -> str:
         """Generate a cache key based on package name and version"""
@@ -504,6 +633,37 @@ class PackageInfo:
         instance.last_fetched = time.time()
         return instance
 
+    def overview_rows(self) -> List[Tuple[str, str]]:
+        """(label, value) rows of the overview info table, formatted once and then reused"""
+        if self._overview_rows is None:
+            rows = [
+                ("Unpacked Size", self.size_unpacked),
+                ("Total Files", self.file_count),
+                ("Weekly Downloads", str(self.downloads_last_week) if self.downloads_last_week else 'N/A'),
+                ("Download Trend", self.downloads_trend),
+                ("Last Publish", self.last_publish),
+                ("Published Date", self.published_date),
+                ("Last Modified", self.modified_date),
+                ("License", self.license),
+                ("Author", self.author),
+                ("Dependencies", f"{self.dependencies_count} ({len(self.dependencies) if self.dependencies else 0} direct)"),
+                ("Dev Dependencies", str(self.dev_dependencies_count)),
+                ("Peer Dependencies", str(self.peer_dependencies_count)),
+                ("Dependents", str(self.dependents_count)),
+                ("Total Versions", str(self.total_versions)),
+                ("Maintainers", str(self.maintainers_count)),
+                ("Has TypeScript", "Yes" if self.has_typescript else "No"),
+                ("Has Tests", "Yes" if self.has_tests else "No"),
+                ("Has Readme", "Yes" if self.has_readme else "No"),
+                ("Quality Score", f"{self.score_quality:.2f}"),
+                ("Popularity Score", f"{self.score_popularity:.2f}"),
+                ("Maintenance Score", f"{self.score_maintenance:.2f}"),
+                ("Final Score", f"{self.score_final:.2f}"),
+            ]
+            self._overview_rows = [(label, value) for label, value in rows
+                                  if value and not (isinstance(value, str) and value in _SKIP_VALUES)]
+        return self._overview_rows
+
     def is_stale(self, ttl: int = 3600) -> bool:
         """Check if package data is stale"""
         return (time.time() - self.last_fetched) > ttl
@@ -515,12 +675,12 @@ class PackageInfo:
 
         try:
             # Extract numeric value
-            size_str = re.sub(r'[^\d.]', '', self.size_unpacked)
+            size_str = _NON_NUMERIC_RE.sub('', self.size_unpacked)
             if not size_str:
                 return self.size_unpacked
 
             size = float(size_str)
-            unit = re.search(r'[A-Za-z]+', self.size_unpacked)
+            unit = _SIZE_UNIT_RE.search(self.size_unpacked)
             if unit:
                 unit = unit.group(0).upper()
                 if unit == 'KB':
@@ -530,7 +690,7 @@ class PackageInfo:
                 elif unit == 'GB':
                     size *= 1024 * 1024 * 1024
 
-            return humanize.naturalsize(size, binary=True)
+            return _format_file_size(size)
         except:
             return self.size_unpacked
 
@@ -559,40 +719,39 @@ class PackageInfo:
         except:
             return date_str
 
-    def get_size_color(self) -> str:
-        """Get color based on package size"""
+    def _size_gradient_position(self) -> Optional[Tuple[str, float]]:
+        """Get the size unit and how far along that unit's color gradient the package is"""
         if self.size_unpacked == "Unknown":
-            return Theme.TEXT_MUTED
+            return None
 
-        try:
-            # Extract numeric value
-            size_str = re.sub(r'[^\d.]', '', self.size_unpacked)
-            if not size_str:
-                return Theme.TEXT_MUTED
+        size_str = _NON_NUMERIC_RE.sub('', self.size_unpacked)
+        unit = _SIZE_UNIT_RE.search(self.size_unpacked)
+        if not size_str or not unit:
+            return None
 
-            size = float(size_str)
-            unit = re.search(r'[A-Za-z]+', self.size_unpacked)
-            if unit:
-                unit = unit.group(0).upper()
+        unit = unit.group(0).upper()
+        gradient = SIZE_GRADIENTS.get(unit)
+        if not gradient:
+            return None
 
-                if unit == 'KB':
-                    # Gradient from light to darker blue based on size
-                    ratio = min(size / 100, 1.0)  # Normalize to 0-1, max at 100KB
-                    return self._interpolate_color(Theme.SIZE_KB, Theme.ACCENT_DARK, ratio)
-                elif unit == 'MB':
-                    # Gradient from purple to darker purple based on size
-                    ratio = min(size / 10, 1.0)  # Normalize to 0-1, max at 10MB
-                    return self._interpolate_color(Theme.SIZE_MB, "#7C3AED", ratio)
-                elif unit == 'GB':
-                    # Gradient from red to darker red based on size
-                    ratio = min(size / 1, 1.0)  # Normalize to 0-1, max at 1GB
-                    return self._interpolate_color(Theme.SIZE_GB, Theme.ERROR_DARK, ratio)
+        try:
+            size = float(size_str)
+        except ValueError:
+            return None
+        return unit, min(size / gradient[2], 1.0)
 
-            return Theme.TEXT_MUTED
-        except:
+    def get_size_color(self) -> str:
+        """Get color based on package size"""
+        position = self._size_gradient_position()
+        if not position:
             return Theme.TEXT_MUTED
 
-    def _interpolate_color(self, color1: str, color2: str, ratio: float) -> str:
+        unit, ratio = position
+        start, end, _ = SIZE_GRADIENTS[unit]
+        return self._interpolate_color(start, end, ratio)
+
+    @staticmethod
+    def _interpolate_color(color1: str, color2: str, ratio: float) -> str:
         """Interpolate between two colors"""
         try:
             # Convert hex to RGB
@@ -609,35 +768,30 @@ class PackageInfo:
         except:
             return color1
 
-    def get_time_color(self) -> str:
-        """Get color based on last publish time"""
+    def get_time_bucket(self) -> str:
+        """Get the last-publish color key: recent, day, week, month or muted"""
         if self.last_publish == "Unknown":
-            return Theme.TEXT_MUTED
+            return "muted"
 
         try:
             # Parse the human-readable time string
             if "hour" in self.last_publish:
-                # Very recent - bright green
-                return Theme.TIME_RECENT
+                return "recent"
             elif "day" in self.last_publish:
-                # Days ago - orange
-                days = int(re.search(r'(\d+)', self.last_publish).group(1))
-                if days <= 3:
-                    # Recent days - brighter orange
-                    return Theme.TIME_DAY
-                else:
-                    # Older days - yellow
-                    return Theme.TIME_WEEK
+                days = int(_FIRST_NUMBER_RE.search(self.last_publish).group(1))
+                return "day" if days <= 3 else "week"
             elif "week" in self.last_publish:
-                # Weeks ago - yellow
-                return Theme.TIME_WEEK
+                return "week"
             elif "month" in self.last_publish or "year" in self.last_publish:
-                # Months or years ago - gray
-                return Theme.TIME_MONTH
+                return "month"
             else:
-                return Theme.TEXT_MUTED
-        except:
-            return Theme.TEXT_MUTED
+                return "muted"
+        except AttributeError:
+            return "muted"
+
+    def get_time_color(self) -> str:
+        """Get color based on last publish time"""
+        return TIME_BUCKET_COLORS[self.get_time_bucket()]
 
 class SettingsManager:
     """Enhanced settings manager with validation and defaults"""
@@ -654,7 +808,9 @@ class SettingsManager:
             'show_dependents': 'True',
             'dark_mode': 'True',
             'font_size': '10',
-            'show_tooltips': 'True'
+            'show_tooltips': 'True',
+            'highlight_max_bytes': str(HIGHLIGHT_MAX_BYTES),
+            'max_markdown_chars': str(MARKDOWN_MAX_CHARS)
         }
     }
 
@@ -739,33 +895,85 @@ class SettingsManager:
         """Set download directory"""
         self.set('General', 'download_directory', path)
 
+# Kept as a single module-level string so sqlite3's statement cache reuses the
+# compiled statement across calls
+_GET_PKG_SQL = """
+    SELECT * FROM packages
+    WHERE name = ? AND (version = ? OR ? = 'latest')
+    AND last_fetched > ?
+    ORDER BY last_fetched DESC LIMIT 1
+"""
+
 class CacheManager:
     """Enhanced SQLite-based cache manager with compression and validation"""
     def __init__(self, db_path: str, ttl_days: int = CACHE_TTL_DAYS):
         self.db_path = db_path
         self.ttl_days = ttl_days
-        self.conn = None
+        self._tls = threading.local()
+        self._connections: List[Tuple[threading.Thread, sqlite3.Connection]] = []
+        self._connections_lock = threading.Lock()
+        self._db_ready = False
         self._init_db()
 
+    def _apply_pragmas(self, conn: sqlite3.Connection):
+        """Apply per-connection pragmas"""
+        # Enable WAL mode for better concurrency
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-2000")  # 2MB cache
+
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open a new connection to the cache database"""
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            timeout=30,
+            isolation_level=None  # Auto-commit mode
+        )
+        conn.row_factory = sqlite3.Row
+        self._apply_pragmas(conn)
+
+        # Track connections by owning thread so ones left behind by finished
+        # worker threads get closed instead of accumulating
+        with self._connections_lock:
+            stale = [c for t, c in self._connections if not t.is_alive()]
+            self._connections = [(t, c) for t, c in self._connections if t.is_alive()]
+            self._connections.append((threading.current_thread(), conn))
+
+        for stale_conn in stale:
+            try:
+                stale_conn.close()
+            except sqlite3.Error:
+                pass
+
+        return conn
+
+    def _conn(self) -> Optional[sqlite3.Connection]:
+        """Get the calling thread's connection, opening it on first use"""
+        # One connection per thread lets readers run in parallel under WAL
+        # instead of contending for a single shared connection
+        if not self._db_ready:
+            return None
+
+        conn = getattr(self._tls, 'conn', None)
+        if conn is None:
+            try:
+                conn = self._open_connection()
+            except sqlite3.Error as e:
+                logger.error(f"Error opening cache connection: {e}")
+                return None
+            self._tls.conn = conn
+        return conn
+
     def _init_db(self):
         """Initialize database with proper schema and indexes"""
         try:
-            self.conn = sqlite3.connect(
-                self.db_path,
-                check_same_thread=False,
-                timeout=30,
-                isolation_level=None  # Auto-commit mode
-            )
-            self.conn.row_factory = sqlite3.Row
-
-            # Enable WAL mode for better concurrency
-            self.conn.execute("PRAGMA journal_mode=WAL")
-            self.conn.execute("PRAGMA synchronous=NORMAL")
-            self.conn.execute("PRAGMA temp_store=MEMORY")
-            self.conn.execute("PRAGMA cache_size=-2000")  # 2MB cache
+            conn = self._open_connection()
+            self._tls.conn = conn
 
             # Create tables if they don't exist
-            self.conn.execute("""
+            conn.execute("""
                 CREATE TABLE IF NOT EXISTS packages (
                     cache_key TEXT PRIMARY KEY,
                     name TEXT NOT NULL,
@@ -813,7 +1021,7 @@ class CacheManager:
                 )
             """)
 
-            self.conn.execute("""
+            conn.execute("""
                 CREATE TABLE IF NOT EXISTS package_dependencies (
                     package_key TEXT NOT NULL,
                     dependency_name TEXT NOT NULL,
@@ -826,7 +1034,7 @@ class CacheManager:
                 )
             """)
 
-            self.conn.execute("""
+            conn.execute("""
                 CREATE TABLE IF NOT EXISTS package_dependents (
                     package_key TEXT NOT NULL,
                     dependent_name TEXT NOT NULL,
@@ -838,16 +1046,38 @@ class CacheManager:
                 )
             """)
 
-            # Create indexes for performance
-            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_package_name ON packages(name)")
-            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_last_fetched ON packages(last_fetched)")
-            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_dependency_name ON package_dependencies(dependency_name)")
-            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_dependent_name ON package_dependents(dependent_name)")
+            # Immutable per-version details; npm never republishes a name@version
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS version_details (
+                    name TEXT NOT NULL,
+                    version TEXT NOT NULL,
+                    unpacked_size INTEGER,
+                    file_count INTEGER,
+                    publish_time TEXT,
+                    PRIMARY KEY (name, version)
+                )
+            """)
 
-            self.conn.commit()
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS dist_tags (
+                    name TEXT PRIMARY KEY,
+                    latest TEXT NOT NULL,
+                    fetched_at REAL NOT NULL
+                )
+            """)
+
+            # Create indexes for performance
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_package_name ON packages(name)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_last_fetched ON packages(last_fetched)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_package_name_fetched ON packages(name, last_fetched DESC)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_dependency_name ON package_dependencies(dependency_name)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_dependent_name ON package_dependents(dependent_name)")
+
+            conn.commit()
+            self._db_ready = True
         except Exception as e:
             logger.error(f"Database initialization error: {e}")
-            self.conn = None
+            self._db_ready = False
 
     def _compress_data(self, data: str) -> bytes:
         """Compress data for storage"""
@@ -859,7 +1089,8 @@ class CacheManager:
 
     def get_package(self, name: str, version: str = "latest") -> Optional[PackageInfo]:
         """Get package from cache with TTL check"""
-        if not self.conn:
+        conn = self._conn()
+        if not conn:
             return None
 
         try:
@@ -867,12 +1098,9 @@ class CacheManager:
             key_data = f"{name}:{version}".encode('utf-8')
             cache_key = hashlib.md5(key_data).hexdigest()
 
-            cursor = self.conn.execute("""
-                SELECT * FROM packages 
-                WHERE name = ? AND (version = ? OR ? = 'latest') 
-                AND last_fetched > strftime('%s', 'now', ? || ' days') * 1000
-                ORDER BY last_fetched DESC LIMIT 1
-            """, (name, version, version, f"-{self.ttl_days}"))
+            # last_fetched is stored in milliseconds
+            cutoff = int((time.time() - self.ttl_days * 86400) * 1000)
+            cursor = conn.execute(_GET_PKG_SQL, (name, version, version, cutoff))
 
             row = cursor.fetchone()
             if not row:
@@ -895,11 +1123,12 @@ class CacheManager:
 
     def _get_dependency_details(self, package_key: str) -> Dict[str, Dict]:
         """Get dependency details from cache"""
-        if not self.conn:
+        conn = self._conn()
+        if not conn:
             return {}
 
         try:
-            cursor = self.conn.execute("""
+            cursor = conn.execute("""
                 SELECT dependency_name, version, size, files, last_publish 
                 FROM package_dependencies 
                 WHERE package_key = ?
@@ -921,11 +1150,12 @@ class CacheManager:
 
     def _get_dependent_details(self, package_key: str) -> Dict[str, Dict]:
         """Get dependent details from cache"""
-        if not self.conn:
+        conn = self._conn()
+        if not conn:
             return {}
 
         try:
-            cursor = self.conn.execute("""
+            cursor = conn.execute("""
                 SELECT dependent_name, size, files, last_publish 
                 FROM package_dependents 
                 WHERE package_key = ?
@@ -946,7 +1176,8 @@ class CacheManager:
 
     def save_package(self, package: PackageInfo):
         """Save package to cache with compression"""
-        if not self.conn or not package:
+        conn = self._conn()
+        if not conn or not package:
             return
 
         try:
@@ -987,7 +1218,7 @@ class CacheManager:
                 placeholders.append('?')
 
             # Insert or replace the package
-            self.conn.execute(f"""
+            conn.execute(f"""
                 INSERT OR REPLACE INTO packages ({', '.join(columns)}, last_fetched)
                 VALUES ({', '.join(placeholders)}, ?)
             """, tuple(values) + (data['last_fetched'],))
@@ -998,26 +1229,27 @@ class CacheManager:
             # Save dependent details
             self._save_dependent_details(data['cache_key'], data.get('dependent_details', {}))
 
-            self.conn.commit()
+            conn.commit()
         except Exception as e:
             logger.error(f"Cache save error for {package.name}: {e}")
-            self.conn.rollback()
+            conn.rollback()
 
     def _save_dependency_details(self, package_key: str, details: Dict[str, Dict]):
         """Save dependency details to cache"""
-        if not self.conn or not details:
+        conn = self._conn()
+        if not conn or not details:
             return
 
         try:
             # Clear existing details
-            self.conn.execute("""
+            conn.execute("""
                 DELETE FROM package_dependencies 
                 WHERE package_key = ?
             """, (package_key,))
 
             # Insert new details
             for dep_name, dep_data in details.items():
-                self.conn.execute("""
+                conn.execute("""
                     INSERT INTO package_dependencies 
                     (package_key, dependency_name, version, size, files, last_publish)
                     VALUES (?, ?, ?, ?, ?, ?)
@@ -1025,23 +1257,24 @@ class CacheManager:
                       dep_data.get('size'), dep_data.get('files'), dep_data.get('last_publish')))
         except Exception as e:
             logger.error(f"Error saving dependency details: {e}")
-            self.conn.rollback()
+            conn.rollback()
 
     def _save_dependent_details(self, package_key: str, details: Dict[str, Dict]):
         """Save dependent details to cache"""
-        if not self.conn or not details:
+        conn = self._conn()
+        if not conn or not details:
             return
 
         try:
             # Clear existing details
-            self.conn.execute("""
+            conn.execute("""
                 DELETE FROM package_dependents 
                 WHERE package_key = ?
             """, (package_key,))
 
             # Insert new details
             for dep_name, dep_data in details.items():
-                self.conn.execute("""
+                conn.execute("""
                     INSERT INTO package_dependents 
                     (package_key, dependent_name, size, files, last_publish)
                     VALUES (?, ?, ?, ?, ?)
@@ -1049,16 +1282,79 @@ class CacheManager:
                       dep_data.get('files'), dep_data.get('last_publish')))
         except Exception as e:
             logger.error(f"Error saving dependent details: {e}")
-            self.conn.rollback()
+            conn.rollback()
+
+    def get_latest_version(self, name: str, max_age: int = DIST_TAG_TTL_SECONDS) -> Optional[str]:
+        """Get the cached dist-tags.latest for a package if it is recent enough"""
+        conn = self._conn()
+        if not conn:
+            return None
+
+        try:
+            row = conn.execute("""
+                SELECT latest FROM dist_tags
+                WHERE name = ? AND fetched_at > ?
+            """, (name, time.time() - max_age)).fetchone()
+            return row['latest'] if row else None
+        except Exception as e:
+            logger.error(f"Error getting dist-tag for {name}: {e}")
+            return None
+
+    def save_latest_version(self, name: str, latest: str):
+        """Record the current dist-tags.latest for a package"""
+        conn = self._conn()
+        if not conn:
+            return
+
+        try:
+            conn.execute("""
+                INSERT OR REPLACE INTO dist_tags (name, latest, fetched_at)
+                VALUES (?, ?, ?)
+            """, (name, latest, time.time()))
+        except Exception as e:
+            logger.error(f"Error saving dist-tag for {name}: {e}")
+
+    def get_version_details(self, name: str, version: str) -> Optional[Dict]:
+        """Get cached details for a specific published version"""
+        conn = self._conn()
+        if not conn:
+            return None
+
+        try:
+            row = conn.execute("""
+                SELECT unpacked_size, file_count, publish_time
+                FROM version_details
+                WHERE name = ? AND version = ?
+            """, (name, version)).fetchone()
+            return dict(row) if row else None
+        except Exception as e:
+            logger.error(f"Error getting version details for {name}@{version}: {e}")
+            return None
+
+    def save_version_details(self, rows: List[Tuple[str, str, Optional[int], Optional[int], Optional[str]]]):
+        """Save (name, version, unpacked_size, file_count, publish_time) rows"""
+        conn = self._conn()
+        if not conn or not rows:
+            return
+
+        try:
+            conn.executemany("""
+                INSERT OR REPLACE INTO version_details
+                (name, version, unpacked_size, file_count, publish_time)
+                VALUES (?, ?, ?, ?, ?)
+            """, rows)
+        except Exception as e:
+            logger.error(f"Error saving version details: {e}")
 
     def get_stats(self) -> Dict:
         """Get cache statistics"""
-        if not self.conn:
+        conn = self._conn()
+        if not conn:
             return {'total': 0, 'fresh': 0, 'expired': 0, 'size': 0}
 
         try:
             # Get basic stats
-            cursor = self.conn.execute("""
+            cursor = conn.execute("""
                 SELECT 
                     COUNT(*) as total,
                     COUNT(CASE WHEN last_fetched > strftime('%s', 'now', '-1 day') * 1000 THEN 1 END) as fresh,
@@ -1072,7 +1368,7 @@ class CacheManager:
                 'total': row['total'],
                 'fresh': row['fresh'],
                 'expired': row['expired'],
-                'size': humanize.naturalsize(row['size'] or 0, binary=True)
+                'size': _format_file_size(row['size'] or 0)
             }
         except Exception as e:
             logger.error(f"Error getting cache stats: {e}")
@@ -1080,53 +1376,63 @@ class CacheManager:
 
     def clear_expired(self):
         """Clear expired cache entries"""
-        if not self.conn:
+        conn = self._conn()
+        if not conn:
             return
 
         try:
             # Delete expired packages
-            self.conn.execute("""
+            conn.execute("""
                 DELETE FROM packages 
                 WHERE last_fetched <= strftime('%s', 'now', '-' || ? || ' days') * 1000
             """, (self.ttl_days,))
 
             # Vacuum to reclaim space
-            self.conn.execute("VACUUM")
-            self.conn.commit()
+            conn.execute("VACUUM")
+            conn.commit()
         except Exception as e:
             logger.error(f"Error clearing expired cache: {e}")
-            self.conn.rollback()
+            conn.rollback()
 
     def clear_all(self):
         """Clear all cache entries"""
-        if not self.conn:
+        conn = self._conn()
+        if not conn:
             return
 
         try:
-            self.conn.execute("DELETE FROM packages")
-            self.conn.execute("DELETE FROM package_dependencies")
-            self.conn.execute("DELETE FROM package_dependents")
-            self.conn.execute("VACUUM")
-            self.conn.commit()
+            conn.execute("DELETE FROM packages")
+            conn.execute("DELETE FROM package_dependencies")
+            conn.execute("DELETE FROM package_dependents")
+            conn.execute("DELETE FROM version_details")
+            conn.execute("DELETE FROM dist_tags")
+            conn.execute("VACUUM")
+            conn.commit()
         except Exception as e:
             logger.error(f"Error clearing cache: {e}")
-            self.conn.rollback()
+            conn.rollback()
 
     def close(self):
-        """Close the database connection"""
-        if self.conn:
+        """Close every per-thread database connection"""
+        self._db_ready = False
+
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+
+        for _, conn in connections:
             try:
-                self.conn.execute("PRAGMA optimize")
-                self.conn.close()
+                conn.execute("PRAGMA optimize")
+                conn.close()
             except:
                 pass
-            self.conn = None
+        self._tls = threading.local()
 
 class SearchHistoryManager:
     """Enhanced search history manager with tagging and statistics"""
     def __init__(self, db_path: str):
         self.db_path = db_path
         self.conn = None
+        self.version = 0  # Bumped on every change so callers can skip re-reading unchanged history
         self._init_db()
 
     def _init_db(self):
@@ -1184,6 +1490,7 @@ class SearchHistoryManager:
             """)
 
             self.conn.commit()
+            self.version += 1
         except Exception as e:
             logger.error(f"Error adding search to history: {e}")
 
@@ -1254,6 +1561,7 @@ class SearchHistoryManager:
             self.conn.execute("DELETE FROM search_history")
             self.conn.execute("VACUUM")
             self.conn.commit()
+            self.version += 1
         except Exception as e:
             logger.error(f"Error clearing search history: {e}")
 
@@ -1286,6 +1594,117 @@ class SearchHistoryManager:
                 pass
             self.conn = None
 
+_shared_session: Optional[requests.Session] = None
+_shared_session_lock = threading.Lock()
+
+def get_shared_session() -> requests.Session:
+    """Get the process-wide HTTP session, creating it on first use"""
+    global _shared_session
+
+    with _shared_session_lock:
+        if _shared_session is None:
+            session = requests.Session()
+
+            # Configure retry strategy
+            retries = Retry(
+                total=3,
+                backoff_factor=1,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=["HEAD", "GET", "OPTIONS"]
+            )
+
+            adapter = HTTPAdapter(
+                max_retries=retries,
+                pool_connections=HTTP_POOL_CONNECTIONS,
+                pool_maxsize=HTTP_POOL_MAXSIZE
+            )
+
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+
+            session.headers.update({
+                'User-Agent': USER_AGENT,
+                'Accept': 'application/json',
+                # Adds br/zstd when brotli/zstandard are installed so urllib3 can decode them
+                'Accept-Encoding': ACCEPT_ENCODING
+            })
+
+            _shared_session = session
+
+        return _shared_session
+
+_SIZE_RE = re.compile(r'([\d.]+)\s*([KMGT]?i?B)?', re.IGNORECASE)
+_SIZE_UNITS = {
+    'B': 1,
+    'KB': 1024,
+    'MB': 1024 * 1024,
+    'GB': 1024 * 1024 * 1024,
+    'TB': 1024 * 1024 * 1024 * 1024
+}
+
+def _build_size_bucket_edges() -> Tuple[List[float], List[str]]:
+    """Byte boundaries of the quantized SIZE_GRADIENTS steps, and the row tag for each bucket"""
+    edges: List[float] = []
+    tags = ["size_muted"]
+    steps = SIZE_COLOR_STEPS - 1
+    for unit, (_, _, cap) in SIZE_GRADIENTS.items():
+        scale = _SIZE_UNITS[unit]
+        first_step = round(steps / cap)  # Step of "1 <unit>", where this unit's gradient starts
+        edges.append(scale)
+        tags.append(f"size_{unit}{first_step}")
+        for step in range(first_step + 1, steps + 1):
+            edges.append((step - 0.5) / steps * cap * scale)
+            tags.append(f"size_{unit}{step}")
+    return edges, tags
+
+SIZE_BUCKET_EDGES, SIZE_BUCKET_TAGS = _build_size_bucket_edges()
+
+def _format_file_size(size: int, _units=('KiB', 'MiB', 'GiB', 'TiB', 'PiB', 'EiB', 'ZiB', 'YiB')) -> str:
+    """Format a byte count like humanize.naturalsize(binary=True), without its overhead"""
+    if size == 1:
+        return "1 Byte"
+    if size < 1024:
+        return f"{int(size)} Bytes"
+
+    value = size / 1024
+    index = 0
+    # Step up a unit when rounding would print e.g. "1024.0 KiB"
+    while round(value, 1) >= 1024 and index < len(_units) - 1:
+        value /= 1024
+        index += 1
+    return f"{value:.1f} {_units[index]}"
+
+def _dump_json_to_tempfile(data: Any) -> str:
+    """Write data as indented UTF-8 JSON to a new temporary file and return its path"""
+    if orjson is not None:
+        encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        encoded = json.dumps(data, indent=2).encode('utf-8')
+
+    with tempfile.NamedTemporaryFile('wb', suffix='.json', delete=False) as f:
+        f.write(encoded)
+    return f.name
+
+def _remove_json_file(path: str):
+    """Delete a temp file written by _dump_json_to_tempfile, logging any failure"""
+    try:
+        os.remove(path)
+    except OSError as e:
+        logger.error(f"Error removing {path}: {e}")
+
+def _response_json(response: requests.Response) -> Any:
+    """Decode a JSON response body, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+@lru_cache(maxsize=4096)
+def _normalize_git_url(url: str) -> str:
+    """Normalize a git repository URL to its https form"""
+    url = url.replace('git+', '').replace('git://', 'https://')
+    url = url.replace('git@github.com:', 'https://github.com/')
+    return url.rstrip('.git')
+
 class NPMClient:
     """Enhanced NPM Registry API client with high-performance concurrency"""
     def __init__(self, cache: CacheManager, settings: SettingsManager):
@@ -1305,49 +1724,103 @@ class NPMClient:
         self._rate_limit_semaphore = threading.Semaphore(self.concurrency)
         self._dependency_cache = {}
         self._dependent_cache = {}
+        # Requests currently on the wire, keyed by URL, params and headers
+        self._inflight: Dict[Tuple, concurrent.futures.Future] = {}
+        self._inflight_lock = threading.Lock()
+        # Registry response bodies by URL as (etag, body, encoding), revalidated instead of re-downloaded
+        self._etag_store: 'OrderedDict[str, Tuple[str, bytes, Optional[str]]]' = OrderedDict()
+        self._etag_bytes = 0
+        self._etag_lock = threading.Lock()
+        # Long-lived pools so worker threads are reused across calls. Dependency
+        # lookups get their own pool because they are submitted from tasks that
+        # already run on the main pool and wait on the results
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=CLIENT_EXECUTOR_WORKERS, thread_name_prefix='npm-client'
+        )
+        self._dependency_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=CLIENT_EXECUTOR_WORKERS, thread_name_prefix='npm-deps'
+        )
+
+    def close(self):
+        """Shut down the worker pools, dropping work that has not started"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._dependency_executor.shutdown(wait=False, cancel_futures=True)
 
     def _create_session(self):
-        """Create a requests session with proper configuration"""
-        session = requests.Session()
-
-        # Configure retry strategy
-        retries = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "OPTIONS"]
-        )
+        """Get the shared keep-alive session so every client and worker thread reuses warm connections"""
+        return get_shared_session()
 
-        adapter = HTTPAdapter(
-            max_retries=retries,
-            pool_connections=self.concurrency * 2,
-            pool_maxsize=self.concurrency * 3
+    def _make_request(self, url: str, params: Optional[Dict] = None, headers: Optional[Dict] = None) -> Optional[requests.Response]:
+        """Make a synchronous HTTP request, sharing the response with concurrent identical requests"""
+        key = (
+            url,
+            frozenset(params.items()) if params else None,
+            frozenset(headers.items()) if headers else None
         )
 
-        session.mount('http://', adapter)
-        session.mount('https://', adapter)
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = concurrent.futures.Future()
+                self._inflight[key] = future
 
-        session.headers.update({
-            'User-Agent': USER_AGENT,
-            'Accept': 'application/json',
-            'Accept-Encoding': 'gzip, deflate'
-        })
+        if not is_owner:
+            return future.result()
 
-        return session
+        try:
+            response = self._send_request(url, params, headers)
+            future.set_result(response)
+            return response
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
 
-    def _make_request(self, url: str, params: Optional[Dict] = None, headers: Optional[Dict] = None) -> Optional[requests.Response]:
+    def _send_request(self, url: str, params: Optional[Dict] = None, headers: Optional[Dict] = None) -> Optional[requests.Response]:
         """Make a synchronous HTTP request with rate limiting"""
+        cacheable = url.startswith(self.registry_url) and not params and not headers
+        cached = None
+        if cacheable:
+            with self._etag_lock:
+                cached = self._etag_store.get(url)
+                if cached:
+                    self._etag_store.move_to_end(url)
+
         try:
-            response = self.session.get(url, params=params, headers=headers, timeout=REQUEST_TIMEOUT)
+            request_headers = {'If-None-Match': cached[0]} if cached else headers
+            response = self.session.get(url, params=params, headers=request_headers, timeout=REQUEST_TIMEOUT)
 
             if response.status_code == 429:
                 wait_time = random.uniform(1, 3)
                 logger.warning(f"Rate limited on {url}, waiting {wait_time:.1f}s")
                 time.sleep(wait_time)
-                return self._make_request(url, params, headers)
+                return self._send_request(url, params, headers)
+
+            if response.status_code == 304 and cached:
+                self._request_count += 1
+                # Serve the stored body through the 304 response, as the 200 it stands for
+                response.status_code = 200
+                response._content = cached[1]
+                response.encoding = cached[2]
+                return response
 
             response.raise_for_status()
             self._request_count += 1
+
+            etag = response.headers.get('ETag')
+            if cacheable and etag and len(response.content) <= ETAG_CACHE_MAX_BYTES:
+                with self._etag_lock:
+                    previous = self._etag_store.pop(url, None)
+                    if previous:
+                        self._etag_bytes -= len(previous[1])
+                    self._etag_store[url] = (etag, response.content, response.encoding)
+                    self._etag_bytes += len(response.content)
+                    while (len(self._etag_store) > ETAG_CACHE_MAX_ENTRIES
+                           or self._etag_bytes > ETAG_CACHE_MAX_BYTES):
+                        self._etag_bytes -= len(self._etag_store.popitem(last=False)[1][1])
             return response
         except requests.RequestException as e:
             logger.error(f"Request failed: {e}")
@@ -1479,7 +1952,7 @@ class NPMClient:
                 return f"{minutes} minute{'s' if minutes > 1 else ''} ago"
             else:
                 return "Just now"
-        except:
+        except (TypeError, ValueError, OverflowError, OSError):
             return "Unknown"
 
     def _get_dependents_count(self, package_name: str) -> int:
@@ -1519,41 +1992,83 @@ class NPMClient:
 
         return 0
 
+    def _version_details_to_dict(self, version: str, unpacked_size: Optional[int],
+                                 file_count: Optional[int], publish_time: Optional[str]) -> Dict[str, str]:
+        """Format raw per-version details for display"""
+        last_publish = 'Unknown'
+        if publish_time:
+            try:
+                last_publish = self._format_publish_date(
+                    dateutil.parser.parse(publish_time).timestamp() * 1000
+                )
+            except (ValueError, OverflowError):
+                pass
+
+        return {
+            'version': version,
+            'size': self._format_size(unpacked_size),
+            'files': str(file_count) if file_count is not None else 'Unknown',
+            'last_publish': last_publish
+        }
+
     def _get_dependency_details(self, package_name: str, dependencies: List[str]) -> Dict[str, Dict]:
         """Get detailed information for dependencies with concurrent requests"""
         details = {}
-        limit = min(20, len(dependencies))
+
+        # Dedupe and serve memory-cached names up front so only misses use a worker
+        missing = []
+        for dep_name in list(dict.fromkeys(dependencies))[:20]:
+            cached = self._dependency_cache.get(dep_name)
+            if cached is not None:
+                details[dep_name] = cached
+            else:
+                missing.append(dep_name)
+
+        if not missing:
+            return details
+
+        fetched_rows = []
+        rows_lock = threading.Lock()
 
         def fetch_dep_details(dep_name: str) -> Tuple[str, Dict[str, str]]:
             """Fetch details for a single dependency"""
             try:
-                # First try cache
-                if dep_name in self._dependency_cache:
-                    return dep_name, self._dependency_cache[dep_name]
+                # Disk cache first; it never expires for a pinned version
+                latest_version = self.cache.get_latest_version(dep_name)
+                if latest_version:
+                    row = self.cache.get_version_details(dep_name, latest_version)
+                    if row:
+                        result = self._version_details_to_dict(
+                            latest_version, row['unpacked_size'], row['file_count'], row['publish_time']
+                        )
+                        self._cache_hits += 1
+                        self._dependency_cache[dep_name] = result
+                        return dep_name, result
 
                 # Then try registry API
                 url = f"https://registry.npmjs.org/{dep_name}"
                 response = self._make_request(url)
 
                 if response and response.status_code == 200:
-                    data = response.json()
+                    data = _response_json(response)
                     latest_version = data.get('dist-tags', {}).get('latest', '')
 
                     if latest_version and latest_version in data.get('versions', {}):
                         version_info = data['versions'][latest_version]
                         dist_data = version_info.get('dist', {})
+                        unpacked_size = dist_data.get('unpackedSize')
+                        file_count = dist_data.get('fileCount')
+                        publish_time = data.get('time', {}).get(latest_version)
 
-                        result = {
-                            'version': latest_version,
-                            'size': self._format_size(dist_data.get('unpackedSize')),
-                            'files': str(dist_data.get('fileCount', 'Unknown')),
-                            'last_publish': self._format_publish_date(
-                                data.get('time', {}).get(latest_version, 0)
-                            ) if latest_version in data.get('time', {}) else 'Unknown'
-                        }
+                        result = self._version_details_to_dict(
+                            latest_version, unpacked_size, file_count, publish_time
+                        )
 
                         # Cache the result
                         self._dependency_cache[dep_name] = result
+                        self.cache.save_latest_version(dep_name, latest_version)
+                        with rows_lock:
+                            fetched_rows.append((dep_name, latest_version, unpacked_size, file_count, publish_time))
                         return dep_name, result
 
                 # Fallback to minimal info
@@ -1572,87 +2087,61 @@ class NPMClient:
                     'version': 'Unknown'
                 }
 
-        # Use ThreadPoolExecutor for concurrent requests
-        with concurrent.futures.ThreadPoolExecutor(max_workers=min(10, limit)) as executor:
-            futures = [executor.submit(fetch_dep_details, dep_name) for dep_name in dependencies[:limit]]
-
-            for future in concurrent.futures.as_completed(futures):
-                dep_name, result = future.result()
-                details[dep_name] = result
-
-        return details
-
-    def _extract_file_tree(self, package_name: str, version: str = 'latest') -> Dict:
-        """Extract file tree from downloaded package"""
-        try:
-            # Create a temporary directory for extraction
-            temp_dir = tempfile.mkdtemp()
+        futures = [self._dependency_executor.submit(fetch_dep_details, dep_name) for dep_name in missing]
 
-            # Download the package
-            download_result = self.download_package(package_name, version)
-            if not download_result['success']:
-                return {}
+        for future in concurrent.futures.as_completed(futures):
+            dep_name, result = future.result()
+            details[dep_name] = result
 
-            package_file = download_result['file']
-            package_path = os.path.join(self.download_dir, package_file)
+        # Persist newly fetched versions in one batch
+        self.cache.save_version_details(fetched_rows)
 
-            if not os.path.exists(package_path):
-                return {}
+        return details
 
-            # Extract the package
-            file_tree = {}
+    def _resolve_tarball_url(self, package_name: str, version: str = 'latest') -> Optional[str]:
+        """Look up the tarball URL for a package version or dist-tag"""
+        response = self._make_request(f"{self.registry_url}/{package_name}/{version}")
+        if not response:
+            return None
+        return _response_json(response).get('dist', {}).get('tarball')
 
-            if package_file.endswith('.tgz'):
-                # Handle tar.gz files
-                with tarfile.open(package_path, 'r:gz') as tar:
-                    for member in tar.getmembers():
+    def _extract_file_tree(self, package_name: str, version: str = 'latest',
+                           tarball_url: Optional[str] = None) -> Dict:
+        """Build the file tree by streaming the package tarball from the registry"""
+        try:
+            if not tarball_url:
+                tarball_url = self._resolve_tarball_url(package_name, version)
+                if not tarball_url:
+                    return {}
+
+            # Flat path -> size mapping; the nested view is built by the UI on demand
+            file_tree: Dict[str, int] = {}
+
+            with self.session.get(tarball_url, stream=True, timeout=REQUEST_TIMEOUT) as response:
+                response.raise_for_status()
+                self._request_count += 1
+                response.raw.decode_content = True
+
+                # Pipe mode parses headers as bytes arrive and skips over member
+                # bodies without extracting them; nothing touches disk
+                with tarfile.open(fileobj=response.raw, mode='r|*', bufsize=TARBALL_STREAM_BUFSIZE) as tar:
+                    for member in tar:
                         if member.isfile():
-                            path_parts = member.name.split('/')
-                            self._add_to_file_tree(file_tree, path_parts, member.size)
-            elif package_file.endswith('.zip'):
-                # Handle zip files
-                with zipfile.ZipFile(package_path, 'r') as zip_ref:
-                    for file_info in zip_ref.infolist():
-                        if not file_info.is_dir():
-                            path_parts = file_info.filename.split('/')
-                            self._add_to_file_tree(file_tree, path_parts, file_info.file_size)
-
-            # Clean up
-            shutil.rmtree(temp_dir, ignore_errors=True)
+                            file_tree[member.name] = member.size
 
             return file_tree
         except Exception as e:
             logger.error(f"Error extracting file tree for {package_name}: {e}")
             return {}
 
-    def _add_to_file_tree(self, file_tree: Dict, path_parts: List[str], size: int):
-        """Add a file to the file tree structure"""
-        current = file_tree
-
-        for i, part in enumerate(path_parts):
-            if i == len(path_parts) - 1:
-                # This is a file
-                current[part] = {
-                    'type': 'file',
-                    'size': size,
-                    'size_str': humanize.naturalsize(size, binary=True)
-                }
-            else:
-                # This is a directory
-                if part not in current:
-                    current[part] = {
-                        'type': 'directory',
-                        'children': {}
-                    }
-                current = current[part]['children']
-
-    def get_comprehensive_data(self, package_name: str) -> Optional[PackageInfo]:
+    def get_comprehensive_data(self, package_name: str, include_readme: bool = False,
+                               include_file_tree: bool = False) -> Optional[PackageInfo]:
         """Fetch comprehensive package data with concurrent requests"""
         # Check cache first
         cached = self.cache.get_package(package_name)
         if cached and not cached.is_stale():
             self._cache_hits += 1
-            return cached
+            return self._fill_optional_fields(cached, include_readme, include_file_tree)
 
         try:
             # Fetch from registry API
@@ -1691,7 +2180,7 @@ class NPMClient:
                     last_publish = self._format_publish_date(
                         dateutil.parser.parse(date_str).timestamp() * 1000
                     )
-                except:
+                except (TypeError, ValueError, OverflowError):
                     last_publish = 'Unknown'
 
             # Get dependencies and dependents
@@ -1702,14 +2191,15 @@ class NPMClient:
             # Get dependents count
             dependents_count = self._get_dependents_count(package_name)
 
-            # Get README content
-            readme_content = self._fetch_readme(package_name, registry_data)
+            # README and file tree are the slowest lookups; only fetch them when asked
+            readme_content = self._fetch_readme(package_name, registry_data) if include_readme else ""
 
             # Get dependency details concurrently
             dependency_details = self._get_dependency_details(package_name, dependencies)
 
-            # Get file tree
-            file_tree = self._extract_file_tree(package_name, latest_version)
+            file_tree = {}
+            if include_file_tree:
+                file_tree = self._extract_file_tree(package_name, latest_version, dist_data.get('tarball'))
 
             # Get author info
             author_data = version_info.get('author', {})
@@ -1742,7 +2232,7 @@ class NPMClient:
                 keywords=version_info.get('keywords', []),
                 has_typescript='typescript' in dev_deps or any('@types' in key for key in dependencies),
                 has_tests=any(key in dev_deps for key in ['jest', 'mocha', 'jasmine', 'ava', 'tape']),
-                has_readme=bool(readme_content),
+                has_readme=bool(readme_content or registry_data.get('readme')),
                 maintainers_count=len(registry_data.get('maintainers', [])),
                 maintainers=[m.get('name', '') for m in registry_data.get('maintainers', []) if isinstance(m, dict)],
                 dependents_count=dependents_count,
@@ -1760,11 +2250,37 @@ class NPMClient:
             logger.error(f"Error fetching comprehensive data for {package_name}: {e}")
             return None
 
+    def _fill_optional_fields(self, package: PackageInfo, include_readme: bool,
+                              include_file_tree: bool) -> PackageInfo:
+        """Fetch README and file tree for a cached package that was stored without them"""
+        updated = False
+        if include_readme and not package.readme:
+            package.readme = self.get_readme(package.name)
+            updated = bool(package.readme)
+        if include_file_tree and not package.file_tree:
+            package.file_tree = self.get_file_tree(package.name, package.version)
+            updated = updated or bool(package.file_tree)
+
+        if updated:
+            self.cache.save_package(package)
+        return package
+
+    def get_readme(self, package_name: str) -> str:
+        """Fetch README content for a package on demand"""
+        registry_data = self._fetch_registry_data(package_name)
+        if not registry_data:
+            return ""
+        return self._fetch_readme(package_name, registry_data)
+
+    def get_file_tree(self, package_name: str, version: str = 'latest') -> Dict[str, int]:
+        """Fetch the file tree for a package on demand"""
+        return self._extract_file_tree(package_name, version)
+
     def _fetch_registry_data(self, package_name: str) -> Optional[Dict]:
         """Fetch package data from npm registry"""
         url = f"{self.registry_url}/{package_name}"
         response = self._make_request(url)
-        return response.json() if response else None
+        return _response_json(response) if response else None
 
     def _fetch_readme(self, package_name: str, registry_data: Dict) -> str:
         """Fetch README content from multiple sources"""
@@ -1798,22 +2314,14 @@ class NPMClient:
                 owner = parts[-2]
                 repo = parts[-1].replace('.git', '')
 
-                # Try different README filenames
-                readme_names = ['README.md', 'README.rst', 'README', 'readme.md', 'readme.rst', 'readme']
+                # The readme endpoint resolves whichever README file the repo has
+                api_url = f"https://api.github.com/repos/{owner}/{repo}/readme"
+                # Raw media type returns the file body instead of a base64 JSON envelope
+                headers = {'Accept': 'application/vnd.github.v3.raw'}
+                response = self._make_request(api_url, headers=headers)
 
-                for readme_name in readme_names:
-                    api_url = f"https://api.github.com/repos/{owner}/{repo}/contents/{readme_name}"
-                    headers = {'Accept': 'application/vnd.github.v3+json'}
-                    response = self._make_request(api_url, headers=headers)
-
-                    if response and response.status_code == 200:
-                        data = response.json()
-                        if data.get('content'):
-                            try:
-                                content = base64.b64decode(data['content']).decode('utf-8')
-                                return content.strip()
-                            except:
-                                continue
+                if response and response.status_code == 200:
+                    return response.text.strip()
         except Exception as e:
             logger.error(f"Error fetching GitHub README: {e}")
 
@@ -1829,23 +2337,38 @@ class NPMClient:
                 return ""
 
             html_content = response.text
-            soup = BeautifulSoup(html_content, 'html.parser')
 
-            readme_div = soup.find('div', {'id': 'readme'})
-            if readme_div:
-                readme_content = ''
-
-                for element in readme_div.find_all(['p', 'pre', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'ul', 'ol', 'li', 'blockquote', 'code', 'table', 'tr', 'td', 'th']):
-                    if element.name == 'pre':
-                        readme_content += f"\n```\n{element.get_text()}\n```\n"
-                    elif element.name in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-                        readme_content += f"\n{element.get_text()}\n"
-                    elif element.name == 'code':
-                        readme_content += f"`{element.get_text()}`"
-                    else:
-                        readme_content += f"\n{element.get_text()}\n"
+            if FastHTMLParser is not None:
+                readme_div = FastHTMLParser(html_content).css_first('div#readme')
+                if readme_div is None:
+                    return ""
+                elements = [
+                    (element.tag, element.text())
+                    for element in readme_div.traverse(include_text=False)
+                    if element.tag in README_ELEMENT_TAGS
+                ]
+            else:
+                soup = BeautifulSoup(html_content, 'html.parser')
+                readme_div = soup.find('div', {'id': 'readme'})
+                if not readme_div:
+                    return ""
+                elements = [
+                    (element.name, element.get_text())
+                    for element in readme_div.find_all(list(README_ELEMENT_TAGS))
+                ]
+
+            readme_parts = []
+            for tag, text in elements:
+                if tag == 'pre':
+                    readme_parts.append(f"\n```\n{text}\n```\n")
+                elif tag in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
+                    readme_parts.append(f"\n{text}\n")
+                elif tag == 'code':
+                    readme_parts.append(f"`{text}`")
+                else:
+                    readme_parts.append(f"\n{text}\n")
 
-                return readme_content.strip()
+            return ''.join(readme_parts).strip()
         except Exception as e:
             logger.error(f"Error fetching npmjs README: {e}")
 
@@ -1858,7 +2381,7 @@ class NPMClient:
             response = self._make_request(url)
 
             if response:
-                data = response.json()
+                data = _response_json(response)
                 return {
                     'downloads': data.get('downloads', 0),
                     'trend': 'stable'
@@ -1868,6 +2391,38 @@ class NPMClient:
 
         return {'downloads': 0, 'trend': 'unknown'}
 
+    def _fetch_download_stats_bulk(self, package_names: Sequence[str]) -> Dict[str, int]:
+        """Fetch last-week downloads for many packages in as few requests as possible"""
+        downloads: Dict[str, int] = {}
+
+        # The bulk endpoint only accepts unscoped names
+        unscoped = [name for name in package_names if not name.startswith('@')]
+        scoped = [name for name in package_names if name.startswith('@')]
+
+        for i in range(0, len(unscoped), DOWNLOADS_BULK_LIMIT):
+            chunk = unscoped[i:i + DOWNLOADS_BULK_LIMIT]
+            try:
+                url = f"https://api.npmjs.org/downloads/point/last-week/{','.join(chunk)}"
+                response = self._make_request(url)
+                if not response:
+                    continue
+
+                data = _response_json(response)
+                if len(chunk) == 1:
+                    # A single name returns the point object itself
+                    data = {chunk[0]: data}
+
+                for name, point in data.items():
+                    if isinstance(point, dict):
+                        downloads[name] = point.get('downloads', 0)
+            except Exception as e:
+                logger.error(f"Error fetching bulk downloads: {e}")
+
+        for name in scoped:
+            downloads[name] = self._fetch_download_stats(name).get('downloads', 0)
+
+        return downloads
+
     def _extract_repo_url(self, repository: Union[str, Dict]) -> str:
         """Extract and normalize repository URL"""
         if isinstance(repository, dict):
@@ -1875,11 +2430,7 @@ class NPMClient:
         else:
             url = str(repository)
 
-        url = url.replace('git+', '').replace('git://', 'https://')
-        url = url.replace('git@github.com:', 'https://github.com/')
-        url = url.rstrip('.git')
-
-        return url
+        return _normalize_git_url(url)
 
     def _format_size(self, bytes_size: Union[int, float, None]) -> str:
         """Format size in human-readable format"""
@@ -1888,17 +2439,67 @@ class NPMClient:
 
         try:
             size = int(bytes_size)
-            return humanize.naturalsize(size, binary=True)
-        except:
+            return _format_file_size(size)
+        except (TypeError, ValueError):
             return str(bytes_size)
 
+    def _build_search_result(self, pkg_data: Dict, downloads: int) -> PackageInfo:
+        """Build minimal package info for a search hit without full enrichment"""
+        package_name = pkg_data.get('name', '')
+        version = pkg_data.get('version', 'latest')
+        description = pkg_data.get('description', '')
+
+        # Get dependents count
+        dependents_count = self._get_dependents_count(package_name)
+
+        # Get dependencies count and last publish date from one registry fetch
+        dependencies_count = 0
+        last_publish = 'Unknown'
+        try:
+            registry_data = self._fetch_registry_data(package_name)
+            if registry_data:
+                latest_version = registry_data.get('dist-tags', {}).get('latest', '')
+                if latest_version and latest_version in registry_data.get('versions', {}):
+                    version_info = registry_data['versions'][latest_version]
+                    dependencies = version_info.get('dependencies', {})
+                    dependencies_count = len(dependencies) if isinstance(dependencies, dict) else 0
+                if latest_version and latest_version in registry_data.get('time', {}):
+                    date_str = registry_data['time'][latest_version]
+                    last_publish = self._format_publish_date(
+                        dateutil.parser.parse(date_str).timestamp() * 1000
+                    )
+        except (TypeError, ValueError, AttributeError, OverflowError) as e:
+            logger.error(f"Error reading registry data for {package_name}: {e}")
+
+        # Get size info
+        size_unpacked = 'Unknown'
+        file_count = 'Unknown'
+        size, files = self._get_file_info_from_npm_view(package_name, version)
+        if size is not None:
+            size_unpacked = self._format_size(size)
+        if files is not None:
+            file_count = str(files)
+
+        return PackageInfo(
+            name=package_name,
+            version=version,
+            description=description,
+            downloads_last_week=downloads,
+            dependents_count=dependents_count,
+            dependencies_count=dependencies_count,
+            last_publish=last_publish,
+            size_unpacked=size_unpacked,
+            file_count=file_count
+        )
+
     def search_packages(self, query: str, date_filter: Optional[datetime.datetime] = None,
                        size_min: Optional[float] = None, size_max: Optional[float] = None,
                        max_results: int = DEFAULT_MAX_RESULTS,
                        progress_callback: Optional[Callable] = None,
                        result_callback: Optional[Callable] = None,
-                       fetch_details: bool = False) -> List[PackageInfo]:
-        """Search packages with enhanced filtering and concurrent requests"""
+                       fetch_details: bool = False,
+                       stop_check: Optional[Callable[[], bool]] = None) -> List[PackageInfo]:
+        """Search packages with enhanced filtering and concurrent requests, ending early once stop_check() is true"""
         if not query:
             return []
 
@@ -1911,240 +2512,225 @@ class NPMClient:
         from_value = 0
         total_retrieved = 0
 
-        def fetch_page():
-            nonlocal from_value, total_retrieved
+        while len(all_packages) < max_results:
+            if stop_check and stop_check():
+                break
 
-            while len(all_packages) < max_results:
-                params = {
-                    "text": query,
-                    "size": page_size,
-                    "from": from_value
-                }
+            params = {
+                "text": query,
+                "size": page_size,
+                "from": from_value
+            }
 
-                try:
-                    response = self._make_request(self.search_url, params=params)
-                    if not response:
-                        break
+            try:
+                response = self._make_request(self.search_url, params=params)
+                if not response:
+                    break
+
+                data = _response_json(response)
+                results = data.get('objects', [])
+
+                if not results:
+                    break
 
-                    data = response.json()
-                    results = data.get('objects', [])
+                page_packages = []
+                for result in results:
+                    pkg_data = result.get('package', {})
+                    package_name = pkg_data.get('name', '')
 
-                    if not results:
+                    if package_name and package_name not in all_packages:
+                        page_packages.append(pkg_data)
+
+                # Fetch download counts for the whole page in bulk
+                page_downloads: Dict[str, int] = {}
+                if not fetch_details:
+                    page_downloads = self._fetch_download_stats_bulk(
+                        [pkg_data['name'] for pkg_data in page_packages]
+                    )
+
+                # Process every hit of the page in parallel
+                if fetch_details:
+                    futures = [
+                        self._executor.submit(self.get_comprehensive_data, pkg_data['name'])
+                        for pkg_data in page_packages
+                    ]
+                else:
+                    futures = [
+                        self._executor.submit(
+                            self._build_search_result,
+                            pkg_data,
+                            page_downloads.get(pkg_data['name'], 0)
+                        )
+                        for pkg_data in page_packages
+                    ]
+
+                stopped = False
+                for future in concurrent.futures.as_completed(futures):
+                    if len(all_packages) >= max_results:
+                        break
+                    if stop_check and stop_check():
+                        stopped = True
                         break
 
-                    # Process results in parallel
-                    with concurrent.futures.ThreadPoolExecutor(max_workers=min(10, self.concurrency)) as executor:
-                        futures = []
+                    pkg = future.result()
+                    if not pkg:
+                        continue
 
-                        for result in results:
-                            pkg_data = result.get('package', {})
-                            package_name = pkg_data.get('name', '')
+                    if fetch_details:
+                        # Apply filters
+                        skip_package = False
 
-                            if not package_name or package_name in all_packages:
-                                continue
+                        if size_min:
+                            size_bytes = self._parse_size_to_bytes(pkg.size_unpacked)
+                            if size_bytes is not None and size_bytes < min_bytes:
+                                skip_package = True
 
-                            if fetch_details:
-                                futures.append(executor.submit(self.get_comprehensive_data, package_name))
-                            else:
-                                # Create minimal package info for search results
-                                version = pkg_data.get('version', 'latest')
-                                description = pkg_data.get('description', '')
-
-                                # Get basic stats
-                                downloads = 0
-                                try:
-                                    stats_url = f"https://api.npmjs.org/downloads/point/last-week/{package_name}"
-                                    stats_response = self._make_request(stats_url)
-                                    if stats_response:
-                                        downloads = stats_response.json().get('downloads', 0)
-                                except:
-                                    pass
-
-                                # Get dependents count
-                                dependents_count = 0
-                                try:
-                                    dependents_count = self._get_dependents_count(package_name)
-                                except:
-                                    pass
-
-                                # Get dependencies count
-                                dependencies_count = 0
-                                try:
-                                    registry_url = f"https://registry.npmjs.org/{package_name}"
-                                    registry_response = self._make_request(registry_url)
-                                    if registry_response:
-                                        registry_data = registry_response.json()
-                                        latest_version = registry_data.get('dist-tags', {}).get('latest', '')
-                                        if latest_version and latest_version in registry_data.get('versions', {}):
-                                            version_info = registry_data['versions'][latest_version]
-                                            dependencies = version_info.get('dependencies', {})
-                                            dependencies_count = len(dependencies) if isinstance(dependencies, dict) else 0
-                                except:
-                                    pass
-
-                                # Get last publish date
-                                last_publish = 'Unknown'
-                                try:
-                                    registry_url = f"https://registry.npmjs.org/{package_name}"
-                                    registry_response = self._make_request(registry_url)
-                                    if registry_response:
-                                        registry_data = registry_response.json()
-                                        latest_version = registry_data.get('dist-tags', {}).get('latest', '')
-                                        if latest_version and latest_version in registry_data.get('time', {}):
-                                            date_str = registry_data['time'][latest_version]
-                                            last_publish = self._format_publish_date(
-                                                dateutil.parser.parse(date_str).timestamp() * 1000
-                                            )
-                                except:
-                                    pass
-
-                                # Get size info
-                                size_unpacked = 'Unknown'
-                                file_count = 'Unknown'
-                                try:
-                                    size, files = self._get_file_info_from_npm_view(package_name, version)
-                                    if size is not None:
-                                        size_unpacked = self._format_size(size)
-                                    if files is not None:
-                                        file_count = str(files)
-                                except:
-                                    pass
-
-                                pkg = PackageInfo(
-                                    name=package_name,
-                                    version=version,
-                                    description=description,
-                                    downloads_last_week=downloads,
-                                    dependents_count=dependents_count,
-                                    dependencies_count=dependencies_count,
-                                    last_publish=last_publish,
-                                    size_unpacked=size_unpacked,
-                                    file_count=file_count
-                                )
-
-                                all_packages[package_name] = pkg
-                                total_retrieved += 1
-
-                                # Update progress
-                                if progress_callback:
-                                    progress_callback(
-                                        len(all_packages),
-                                        min(max_results, total_retrieved),
-                                        max_results
-                                    )
-
-                                # Update UI with the new package
-                                if result_callback:
-                                    result_callback([pkg])
-
-                        if fetch_details:
-                            for future in concurrent.futures.as_completed(futures):
-                                if len(all_packages) >= max_results:
-                                    break
-
-                                pkg = future.result()
-                                if not pkg:
-                                    continue
-
-                                # Apply filters
-                                skip_package = False
-
-                                if size_min:
-                                    size_bytes = self._parse_size_to_bytes(pkg.size_unpacked)
-                                    if size_bytes is not None and size_bytes < min_bytes:
+                        if not skip_package and date_filter:
+                            try:
+                                if pkg.modified_date != 'N/A' and pkg.modified_date != 'Unknown':
+                                    pkg_date = dateutil.parser.parse(pkg.modified_date)
+                                    if pkg_date < date_filter:
                                         skip_package = True
+                            except (TypeError, ValueError, OverflowError):
+                                skip_package = True
 
-                                if not skip_package and date_filter:
-                                    try:
-                                        if pkg.modified_date != 'N/A' and pkg.modified_date != 'Unknown':
-                                            pkg_date = dateutil.parser.parse(pkg.modified_date)
-                                            if pkg_date < date_filter:
-                                                skip_package = True
-                                    except:
-                                        skip_package = True
+                        if skip_package:
+                            continue
 
-                                if skip_package:
-                                    continue
+                    all_packages[pkg.name] = pkg
+                    total_retrieved += 1
 
-                                all_packages[package_name] = pkg
-                                total_retrieved += 1
+                    # Update progress
+                    if progress_callback:
+                        progress_callback(
+                            len(all_packages),
+                            min(max_results, total_retrieved),
+                            max_results
+                        )
 
-                                # Update progress
-                                if progress_callback:
-                                    progress_callback(
-                                        len(all_packages),
-                                        min(max_results, total_retrieved),
-                                        max_results
-                                    )
+                    # Update UI with the new package
+                    if result_callback:
+                        result_callback([pkg])
 
-                                # Update UI with the new package
-                                if result_callback:
-                                    result_callback([pkg])
+                # Don't wait on hits we no longer need
+                for future in futures:
+                    future.cancel()
 
-                    from_value += page_size
-                except Exception as e:
-                    logger.error(f"Error fetching page: {e}")
+                if stopped:
                     break
-
-        # Run fetch in a separate thread
-        fetch_thread = threading.Thread(target=fetch_page, daemon=True)
-        fetch_thread.start()
-        fetch_thread.join()
+                from_value += page_size
+            except Exception as e:
+                logger.error(f"Error fetching page: {e}")
+                break
 
         return list(all_packages.values())[:max_results]
 
-    def _parse_size_to_bytes(self, size_str: Optional[str]) -> Optional[int]:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _parse_size_to_bytes(size_str: Optional[str]) -> Optional[int]:
         """Convert size string like '20.5 KB' to bytes"""
         if not size_str or size_str == "Unknown":
             return None
 
         try:
             # Extract numeric value and unit
-            match = re.match(r'([\d.]+)\s*([KMGT]?B)?', size_str, re.IGNORECASE)
+            match = _SIZE_RE.match(size_str)
             if not match:
                 return None
 
-            value = float(match.group(1))
             unit = match.group(2) or 'B'
-
-            units = {
-                'B': 1,
-                'KB': 1024,
-                'MB': 1024 * 1024,
-                'GB': 1024 * 1024 * 1024,
-                'TB': 1024 * 1024 * 1024 * 1024
-            }
-
-            multiplier = units.get(unit.upper(), 1)
-            return int(value * multiplier)
-        except:
+            return int(float(match.group(1)) * _SIZE_UNITS.get(unit.upper().replace('I', ''), 1))
+        except (TypeError, ValueError):
             return None
 
     def download_package(self, package_name: str, version: str = 'latest', progress_callback: Optional[Callable] = None) -> Dict:
-        """Download a package using npm with proper error handling"""
-        if not self.npm_path:
+        """Download a package tarball from the registry, falling back to npm pack"""
+        if not os.path.exists(self.download_dir):
+            os.makedirs(self.download_dir, exist_ok=True)
+
+        try:
+            downloaded_file = self._direct_download(package_name, version)
+        except requests.RequestException as e:
+            logger.warning(f"Registry download failed for {package_name}, falling back to npm pack: {e}")
+            downloaded_file = None
+        except ValueError as e:
+            logger.error(f"Download error for {package_name}: {e}")
             return {
                 'success': False,
                 'package': package_name,
                 'file': None,
-                'error': 'npm not found. Please install Node.js and npm.'
+                'error': str(e)
             }
 
-        if not os.path.exists(self.download_dir):
-            os.makedirs(self.download_dir, exist_ok=True)
+        if downloaded_file:
+            logger.info(f"Successfully downloaded {package_name}")
+            return {
+                'success': True,
+                'package': package_name,
+                'file': downloaded_file,
+                'error': None
+            }
 
-        original_dir = os.getcwd()
-        os.chdir(self.download_dir)
+        return self._npm_pack(package_name, version)
 
-        try:
-            cmd = [self.npm_path, 'pack', f"{package_name}@{version}"]
-            logger.info(f"Running command: {' '.join(cmd)}")
+    def _direct_download(self, package_name: str, version: str = 'latest') -> Optional[str]:
+        """Stream the package tarball into the download directory and verify its shasum"""
+        response = self._make_request(f"{self.registry_url}/{package_name}/{version}")
+        if not response:
+            return None
 
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
+        version_data = _response_json(response)
+        dist = version_data.get('dist', {})
+        tarball_url = dist.get('tarball')
+        if not tarball_url:
+            return None
+
+        # Same file name npm pack produces, e.g. scope-name-1.0.0.tgz
+        filename = f"{package_name.lstrip('@').replace('/', '-')}-{version_data.get('version', version)}.tgz"
+        file_path = os.path.join(self.download_dir, filename)
+        partial_path = f"{file_path}.part"
+        sha1 = hashlib.sha1()
+
+        try:
+            with self.session.get(tarball_url, stream=True, timeout=REQUEST_TIMEOUT) as tarball:
+                tarball.raise_for_status()
+                self._request_count += 1
+                with open(partial_path, 'wb') as f:
+                    for chunk in tarball.iter_content(chunk_size=TARBALL_STREAM_BUFSIZE):
+                        sha1.update(chunk)
+                        f.write(chunk)
+
+            expected = dist.get('shasum')
+            if expected and sha1.hexdigest() != expected:
+                raise ValueError(f"Checksum mismatch for {filename}")
+
+            os.replace(partial_path, file_path)
+        finally:
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+
+        return filename
+
+    def _npm_pack(self, package_name: str, version: str = 'latest') -> Dict:
+        """Download a package using npm with proper error handling"""
+        if not self.npm_path:
+            return {
+                'success': False,
+                'package': package_name,
+                'file': None,
+                'error': 'npm not found. Please install Node.js and npm.'
+            }
+
+        try:
+            cmd = [self.npm_path, 'pack', f"{package_name}@{version}"]
+            logger.info(f"Running command: {' '.join(cmd)}")
+
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
                 text=True,
                 timeout=120,
+                cwd=self.download_dir,
                 creationflags=subprocess.CREATE_NO_WINDOW if IS_WINDOWS else 0
             )
 
@@ -2168,8 +2754,6 @@ class NPMClient:
             success = False
             error_message = str(e)
             logger.error(f"Download error for {package_name}: {e}")
-        finally:
-            os.chdir(original_dir)
 
         return {
             'success': success,
@@ -2178,8 +2762,9 @@ class NPMClient:
             'error': error_message
         }
 
-    def download_packages_concurrent(self, package_list: Sequence[Union[str, Dict]], progress_callback: Optional[Callable] = None) -> List[Dict]:
-        """Download multiple packages concurrently with proper rate limiting"""
+    def download_packages_concurrent(self, package_list: Sequence[Union[str, Dict]], progress_callback: Optional[Callable] = None,
+                                     stop_event: Optional[threading.Event] = None) -> List[Dict]:
+        """Download multiple packages concurrently; setting stop_event cancels downloads not yet started"""
         if not os.path.exists(self.download_dir):
             os.makedirs(self.download_dir, exist_ok=True)
 
@@ -2227,29 +2812,35 @@ class NPMClient:
                 for i, package in enumerate(package_list)
             ]
 
-            concurrent.futures.wait(futures)
+            # Consume completions as they land so a stop request takes effect at the next one
+            for _ in concurrent.futures.as_completed(futures):
+                if stop_event is not None and stop_event.is_set():
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    break
 
         return results
 
     def set_download_dir(self, directory: str):
         """Set the download directory"""
         self.download_dir = directory
-        if not os.path.exists(directory):
-            os.makedirs(directory, exist_ok=True)
+        os.makedirs(directory, exist_ok=True)
 
     def get_stats(self) -> Dict:
         """Get client statistics"""
         return {
             'requests': self._request_count,
             'cache_hits': self._cache_hits,
-            'cache_hit_rate': f"{(self._cache_hits / max(1, self._request_count + self._cache_hits) * 100):.1f}%"
+            'cache_hit_rate': self._cache_hits / max(1, self._request_count + self._cache_hits)
         }
 
+@lru_cache(maxsize=1)
 def find_npm_executable() -> Optional[str]:
     """Find npm executable on the current platform with enhanced search"""
-    npm_path = None
+    npm_path = shutil.which('npm')
+    if npm_path:
+        return npm_path
 
-    # First try the simple approach
+    # Then ask the platform lookup tool
     try:
         if IS_WINDOWS:
             result = subprocess.run(
@@ -2280,8 +2871,8 @@ def find_npm_executable() -> Optional[str]:
     if IS_WINDOWS:
         program_files = os.environ.get('ProgramFiles', 'C:\\Program Files')
         program_files_x86 = os.environ.get('ProgramFiles(x86)', 'C:\\Program Files (x86)')
-        localappdata = os.environ.get('LOCALAPPDATA', os.path.expanduser('~\\AppData\\Local'))
-        appdata = os.environ.get('APPDATA', os.path.expanduser('~\\AppData\\Roaming'))
+        localappdata = os.environ.get('LOCALAPPDATA', os.path.join(USER_HOME, 'AppData', 'Local'))
+        appdata = os.environ.get('APPDATA', os.path.join(USER_HOME, 'AppData', 'Roaming'))
 
         common_paths = [
             os.path.join(program_files, 'nodejs', 'npm.cmd'),
@@ -2299,27 +2890,25 @@ def find_npm_executable() -> Optional[str]:
         common_paths = [
             '/usr/local/bin/npm',
             '/opt/homebrew/bin/npm',
-            os.path.expanduser('~/.npm/bin/npm'),
-            os.path.expanduser('~/node_modules/.bin/npm'),
-            os.path.expanduser('~/.nvm/versions/node/*/bin/npm'),
+            os.path.join(USER_HOME, '.npm', 'bin', 'npm'),
+            os.path.join(USER_HOME, 'node_modules', '.bin', 'npm'),
+            os.path.join(USER_HOME, '.nvm', 'versions', 'node', '*', 'bin', 'npm'),
             '/usr/local/opt/node/bin/npm',
         ]
     elif IS_LINUX:
         common_paths = [
             '/usr/bin/npm',
             '/usr/local/bin/npm',
-            os.path.expanduser('~/.npm/bin/npm'),
-            os.path.expanduser('~/node_modules/.bin/npm'),
-            os.path.expanduser('~/.nvm/versions/node/*/bin/npm'),
+            os.path.join(USER_HOME, '.npm', 'bin', 'npm'),
+            os.path.join(USER_HOME, 'node_modules', '.bin', 'npm'),
+            os.path.join(USER_HOME, '.nvm', 'versions', 'node', '*', 'bin', 'npm'),
             '/snap/bin/npm',
         ]
 
     # Expand glob patterns for nvm
     if IS_MAC or IS_LINUX:
-        import glob
-        nvm_path = os.path.expanduser('~/.nvm/versions/node/*/bin/npm')
-        if glob.glob(nvm_path):
-            common_paths.extend(glob.glob(nvm_path))
+        nvm_path = os.path.join(USER_HOME, '.nvm', 'versions', 'node', '*', 'bin', 'npm')
+        common_paths.extend(glob.glob(nvm_path))
 
     # Check all common paths
     for path in common_paths:
@@ -2328,13 +2917,52 @@ def find_npm_executable() -> Optional[str]:
 
     return None
 
+def build_tree_view(file_tree: Dict) -> Dict:
+    """Build the nested directory view from a flat path -> size mapping"""
+    # Trees cached before the flat layout are already nested
+    if any(isinstance(value, dict) for value in file_tree.values()):
+        return file_tree
+
+    root: Dict = {}
+    for path, size in file_tree.items():
+        *dirs, name = path.split('/')
+        current = root
+        for part in dirs:
+            node = current.get(part)
+            if node is None:
+                node = current[part] = {'type': 'directory', 'children': {}}
+            current = node['children']
+        current[name] = {'type': 'file', 'size': size}
+    return root
+
+# Tcl lambda that inserts one level of file tree rows in a single interpreter call.
+# items is a flat list of iid, text, size, is_dir; directories get a placeholder child
+TREE_INSERT_LAMBDA = """{w parent items} {
+    foreach {iid text size is_dir} $items {
+        $w insert $parent end -id $iid -text $text -values [list $size]
+        if {$is_dir} {
+            $w insert $iid end -text Loading...
+        }
+    }
+}"""
+
 class FileTreeViewer:
     """File tree viewer for exploring package contents"""
-    def __init__(self, parent, on_file_select: Callable):
+    def __init__(self, parent, on_file_select: Callable, npm_client: 'NPMClient', settings: SettingsManager):
         self.parent = parent
         self.on_file_select = on_file_select
+        self.npm_client = npm_client
+        self.settings = settings
         self.current_package = None
         self.current_file_tree = {}
+        # Full archive path of every file node, keyed by tree item id
+        self._path_index: Dict[str, str] = {}
+        # Directory nodes not yet expanded: item id -> (children, path prefix)
+        self._pending_dirs: Dict[str, Tuple[Dict, str]] = {}
+        self._next_iid = 0
+        # Downloaded archive per package, and open archives as [archive, member index, index complete]
+        self._package_files: Dict[str, str] = {}
+        self._open_archives: 'OrderedDict[str, List[Any]]' = OrderedDict()
         self._create_ui()
 
     def _create_ui(self):
@@ -2347,7 +2975,7 @@ class FileTreeViewer:
         header = ttk.Frame(self.container)
         header.pack(fill=tk.X, pady=(0, 10))
 
-        ttk.Label(header, text="File Tree", font=('Segoe UI', 12, 'bold')).pack(side=tk.LEFT)
+        ttk.Label(header, text="File Tree", font=_shared_font("Segoe UI", 12, "bold")).pack(side=tk.LEFT)
 
         # Refresh button
         self.refresh_btn = ttk.Button(
@@ -2396,7 +3024,7 @@ class FileTreeViewer:
             relief='flat',
             padx=10,
             pady=10,
-            font=("Consolas", 9)
+            font=_shared_font("Consolas", 9)
         )
 
         content_scrollbar_y = ttk.Scrollbar(content_frame, orient=tk.VERTICAL, command=self.content_text.yview)
@@ -2414,6 +3042,7 @@ class FileTreeViewer:
         # Bind events
         self.tree.bind("<Double-1>", self._on_tree_double_click)
         self.tree.bind("<<TreeviewSelect>>", self._on_tree_select)
+        self.tree.bind("<<TreeviewOpen>>", self._on_tree_open)
 
         # Configure syntax highlighting tags
         self._setup_syntax_tags()
@@ -2424,94 +3053,123 @@ class FileTreeViewer:
         self.syntax_configs = {
             '.js': {
                 'keywords': ['abstract', 'arguments', 'await', 'boolean', 'break', 'byte', 'case', 'catch', 'char', 'class', 'const', 'continue', 'debugger', 'default', 'delete', 'do', 'double', 'else', 'enum', 'eval', 'export', 'extends', 'false', 'final', 'finally', 'float', 'for', 'function', 'goto', 'if', 'implements', 'import', 'in', 'instanceof', 'int', 'interface', 'let', 'long', 'native', 'new', 'null', 'package', 'private', 'protected', 'public', 'return', 'short', 'static', 'super', 'switch', 'synchronized', 'this', 'throw', 'throws', 'transient', 'true', 'try', 'typeof', 'var', 'void', 'volatile', 'while', 'with', 'yield'],
-                'strings': Theme.CODE_STRING,
-                'comments': Theme.CODE_COMMENT,
-                'keywords': Theme.CODE_KEYWORD,
-                'numbers': Theme.CODE_NUMBER,
-                'functions': Theme.CODE_FUNCTION
+                'string_color': Theme.CODE_STRING,
+                'comment_color': Theme.CODE_COMMENT,
+                'keyword_color': Theme.CODE_KEYWORD,
+                'number_color': Theme.CODE_NUMBER,
+                'function_color': Theme.CODE_FUNCTION
             },
             '.ts': {
                 'keywords': ['abstract', 'as', 'asserts', 'async', 'await', 'boolean', 'break', 'case', 'catch', 'class', 'const', 'constructor', 'continue', 'debugger', 'declare', 'default', 'delete', 'do', 'else', 'enum', 'export', 'extends', 'false', 'finally', 'for', 'from', 'function', 'get', 'if', 'implements', 'import', 'in', 'infer', 'instanceof', 'interface', 'is', 'keyof', 'let', 'module', 'namespace', 'never', 'new', 'null', 'number', 'object', 'of', 'package', 'private', 'protected', 'public', 'readonly', 'require', 'return', 'set', 'static', 'string', 'super', 'switch', 'symbol', 'this', 'throw', 'true', 'try', 'type', 'typeof', 'undefined', 'unique', 'unknown', 'var', 'void', 'while', 'with', 'yield'],
-                'strings': Theme.CODE_STRING,
-                'comments': Theme.CODE_COMMENT,
-                'keywords': Theme.CODE_KEYWORD,
-                'numbers': Theme.CODE_NUMBER,
-                'functions': Theme.CODE_FUNCTION
+                'string_color': Theme.CODE_STRING,
+                'comment_color': Theme.CODE_COMMENT,
+                'keyword_color': Theme.CODE_KEYWORD,
+                'number_color': Theme.CODE_NUMBER,
+                'function_color': Theme.CODE_FUNCTION
             },
             '.json': {
                 'keywords': ['true', 'false', 'null'],
-                'strings': Theme.CODE_STRING,
-                'comments': Theme.CODE_COMMENT,
-                'keywords': Theme.CODE_KEYWORD,
-                'numbers': Theme.CODE_NUMBER,
-                'functions': Theme.CODE_FUNCTION
+                'string_color': Theme.CODE_STRING,
+                'comment_color': Theme.CODE_COMMENT,
+                'keyword_color': Theme.CODE_KEYWORD,
+                'number_color': Theme.CODE_NUMBER,
+                'function_color': Theme.CODE_FUNCTION
             },
             '.md': {
                 'keywords': [],
-                'strings': Theme.CODE_STRING,
-                'comments': Theme.CODE_COMMENT,
-                'keywords': Theme.CODE_KEYWORD,
-                'numbers': Theme.CODE_NUMBER,
-                'functions': Theme.CODE_FUNCTION
+                'string_color': Theme.CODE_STRING,
+                'comment_color': Theme.CODE_COMMENT,
+                'keyword_color': Theme.CODE_KEYWORD,
+                'number_color': Theme.CODE_NUMBER,
+                'function_color': Theme.CODE_FUNCTION
             },
             '.py': {
                 'keywords': ['and', 'as', 'assert', 'break', 'class', 'continue', 'def', 'del', 'elif', 'else', 'except', 'exec', 'finally', 'for', 'from', 'global', 'if', 'import', 'in', 'is', 'lambda', 'not', 'or', 'pass', 'print', 'raise', 'return', 'try', 'while', 'with', 'yield'],
-                'strings': Theme.CODE_STRING,
-                'comments': Theme.CODE_COMMENT,
-                'keywords': Theme.CODE_KEYWORD,
-                'numbers': Theme.CODE_NUMBER,
-                'functions': Theme.CODE_FUNCTION
+                'string_color': Theme.CODE_STRING,
+                'comment_color': Theme.CODE_COMMENT,
+                'keyword_color': Theme.CODE_KEYWORD,
+                'number_color': Theme.CODE_NUMBER,
+                'function_color': Theme.CODE_FUNCTION
             }
         }
 
+        # Keyword membership is checked once per word token
+        for config in self.syntax_configs.values():
+            config['keywords'] = frozenset(config['keywords'])
+
         # Configure tags
         for ext, config in self.syntax_configs.items():
-            self.content_text.tag_config(f"{ext}_keyword", foreground=config['keywords'])
-            self.content_text.tag_config(f"{ext}_string", foreground=config['strings'])
-            self.content_text.tag_config(f"{ext}_comment", foreground=config['comments'])
-            self.content_text.tag_config(f"{ext}_number", foreground=config['numbers'])
-            self.content_text.tag_config(f"{ext}_function", foreground=config['functions'])
+            self.content_text.tag_config(f"{ext}_keyword", foreground=config['keyword_color'])
+            self.content_text.tag_config(f"{ext}_string", foreground=config['string_color'])
+            self.content_text.tag_config(f"{ext}_comment", foreground=config['comment_color'])
+            self.content_text.tag_config(f"{ext}_number", foreground=config['number_color'])
+            self.content_text.tag_config(f"{ext}_function", foreground=config['function_color'])
+
+        # One tokenizer per extension; each match becomes one (text, tag) span
+        self._syntax_patterns = {}
+        for ext in self.syntax_configs:
+            parts = []
+            if ext in ('.js', '.ts'):
+                parts.append(r'(?P<comment>^(?://|#)[^\n]*)')
+            elif ext == '.py':
+                parts.append(r'(?P<comment>^#[^\n]*)')
+            parts.append(r'(?P<string>"(?:\\.|[^"\\\n])*"?|\'(?:\\.|[^\'\\\n])*\'?|`(?:\\.|[^`\\\n])*`?)')
+            parts.append(r'(?P<number>\b\d+\b)')
+            parts.append(r'(?P<word>\w+)')
+            parts.append(r'\s+|.')
+            self._syntax_patterns[ext] = re.compile('|'.join(parts), re.MULTILINE)
 
     def load_package(self, package_name: str, file_tree: Dict):
         """Load file tree for a package"""
         self.current_package = package_name
-        self.current_file_tree = file_tree
+        self.current_file_tree = build_tree_view(file_tree)
 
         # Clear existing tree
         for item in self.tree.get_children():
             self.tree.delete(item)
 
         # Populate tree
-        self._populate_tree(file_tree, "")
+        self._path_index = {}
+        self._pending_dirs = {}
+        self._populate_tree(self.current_file_tree, "")
 
-        # Expand first level
+        # Expand first level; opening programmatically does not fire <<TreeviewOpen>>
         for item in self.tree.get_children():
+            self._expand_pending(item)
             self.tree.item(item, open=True)
 
-    def _populate_tree(self, tree_data: Dict, parent: str):
-        """Recursively populate the tree view"""
+    def _populate_tree(self, tree_data: Dict, parent: str, path_prefix: str = ""):
+        """Populate one level of the tree view; directories are filled in when opened"""
+        items = []
         for name, data in tree_data.items():
-            if data['type'] == 'directory':
-                # Add directory node
-                node = self.tree.insert(
-                    parent,
-                    "end",
-                    text=name,
-                    values=("",),
-                    open=False
-                )
+            node = f"node{self._next_iid}"
+            self._next_iid += 1
 
-                # Add children
-                self._populate_tree(data['children'], node)
+            if data['type'] == 'directory':
+                # Placeholder child keeps the expand arrow until the directory is opened
+                items.extend((node, name, "", 1))
+                self._pending_dirs[node] = (data['children'], f"{path_prefix}{name}/")
             else:
-                # Add file node
-                self.tree.insert(
-                    parent,
-                    "end",
-                    text=name,
-                    values=(data['size_str'],),
-                    tags=(name,)
-                )
+                items.extend((node, name, _format_file_size(data['size']), 0))
+                self._path_index[node] = f"{path_prefix}{name}"
+
+        # Item ids are assigned here so the whole level goes to Tk in one call
+        if items:
+            self.tree.tk.call('apply', TREE_INSERT_LAMBDA, str(self.tree), parent, tuple(items))
+
+    def _on_tree_open(self, event):
+        """Fill in a directory the first time it is expanded"""
+        self._expand_pending(self.tree.focus())
+
+    def _expand_pending(self, item: str):
+        """Replace a directory's placeholder with its real children"""
+        pending = self._pending_dirs.pop(item, None)
+        if pending is None:
+            return
+
+        self.tree.delete(*self.tree.get_children(item))
+        children, path_prefix = pending
+        self._populate_tree(children, item, path_prefix)
 
     def _on_tree_select(self, event):
         """Handle tree selection"""
@@ -2520,17 +3178,16 @@ class FileTreeViewer:
             return
 
         item = selection[0]
-        item_text = self.tree.item(item, "text")
 
-        # Check if it's a file
-        if not self.tree.get_children(item):  # No children means it's a file
-            self._load_file_content(item_text)
+        # Only file nodes are indexed
+        if item in self._path_index:
+            self._load_file_content(item)
 
     def _on_tree_double_click(self, event):
         """Handle double-click on tree item"""
         self._on_tree_select(event)
 
-    def _load_file_content(self, filename: str):
+    def _load_file_content(self, item: str):
         """Load content of a selected file"""
         if not self.current_package:
             return
@@ -2539,50 +3196,20 @@ class FileTreeViewer:
         self.content_text.delete(1.0, tk.END)
 
         # Get file path
-        file_path = self._get_file_path(filename)
+        filename = self.tree.item(item, "text")
+        file_path = self._get_file_path(item)
         if not file_path:
             self.content_text.insert(tk.END, f"Could not locate file: {filename}")
             return
 
         try:
-            # Try to extract and read the file
-            temp_dir = tempfile.mkdtemp()
-
-            # Download the package
-            client = NPMClient(CacheManager(CACHE_DB), SettingsManager())
-            download_result = client.download_package(self.current_package)
-
-            if not download_result['success']:
-                self.content_text.insert(tk.END, f"Error downloading package: {download_result['error']}")
-                return
-
-            package_file = download_result['file']
-            package_path = os.path.join(client.download_dir, package_file)
-
-            if not os.path.exists(package_path):
-                self.content_text.insert(tk.END, f"Package file not found: {package_path}")
+            package_path = self._get_package_file(self.current_package)
+            if not package_path:
                 return
 
             # Extract the file
-            content = None
-
-            if package_file.endswith('.tgz'):
-                # Handle tar.gz files
-                with tarfile.open(package_path, 'r:gz') as tar:
-                    for member in tar.getmembers():
-                        if member.isfile() and member.name == file_path:
-                            content = tar.extractfile(member).read().decode('utf-8', errors='replace')
-                            break
-            elif package_file.endswith('.zip'):
-                # Handle zip files
-                with zipfile.ZipFile(package_path, 'r') as zip_ref:
-                    for file_info in zip_ref.infolist():
-                        if not file_info.is_dir() and file_info.filename == file_path:
-                            content = zip_ref.read(file_info.filename).decode('utf-8', errors='replace')
-                            break
-
-            # Clean up
-            shutil.rmtree(temp_dir, ignore_errors=True)
+            data = self._read_archive_member(package_path, file_path)
+            content = data.decode('utf-8', errors='replace') if data else None
 
             if content:
                 # Apply syntax highlighting
@@ -2592,112 +3219,114 @@ class FileTreeViewer:
         except Exception as e:
             self.content_text.insert(tk.END, f"Error loading file: {str(e)}")
 
-    def _get_file_path(self, filename: str) -> Optional[str]:
-        """Get the full path of a file in the package"""
-        def find_path(tree_data: Dict, path: str = "") -> Optional[str]:
-            for name, data in tree_data.items():
-                if data['type'] == 'directory':
-                    result = find_path(data['children'], f"{path}{name}/")
-                    if result:
-                        return result
-                elif name == filename:
-                    return f"{path}{name}"
-            return None
-
-        return find_path(self.current_file_tree)
+    def _get_package_file(self, package_name: str) -> Optional[str]:
+        """Return the local archive for a package, downloading it on first use"""
+        package_path = self._package_files.get(package_name)
+        if package_path and os.path.exists(package_path):
+            return package_path
 
-    def _apply_syntax_highlighting(self, content: str, filename: str):
-        """Apply syntax highlighting to content"""
-        # Get file extension
-        _, ext = os.path.splitext(filename.lower())
-
-        # Get syntax config
-        config = self.syntax_configs.get(ext, self.syntax_configs.get('.md'))
+        client = self.npm_client
+        download_result = client.download_package(package_name)
 
-        if not config:
-            # No syntax highlighting, just insert plain text
-            self.content_text.insert(tk.END, content)
-            return
-
-        # Apply syntax highlighting
-        lines = content.split('\n')
+        if not download_result['success']:
+            self.content_text.insert(tk.END, f"Error downloading package: {download_result['error']}")
+            return None
 
-        for i, line in enumerate(lines):
-            # Track position in line
-            pos = 0
+        package_path = os.path.join(client.download_dir, download_result['file'])
 
-            # Skip if line is empty
-            if not line:
-                self.content_text.insert(tk.END, '\n')
-                continue
+        if not os.path.exists(package_path):
+            self.content_text.insert(tk.END, f"Package file not found: {package_path}")
+            return None
 
-            # Process line character by character
-            in_string = False
-            in_comment = False
-            string_char = None
-
-            while pos < len(line):
-                # Check for comments (only at beginning of line for most languages)
-                if pos == 0 and not in_string and not in_comment:
-                    if ext in ['.py', '.js', '.ts'] and line.startswith('#'):
-                        # Python comment
-                        self.content_text.insert(tk.END, line[pos:], f"{ext}_comment")
-                        pos = len(line)
-                        continue
-                    elif ext in ['.js', '.ts'] and line.startswith('//'):
-                        # JavaScript/TypeScript comment
-                        self.content_text.insert(tk.END, line[pos:], f"{ext}_comment")
-                        pos = len(line)
-                        continue
+        self._package_files[package_name] = package_path
+        return package_path
+
+    def _read_archive_member(self, package_path: str, member_name: str) -> Optional[bytes]:
+        """Read one file from a package archive, indexing members as the archive is walked"""
+        entry = self._open_archives.get(package_path)
+        if entry is None:
+            if package_path.endswith('.zip'):
+                # The zip central directory is read up front anyway
+                archive = zipfile.ZipFile(package_path, 'r')
+                entry = [archive, {info.filename: info for info in archive.infolist() if not info.is_dir()}, True]
+            else:
+                entry = [tarfile.open(package_path, 'r:gz'), {}, False]
 
-                # Check for string start
-                if not in_string and not in_comment and line[pos] in ['"', "'", '`']:
-                    in_string = True
-                    string_char = line[pos]
-                    self.content_text.insert(tk.END, line[pos], f"{ext}_string")
-                    pos += 1
-                    continue
+            self._open_archives[package_path] = entry
+            if len(self._open_archives) > OPEN_ARCHIVE_CACHE_SIZE:
+                _, (evicted, _, _) = self._open_archives.popitem(last=False)
+                evicted.close()
+        else:
+            self._open_archives.move_to_end(package_path)
+
+        archive, index, _ = entry
+        member = index.get(member_name)
+
+        # Walk tar headers only as far as the requested member, resuming there next time
+        while member is None and not entry[2]:
+            next_member = archive.next()
+            if next_member is None:
+                entry[2] = True
+            elif next_member.isfile():
+                index[next_member.name] = next_member
+                if next_member.name == member_name:
+                    member = next_member
+
+        if member is None:
+            return None
 
-                # Check for string end
-                if in_string and line[pos] == string_char and (pos == 0 or line[pos-1] != '\\'):
-                    in_string = False
-                    self.content_text.insert(tk.END, line[pos], f"{ext}_string")
-                    pos += 1
-                    continue
+        if isinstance(archive, zipfile.ZipFile):
+            return archive.read(member)
+        return archive.extractfile(member).read()
 
-                # Process content based on context
-                if in_string:
-                    # Inside string
-                    self.content_text.insert(tk.END, line[pos], f"{ext}_string")
-                elif in_comment:
-                    # Inside comment
-                    self.content_text.insert(tk.END, line[pos], f"{ext}_comment")
-                else:
-                    # Check for keywords
-                    # Extract word at current position
-                    word_match = re.match(r'\b(\w+)\b', line[pos:])
-                    if word_match:
-                        word = word_match.group(1)
-                        if word in config['keywords']:
-                            self.content_text.insert(tk.END, word, f"{ext}_keyword")
-                            pos += len(word)
-                            continue
+    def _get_file_path(self, item: str) -> Optional[str]:
+        """Get the full path of a file node in the package"""
+        return self._path_index.get(item)
 
-                    # Check for numbers
-                    num_match = re.match(r'\b(\d+)\b', line[pos:])
-                    if num_match:
-                        num = num_match.group(1)
-                        self.content_text.insert(tk.END, num, f"{ext}_number")
-                        pos += len(num)
-                        continue
+    def _apply_syntax_highlighting(self, content: str, filename: str):
+        """Apply syntax highlighting to content"""
+        # Get file extension
+        _, ext = os.path.splitext(filename.lower())
 
-                    # Default text
-                    self.content_text.insert(tk.END, line[pos])
+        # Large or minified files are not worth tokenizing
+        max_bytes = self.settings.get_int('General', 'highlight_max_bytes', HIGHLIGHT_MAX_BYTES)
+        # Only the first 64 lines are checked; the 65th piece of the split is the remainder
+        max_line = max((len(line) for line in content.split('\n', 64)[:64]), default=0)
+        if len(content) > max_bytes or max_line > HIGHLIGHT_MAX_LINE_LENGTH:
+            self.content_text.insert(tk.END, content)
+            return
 
-                pos += 1
+        # Unknown extensions use the markdown config
+        if ext not in self._syntax_patterns:
+            ext = '.md'
+        pattern = self._syntax_patterns[ext]
+        keywords = self.syntax_configs[ext]['keywords']
+
+        # Insert the text once, then tag every range of a kind with a single tag_add call.
+        # Indices are tracked as line.column so Tk never has to count characters from 1.0
+        line, column = map(int, self.content_text.index('end-1c').split('.'))
+        line_start = -column
+        self.content_text.insert(tk.END, content)
+
+        ranges: Dict[str, List[str]] = {}
+        for match in pattern.finditer(content):
+            kind = match.lastgroup
+            text = match.group()
+            if kind == 'word':
+                kind = 'keyword' if text in keywords else None
+            if kind is not None:
+                start, end = match.span()
+                ranges.setdefault(f"{ext}_{kind}", []).extend(
+                    (f"{line}.{start - line_start}", f"{line}.{end - line_start}")
+                )
+            elif '\n' in text:
+                # Only whitespace runs span lines; tagged tokens never contain a newline
+                line += text.count('\n')
+                line_start = match.start() + text.rindex('\n') + 1
 
-            # Add newline
-            self.content_text.insert(tk.END, '\n')
+        for tag, indices in ranges.items():
+            self.content_text.tag_add(tag, *indices)
+        self.content_text.insert(tk.END, '\n')
 
     def refresh_tree(self):
         """Refresh the file tree"""
@@ -2729,13 +3358,62 @@ class NPMAnalyzerApp:
         self.selected_date: Optional[datetime.date] = None
         self.all_results: List[PackageInfo] = []
         self.result_counter = 0
-        self.package_items: Dict[str, str] = {}
         self.search_stop_flag = threading.Event()
         self.is_searching = False
+        self.download_stop_flag = threading.Event()
+        self.is_downloading = False
         self.markdown_renderer: Optional[MarkdownRenderer] = None
+        self._pending_readme: Optional[Tuple[PackageInfo, bool]] = None  # README shown but not rendered yet
+        self._readme_cache: "OrderedDict[Tuple[str, str, int], List[Tuple[str, tuple]]]" = OrderedDict()
+        self._readme_token = 0  # Bumped whenever the README widget gets new content
+        self._readme_stream: Optional[Tuple[int, List[Tuple[str, tuple]], int]] = None  # Paused README insert
+        self._shown_pkg: Optional[PackageInfo] = None
+        self._history_cache_version = -1
+        self._last_max_results_str = str(DEFAULT_MAX_RESULTS)
+        self._last_max_results_int = DEFAULT_MAX_RESULTS
+        self._history_cache_list: Tuple[str, ...] = ()
+
+        # Details panel loads; only the most recently requested package is displayed
+        self._detail_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=DETAIL_EXECUTOR_WORKERS, thread_name_prefix="npm-details"
+        )
+        self._detail_token = 0
+        self._detail_future: Optional[concurrent.futures.Future] = None
+        # The JSON tab pages through a temp file holding the encoded package
+        self._json_path: Optional[str] = None
+        self._json_file = None
+        self._json_map: Optional[mmap.mmap] = None
+        self._json_offset = 0
+        self._json_append_scheduled = False
+        self._json_token = 0  # Bumped whenever the JSON tab is given a new package
+        self._stale_tabs: Set[str] = set()  # Built tabs still showing an earlier package
+        self._details_loaded: Set[int] = set()  # Result indices whose all_results entry has README and files
+
+        # Date picker window, built on first use and then only hidden/shown
+        self._calendar_win: Optional[tk.Toplevel] = None
+        self._calendar_month = datetime.date.today().replace(day=1)
         self.search_task: Optional[threading.Thread] = None
         self.font = tkfont.Font(family="Segoe UI", size=self.settings.get_int('General', 'font_size', 10))
 
+        # Virtual results list: only the rows in view exist as Treeview items
+        self._selected: Set[int] = set()
+        self._row_items: List[str] = []
+        self._view_first = 0
+        self._visible_rows = 20
+        self._cursor_idx: Optional[int] = None
+
+        # Per-result columns pulled out of all_results once, so bulk passes don't touch each PackageInfo
+        self._col_name: List[str] = []
+        self._col_size = array('d')  # Unpacked size in bytes, NaN when unknown
+        self._col_tags: List[Tuple[str, str]] = []  # (size tag, time tag) for each row
+
+        # Results streamed from the search thread, drained on the UI thread in batches
+        self._pending_pkgs: deque = deque()
+        self._pending_lock = threading.Lock()
+        self._flush_scheduled = False
+        self._download_progress: Optional[Tuple[int, int, str]] = None  # (current, total, package) of the running download
+        self._download_progress_scheduled = False
+
         # Setup UI
         self._setup_theme()
         self._create_ui()
@@ -2753,7 +3431,7 @@ class NPMAnalyzerApp:
         style.configure("TFrame", background=Theme.BG)
         style.configure("TLabel", background=Theme.BG, foreground=Theme.TEXT)
         style.configure("Treeview", background=Theme.BG_SECONDARY, foreground=Theme.TEXT,
-                        fieldbackground=Theme.BG_SECONDARY, borderwidth=0, rowheight=24)
+                        fieldbackground=Theme.BG_SECONDARY, borderwidth=0, rowheight=RESULT_ROW_HEIGHT)
         style.configure("Treeview.Heading", background=Theme.BG_TERTIARY, foreground=Theme.TEXT,
                         borderwidth=0, relief="flat", font=self.font)
         style.map("Treeview", background=[('selected', Theme.ACCENT)], foreground=[('selected', Theme.BG)])
@@ -2990,7 +3668,7 @@ class NPMAnalyzerApp:
         results_header = ttk.Frame(left_panel)
         results_header.pack(fill=tk.X, pady=(0, 10))
 
-        ttk.Label(results_header, text="Search Results", font=('Segoe UI', 12, 'bold')).pack(side=tk.LEFT)
+        ttk.Label(results_header, text="Search Results", font=_shared_font("Segoe UI", 12, "bold")).pack(side=tk.LEFT)
         self.results_count = ttk.Label(results_header, text="0 packages", foreground=Theme.TEXT_SECONDARY)
         self.results_count.pack(side=tk.LEFT, padx=10)
 
@@ -3068,24 +3746,34 @@ class NPMAnalyzerApp:
         self.results_tree.column("downloads", width=100, anchor='e')
         self.results_tree.column("last_publish", width=120, anchor='center')
 
-        # Configure scrollbars
-        scrollbar_y = ttk.Scrollbar(tree_container, orient=tk.VERTICAL, command=self.results_tree.yview)
+        # Configure scrollbars; the vertical one scrolls through result indices, not tree items
+        self.results_scrollbar = ttk.Scrollbar(tree_container, orient=tk.VERTICAL, command=self._on_results_yview)
         scrollbar_x = ttk.Scrollbar(tree_container, orient=tk.HORIZONTAL, command=self.results_tree.xview)
 
-        self.results_tree.configure(yscrollcommand=scrollbar_y.set, xscrollcommand=scrollbar_x.set)
+        self.results_tree.configure(xscrollcommand=scrollbar_x.set)
 
         # Pack widgets
         self.results_tree.grid(row=0, column=0, sticky="nsew")
-        scrollbar_y.grid(row=0, column=1, sticky="ns")
+        self.results_scrollbar.grid(row=0, column=1, sticky="ns")
         scrollbar_x.grid(row=1, column=0, sticky="ew")
 
         tree_container.grid_rowconfigure(0, weight=1)
         tree_container.grid_columnconfigure(0, weight=1)
 
+        self._init_color_tags()
+
         # Bind events
         self.results_tree.bind("<ButtonRelease-1>", self._on_result_click)
         self.results_tree.bind("<space>", self._toggle_selection)
         self.results_tree.bind("<Double-1>", self._on_double_click)
+        self.results_tree.bind("<Configure>", self._on_results_configure)
+        self.results_tree.bind("<MouseWheel>", lambda e: self._scroll_results(-3 if e.delta > 0 else 3))
+        self.results_tree.bind("<Button-4>", lambda e: self._scroll_results(-3))
+        self.results_tree.bind("<Button-5>", lambda e: self._scroll_results(3))
+        self.results_tree.bind("<Up>", lambda e: self._move_cursor(-1))
+        self.results_tree.bind("<Down>", lambda e: self._move_cursor(1))
+        self.results_tree.bind("<Prior>", lambda e: self._move_cursor(-self._visible_rows))
+        self.results_tree.bind("<Next>", lambda e: self._move_cursor(self._visible_rows))
 
         # Right panel - Details
         right_panel = ttk.Frame(paned, padding=5)
@@ -3098,14 +3786,22 @@ class NPMAnalyzerApp:
         # Overview tab (with README)
         self._create_overview_tab()
 
-        # File Tree tab
-        self._create_file_tree_tab()
-
-        # Dependencies tab
-        self._create_dependencies_tab()
-
-        # JSON tab
-        self._create_json_tab()
+        # The other tabs start as empty frames and are built the first time they are shown
+        self._tab_builders = {
+            "Files": self._create_file_tree_tab,
+            "Dependencies": self._create_dependencies_tab,
+            "JSON": self._create_json_tab,
+        }
+        self._tab_populators = {
+            "Files": self._show_file_tree,
+            "Dependencies": self._show_dependencies,
+            "JSON": self._show_json,
+        }
+        self._tab_frames: Dict[str, ttk.Frame] = {}
+        for name in self._tab_builders:
+            self._tab_frames[name] = ttk.Frame(self.notebook)
+            self.notebook.add(self._tab_frames[name], text=name)
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
         # Action buttons
         action_frame = ttk.Frame(right_panel)
@@ -3163,59 +3859,152 @@ class NPMAnalyzerApp:
         # Load search history
         self._update_search_history()
 
+    def _init_color_tags(self):
+        """Configure the fixed palette of size and time tags used by result rows"""
+        for unit, (start, end, _) in SIZE_GRADIENTS.items():
+            for step in range(SIZE_COLOR_STEPS):
+                color = PackageInfo._interpolate_color(start, end, step / (SIZE_COLOR_STEPS - 1))
+                self.results_tree.tag_configure(f"size_{unit}{step}", foreground=color)
+        self.results_tree.tag_configure("size_muted", foreground=Theme.TEXT_MUTED)
+
+        for bucket, color in TIME_BUCKET_COLORS.items():
+            self.results_tree.tag_configure(f"time_{bucket}", foreground=color)
+
     def _create_overview_tab(self):
         """Create the overview tab with package details and README"""
-        overview_tab = ttk.Frame(self.notebook)
-        self.notebook.add(overview_tab, text="Overview")
+        # The overview widgets are built once and refilled for every package;
+        # sections a package has nothing for are hidden, not destroyed
+        self.overview_content = ttk.Frame(self.notebook)
+        self.notebook.add(self.overview_content, text="Overview")
+
+        self._overview_placeholder = ttk.Label(
+            self.overview_content,
+            text="Select a package to view details",
+            foreground=Theme.TEXT_MUTED,
+            font=_shared_font("Segoe UI", 10, slant="italic")
+        )
+        self.overview_frame = ttk.Frame(self.overview_content)
+
+        # Header with install command
+        header = ttk.Frame(self.overview_frame)
+        header.pack(fill=tk.X, pady=(0, 15))
 
-        # Create scrollable frame
-        overview_scroll = ttk.Frame(overview_tab)
-        overview_scroll.pack(fill=tk.BOTH, expand=True)
+        self.overview_name_label = ttk.Label(header, font=_shared_font("Segoe UI", 14, "bold"))
+        self.overview_name_label.pack(anchor=tk.W, padx=15, pady=(10, 2))
+        self.overview_version_label = ttk.Label(header, foreground=Theme.TEXT_SECONDARY)
+        self.overview_version_label.pack(anchor=tk.W, padx=15, pady=(0, 5))
 
-        overview_canvas = tk.Canvas(overview_scroll, bg=Theme.BG, highlightthickness=0)
-        overview_scrollbar = ttk.Scrollbar(overview_scroll, orient=tk.VERTICAL, command=overview_canvas.yview)
+        install_frame = ttk.Frame(header)
+        install_frame.pack(anchor=tk.W, padx=15, pady=(0, 10))
 
-        self.overview_content = ttk.Frame(overview_canvas)
+        ttk.Label(install_frame, text="Install:").pack(side=tk.LEFT)
+        self.overview_install_label = ttk.Label(install_frame, foreground=Theme.ACCENT, font=_shared_font("Consolas", 9))
+        self.overview_install_label.pack(side=tk.LEFT, padx=5)
+        ttk.Button(install_frame, text="Copy", style="Secondary.TButton", command=self._copy_install_cmd).pack(side=tk.LEFT)
 
-        def on_overview_configure(event):
-            overview_canvas.configure(scrollregion=overview_canvas.bbox("all"))
+        # Description
+        self.overview_desc_frame = ttk.Frame(self.overview_frame)
+        self.overview_desc_label = ttk.Label(self.overview_desc_frame, wraplength=600, justify=tk.LEFT)
+        self.overview_desc_label.pack(anchor=tk.W)
 
-        self.overview_content.bind("<Configure>", on_overview_configure)
+        # README section
+        self.overview_readme_frame = ttk.Frame(self.overview_frame)
+        ttk.Label(self.overview_readme_frame, text="README", font=_shared_font("Segoe UI", 12, "bold")).pack(anchor=tk.W, pady=(0, 10))
 
-        overview_canvas.create_window((0, 0), window=self.overview_content, anchor="nw")
-        overview_canvas.configure(yscrollcommand=overview_scrollbar.set)
+        self.overview_readme_notice = ttk.Label(
+            self.overview_readme_frame,
+            text="Markdown rendering disabled for long README",
+            foreground=Theme.TEXT_MUTED
+        )
 
-        overview_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        overview_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        # Create a frame for the README content
+        self.overview_readme_container = ttk.Frame(self.overview_readme_frame)
+        self.overview_readme_container.pack(fill=tk.BOTH, expand=True)
 
-        # Create the markdown text widget for README
+        # Create the markdown text widget
         self.readme_text = tk.Text(
-            self.overview_content,
+            self.overview_readme_container,
             wrap='word',
+            height=10,  # Minimum request; the README takes whatever height the tab has left
             bg=Theme.BG_SECONDARY,
             fg=Theme.TEXT,
             relief='flat',
             padx=10,
             pady=10,
-            font=("Segoe UI", 10)
+            font=_shared_font("Segoe UI", 10)
         )
 
         # Initialize markdown renderer
         self.markdown_renderer = MarkdownRenderer(self.readme_text)
 
-    def _create_file_tree_tab(self):
-        """Create the file tree tab for exploring package contents"""
-        file_tree_tab = ttk.Frame(self.notebook)
-        self.notebook.add(file_tree_tab, text="Files")
+        # Add scrollbar
+        self.readme_scrollbar = ttk.Scrollbar(self.overview_readme_container, orient=tk.VERTICAL, command=self.readme_text.yview)
+        self.readme_text.configure(yscrollcommand=self._on_readme_yscroll)
+
+        self.readme_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.readme_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        # Info table
+        self.overview_info_tree = ttk.Treeview(
+            self.overview_frame,
+            columns=("field", "value"),
+            show="",
+            selectmode="none"
+        )
+        self.overview_info_tree.column("field", width=INFO_FIELD_WIDTH, stretch=False)
+        self.overview_info_tree.column("value", stretch=True)
+
+        # URLs section
+        self.overview_urls_separator = ttk.Separator(self.overview_frame, orient=tk.HORIZONTAL)
+        self.overview_urls_frame = ttk.Frame(self.overview_frame)
+
+        # Each URL is a single clickable label rather than a caption plus a button
+        self.overview_homepage_link = ttk.Label(self.overview_urls_frame, foreground=Theme.ACCENT, cursor="hand2")
+        self.overview_homepage_link.bind("<Button-1>", lambda e: self.open_url(self._shown_pkg.homepage))
+
+        self.overview_repo_link = ttk.Label(self.overview_urls_frame, foreground=Theme.ACCENT, cursor="hand2")
+        self.overview_repo_link.bind("<Button-1>", lambda e: self.open_url(self._shown_pkg.repository))
+
+        # Keywords section
+        self.overview_keywords_separator = ttk.Separator(self.overview_frame, orient=tk.HORIZONTAL)
+        self.overview_keywords_title = ttk.Label(
+            self.overview_frame, text="Keywords", font=_shared_font("Segoe UI", 10, "bold")
+        )
+        self.overview_keywords_label = ttk.Label(self.overview_frame, wraplength=600, justify=tk.LEFT)
+
+        # Every section below the header, in display order
+        self._overview_sections = (
+            self.overview_desc_frame,
+            self.overview_readme_frame,
+            self.overview_info_tree,
+            self.overview_urls_separator,
+            self.overview_urls_frame,
+            self.overview_keywords_separator,
+            self.overview_keywords_title,
+            self.overview_keywords_label,
+        )
+
+    def _on_tab_changed(self, event=None):
+        """Build or refresh a lazily filled tab when it is selected, and render any README deferred until now"""
+        self._render_pending_readme()
+        name = self.notebook.tab(self.notebook.select(), "text")
+        builder = self._tab_builders.pop(name, None)
+        if builder is not None:
+            builder(self._tab_frames[name])
+        elif name not in self._stale_tabs:
+            return
 
+        self._stale_tabs.discard(name)
+        if self._shown_pkg is not None:
+            self._tab_populators[name](self._shown_pkg)
+
+    def _create_file_tree_tab(self, file_tree_tab: ttk.Frame):
+        """Create the file tree tab for exploring package contents"""
         # Create file tree viewer
-        self.file_tree_viewer = FileTreeViewer(file_tree_tab, self._on_file_tree_select)
+        self.file_tree_viewer = FileTreeViewer(file_tree_tab, self._on_file_tree_select, self.client, self.settings)
 
-    def _create_dependencies_tab(self):
+    def _create_dependencies_tab(self, deps_tab: ttk.Frame):
         """Create the dependencies tab with dependency and dependent information"""
-        deps_tab = ttk.Frame(self.notebook)
-        self.notebook.add(deps_tab, text="Dependencies")
-
         # Create a paned window for dependencies and dependents
         deps_paned = ttk.PanedWindow(deps_tab, orient=tk.VERTICAL)
         deps_paned.pack(fill=tk.BOTH, expand=True)
@@ -3224,7 +4013,7 @@ class NPMAnalyzerApp:
         deps_frame = ttk.Frame(deps_paned)
         deps_paned.add(deps_frame, weight=1)
 
-        deps_label = ttk.Label(deps_frame, text="Dependencies", font=('Segoe UI', 10, 'bold'))
+        deps_label = ttk.Label(deps_frame, text="Dependencies", font=_shared_font("Segoe UI", 10, "bold"))
         deps_label.pack(anchor=tk.W, padx=5, pady=(5, 0))
 
         deps_scroll = ttk.Frame(deps_frame)
@@ -3263,7 +4052,7 @@ class NPMAnalyzerApp:
         dependents_frame = ttk.Frame(deps_paned)
         deps_paned.add(dependents_frame, weight=1)
 
-        dependents_label = ttk.Label(dependents_frame, text="Dependents", font=('Segoe UI', 10, 'bold'))
+        dependents_label = ttk.Label(dependents_frame, text="Dependents", font=_shared_font("Segoe UI", 10, "bold"))
         dependents_label.pack(anchor=tk.W, padx=5, pady=(5, 0))
 
         dependents_scroll = ttk.Frame(dependents_frame)
@@ -3296,62 +4085,54 @@ class NPMAnalyzerApp:
         dependents_scroll.grid_rowconfigure(0, weight=1)
         dependents_scroll.grid_columnconfigure(0, weight=1)
 
-    def _create_json_tab(self):
+    def _create_json_tab(self, json_tab: ttk.Frame):
         """Create the JSON tab with package data"""
-        json_tab = ttk.Frame(self.notebook)
-        self.notebook.add(json_tab, text="JSON")
-
-        # Create scrollable frame
-        json_scroll = ttk.Frame(json_tab)
-        json_scroll.pack(fill=tk.BOTH, expand=True)
-
-        json_canvas = tk.Canvas(json_scroll, bg=Theme.BG, highlightthickness=0)
-        json_scrollbar = ttk.Scrollbar(json_scroll, orient=tk.VERTICAL, command=json_canvas.yview)
-
-        self.json_content = ttk.Frame(json_canvas)
-
-        def on_json_configure(event):
-            json_canvas.configure(scrollregion=json_canvas.bbox("all"))
-
-        self.json_content.bind("<Configure>", on_json_configure)
-
-        json_canvas.create_window((0, 0), window=self.json_content, anchor="nw")
-        json_canvas.configure(yscrollcommand=json_scrollbar.set)
-
-        json_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        json_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-
         # Create the JSON text widget
         self.json_text = tk.Text(
-            self.json_content,
+            json_tab,
             wrap='word',
             bg=Theme.BG_SECONDARY,
             fg=Theme.TEXT,
             relief='flat',
             padx=10,
             pady=10,
-            font=("Consolas", 9)
+            font=_shared_font("Consolas", 9)
         )
+        self.json_scrollbar = ttk.Scrollbar(json_tab, orient=tk.VERTICAL, command=self.json_text.yview)
+        self.json_text.configure(yscrollcommand=self._on_json_yscroll)
 
-        self.json_text.pack(fill=tk.BOTH, expand=True)
+        self.json_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.json_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+    def _on_json_yscroll(self, first: str, last: str):
+        """Track the JSON view and pull in more text when it nears the end of what's loaded"""
+        self.json_scrollbar.set(first, last)
+        if self._json_map is not None and not self._json_append_scheduled and float(last) > 0.9:
+            self._json_append_scheduled = True
+            self.root.after_idle(self._append_json_text)
 
     def _update_search_history(self):
         """Update the search history dropdown"""
+        version = self.search_history.version
+        if version == self._history_cache_version:
+            return
+
         recent_searches = self.search_history.get_recent_searches()
-        search_list = [f"{query} ({mode})" for query, mode in recent_searches]
-        self.search_history_combo['values'] = search_list
+        self._history_cache_list = tuple(f"{query} ({mode})" for query, mode in recent_searches)
+        self._history_cache_version = version
+        self.search_history_combo['values'] = self._history_cache_list
 
     def _on_history_selected(self, event=None):
         """Handle selection from search history"""
-        selection = self.search_history_var.get()
-        if selection:
-            try:
-                query_part = selection.rsplit(' (', 1)[0]
-                mode_part = selection.rsplit(' (', 1)[1].rstrip(')')
-                self.search_var.set(query_part)
-                self.search_mode.set(mode_part)
-            except:
-                pass
+        match = _HIST_RE.match(self.search_history_var.get())
+        if match:
+            self.search_var.set(match.group(1))
+            self.search_mode.set(match.group(2))
+
+    def _record_search(self, query: str, mode: str):
+        """Add a search to the history and refresh the dropdown"""
+        self.search_history.add_search(query, mode)
+        self._update_search_history()
 
     def _clear_search_history(self):
         """Clear the search history"""
@@ -3362,29 +4143,29 @@ class NPMAnalyzerApp:
 
     def _show_mode_explanation(self, event=None):
         """Show explanation for current search mode"""
-        mode = self.search_mode.get()
-        explanations = {
-            "general": "Search across package names, descriptions, and keywords. Best for broad discovery.",
-            "exact package": "Search for exact package name matches only. Use when you know the exact name.",
-            "keywords": "Search only in package keywords. Find packages with specific functionality tags.",
-            "author": "Search by package author name. Find all packages by a specific developer.",
-            "maintainer": "Search by package maintainer name. Find packages maintained by specific people.",
-            "scope": "Search within specific npm scopes (e.g., @angular, @react). Find packages from organizations."
-        }
-
-        explanation_text = explanations.get(mode, "No description available")
+        explanation_text = MODE_EXPLANATIONS.get(self.search_mode.get(), "No description available")
         self.status_var.set(f"Search mode: {explanation_text}")
 
     def _validate_max_results(self, event=None):
         """Validate max results input"""
+        current = self.max_results_var.get()
+        if current == self._last_max_results_str:
+            return
+
         try:
-            value = int(self.max_results_var.get())
+            value = int(current)
             if value < 1:
-                self.max_results_var.set(str(DEFAULT_MAX_RESULTS))
+                value = DEFAULT_MAX_RESULTS
+                self.max_results_var.set(str(value))
             elif value > 1000000:
+                value = 1000000
                 self.max_results_var.set("1000000")
         except ValueError:
-            self.max_results_var.set(str(DEFAULT_MAX_RESULTS))
+            value = DEFAULT_MAX_RESULTS
+            self.max_results_var.set(str(value))
+
+        self._last_max_results_str = self.max_results_var.get()
+        self._last_max_results_int = value
 
     def _on_date_change(self, event=None):
         if self.date_filter.get() == "custom date":
@@ -3395,11 +4176,67 @@ class NPMAnalyzerApp:
             self.date_label.config(text="")
 
     def _show_calendar(self):
-        # This would typically open a calendar dialog
-        # For simplicity, we'll just set today's date
-        today = datetime.date.today()
-        self.selected_date = today
-        self.date_label.config(text=today.strftime("%Y-%m-%d"))
+        """Open the date picker on the month of the current selection"""
+        if self._calendar_win is None:
+            self._calendar_win = self._build_calendar()
+
+        self._calendar_month = (self.selected_date or datetime.date.today()).replace(day=1)
+        self._fill_calendar()
+        self._calendar_win.deiconify()
+        self._calendar_win.lift()
+
+    def _build_calendar(self) -> tk.Toplevel:
+        """Create the date picker window with a fixed 6x7 grid of day buttons"""
+        win = tk.Toplevel(self.root)
+        win.title("Select Date")
+        win.configure(bg=Theme.BG)
+        win.resizable(False, False)
+        win.transient(self.root)
+        win.protocol("WM_DELETE_WINDOW", win.withdraw)
+
+        header = ttk.Frame(win, padding=5)
+        header.pack(fill=tk.X)
+        ttk.Button(header, text="<", width=3, style="Secondary.TButton",
+                   command=lambda: self._shift_calendar_month(-1)).pack(side=tk.LEFT)
+        ttk.Button(header, text=">", width=3, style="Secondary.TButton",
+                   command=lambda: self._shift_calendar_month(1)).pack(side=tk.RIGHT)
+        self._calendar_title = ttk.Label(header, anchor=tk.CENTER)
+        self._calendar_title.pack(side=tk.LEFT, fill=tk.X, expand=True)
+
+        days = ttk.Frame(win, padding=5)
+        days.pack()
+        for column, name in enumerate(calendar.day_abbr):
+            ttk.Label(days, text=name[:2], foreground=Theme.TEXT_SECONDARY).grid(row=0, column=column)
+
+        self._calendar_days: List[ttk.Button] = []
+        for cell in range(42):
+            button = ttk.Button(days, width=3, style="Secondary.TButton")
+            button.grid(row=1 + cell // 7, column=cell % 7, padx=1, pady=1)
+            self._calendar_days.append(button)
+
+        return win
+
+    def _shift_calendar_month(self, months: int):
+        self._calendar_month += relativedelta(months=months)
+        self._fill_calendar()
+
+    def _fill_calendar(self):
+        """Relabel the day buttons for the month being shown"""
+        month = self._calendar_month
+        self._calendar_title.config(text=month.strftime("%B %Y"))
+
+        days = [day for week in calendar.monthcalendar(month.year, month.month) for day in week]
+        days += [0] * (len(self._calendar_days) - len(days))
+        for button, day in zip(self._calendar_days, days):
+            if day:
+                button.config(text=str(day), state=tk.NORMAL, command=partial(self._pick_date, month.replace(day=day)))
+            else:
+                button.config(text="", state=tk.DISABLED, command="")
+
+    def _pick_date(self, date: datetime.date):
+        self.selected_date = date
+        self.date_label.config(text=date.strftime("%Y-%m-%d"))
+        self._calendar_win.withdraw()
 
     def _show_cache_stats(self):
         stats = self.cache.get_stats()
@@ -3418,19 +4255,122 @@ TTL: {self.cache.ttl_days} days"""
             messagebox.showinfo("Cache Cleared", f"Cache cleared. {stats['total']} entries remaining.")
 
     def _toggle_selection(self, event):
-        selection = self.results_tree.selection()
-        if selection:
-            item = selection[0]
-            icon = self.results_tree.item(item, "text")
-            self.results_tree.item(item, text="[X]" if icon == "[ ]" else "[ ]")
+        if self._cursor_idx is not None:
+            self._toggle_index(self._cursor_idx)
+
+    def _toggle_index(self, index: int):
+        """Flip the download checkbox of a result and redraw its row"""
+        if index in self._selected:
+            self._selected.discard(index)
+        else:
+            self._selected.add(index)
+
+        slot = index - self._view_first
+        if 0 <= slot < len(self._row_items):
+            self.results_tree.item(self._row_items[slot], text="[X]" if index in self._selected else "[ ]")
 
     def _select_all(self):
-        for item in self.results_tree.get_children():
-            self.results_tree.item(item, text="[X]")
+        self._selected = set(range(len(self._col_name)))
+        self._refresh_checkboxes()
 
     def _deselect_all(self):
-        for item in self.results_tree.get_children():
-            self.results_tree.item(item, text="[ ]")
+        self._selected.clear()
+        self._refresh_checkboxes()
+
+    def _refresh_checkboxes(self):
+        """Redraw only the checkbox column of the visible rows"""
+        for slot, item in enumerate(self._row_items):
+            self.results_tree.item(item, text="[X]" if self._view_first + slot in self._selected else "[ ]")
+
+    def _row_index(self, item: str) -> Optional[int]:
+        """Map a pooled tree item to the index of the result it currently shows"""
+        try:
+            return self._view_first + self._row_items.index(item)
+        except ValueError:
+            return None
+
+    def _on_results_configure(self, event):
+        """Resize the row pool to the number of rows that fit in the tree"""
+        visible = max(1, event.height // RESULT_ROW_HEIGHT - 1)
+        if visible != self._visible_rows:
+            self._visible_rows = visible
+            self._render_viewport()
+
+    def _on_results_yview(self, *args):
+        """Scrollbar command for the virtual results list"""
+        if args[0] == 'moveto':
+            self._render_viewport(int(float(args[1]) * len(self.all_results)))
+        elif args[0] == 'scroll':
+            step = int(args[1])
+            if args[2] == 'pages':
+                step *= self._visible_rows
+            self._scroll_results(step)
+
+    def _scroll_results(self, rows: int):
+        self._render_viewport(self._view_first + rows)
+        return "break"
+
+    def _move_cursor(self, delta: int):
+        """Move the highlighted result, scrolling it into view if needed"""
+        if not self.all_results:
+            return "break"
+
+        current = self._cursor_idx if self._cursor_idx is not None else self._view_first - 1
+        index = max(0, min(len(self.all_results) - 1, current + delta))
+        self._cursor_idx = index
+
+        first = self._view_first
+        if index < first:
+            first = index
+        elif index >= first + self._visible_rows:
+            first = index - self._visible_rows + 1
+        self._render_viewport(first)
+        return "break"
+
+    def _render_viewport(self, first: Optional[int] = None):
+        """Show results [first, first + visible rows) by recycling a fixed pool of tree items"""
+        total = len(self.all_results)
+        if first is None:
+            first = self._view_first
+        first = max(0, min(first, total - self._visible_rows))
+        self._view_first = first
+        count = min(self._visible_rows, total - first)
+
+        while len(self._row_items) < count:
+            self._row_items.append(self.results_tree.insert("", "end"))
+        while len(self._row_items) > count:
+            self.results_tree.delete(self._row_items.pop())
+
+        for slot, item in enumerate(self._row_items):
+            index = first + slot
+            pkg = self.all_results[index]
+            self.results_tree.item(
+                item,
+                text="[X]" if index in self._selected else "[ ]",
+                values=(
+                    index,
+                    pkg.name,
+                    pkg.version,
+                    pkg.file_count,
+                    pkg.size_unpacked,
+                    pkg.dependencies_count if pkg.dependencies_count > 0 else '',
+                    pkg.dependents_count if pkg.dependents_count > 0 else '',
+                    pkg.downloads_last_week if pkg.downloads_last_week > 0 else '',
+                    pkg.last_publish
+                ),
+                tags=self._col_tags[index]
+            )
+
+        cursor = self._cursor_idx
+        if cursor is not None and first <= cursor < first + count:
+            self.results_tree.selection_set(self._row_items[cursor - first])
+        else:
+            self.results_tree.selection_set(())
+
+        if total:
+            self.results_scrollbar.set(first / total, (first + count) / total)
+        else:
+            self.results_scrollbar.set(0.0, 1.0)
 
     def _update_worker_count(self, event=None):
         """Update worker count and display"""
@@ -3453,10 +4393,16 @@ TTL: {self.cache.ttl_days} days"""
             self.status_var.set("Invalid worker count")
 
     def _stop_search(self):
-        """Stop the current search"""
-        self.search_stop_flag.set()
+        """Stop the running search, or the running download when no search is active"""
+        if self.is_searching and not self.search_stop_flag.is_set():
+            self.search_stop_flag.set()
+            self.status_var.set("Stopping search...")
+            if self.is_downloading:
+                return  # The button stays up so the download can be stopped next
+        else:
+            self.download_stop_flag.set()
+            self.status_var.set("Stopping download...")
         self.stop_btn.pack_forget()
-        self.status_var.set("Stopping search...")
 
     def _search_packages(self, event=None):
         """Search for NPM packages with various filters and options"""
@@ -3465,13 +4411,12 @@ TTL: {self.cache.ttl_days} days"""
             messagebox.showwarning("Input Required", "Please enter a search query")
             return
 
-        # Add to search history
-        self.search_history.add_search(query, self.search_mode.get())
-        self._update_search_history()
+        # Record the search once the event loop is idle, so the SQLite write doesn't delay it
+        self.root.after_idle(self._record_search, query, self.search_mode.get())
 
         # Validate inputs
         self._validate_max_results()
-        max_results = int(self.max_results_var.get())
+        max_results = self._last_max_results_int
 
         # Validate worker count and update display
         try:
@@ -3505,162 +4450,225 @@ TTL: {self.cache.ttl_days} days"""
         # Parse date filter
         date_filter = None
         date_option = self.date_filter.get()
+        delta = DATE_DELTA.get(date_option)
 
-        if date_option == "last week":
-            date_filter = datetime.datetime.now() - datetime.timedelta(days=7)
-        elif date_option == "last month":
-            date_filter = datetime.datetime.now() - datetime.timedelta(days=30)
-        elif date_option == "last year":
-            date_filter = datetime.datetime.now() - datetime.timedelta(days=365)
+        if delta:
+            date_filter = datetime.datetime.now() - delta
         elif date_option == "custom date" and self.selected_date:
             date_filter = datetime.datetime.combine(self.selected_date, datetime.time.min)
 
         # Parse search mode
-        mode = self.search_mode.get()
-        search_query = query
-
-        if mode == "keywords":
-            search_query = f"keywords:{query}"
-        elif mode == "author":
-            search_query = f"author:{query}"
-        elif mode == "maintainer":
-            search_query = f"maintainer:{query}"
-        elif mode == "scope":
-            search_query = f"scope:{query}"
-        elif mode == "exact package":
-            search_query = f"package:{query}"
+        prefix = MODE_PREFIX.get(self.search_mode.get(), "")
+        search_query = f"{prefix}{query}" if prefix else query
 
-        # Clear results
-        for item in self.results_tree.get_children():
-            self.results_tree.delete(item)
+        # Each search gets its own stop flag, so one still winding down after Stop cannot
+        # write its results or progress into the next
+        self.search_stop_flag.set()
+        stop_flag = self.search_stop_flag = threading.Event()
 
+        # Clear results
+        with self._pending_lock:
+            self._pending_pkgs.clear()
         self.all_results = []
         self.result_counter = 0
-        self.package_items = {}
+        self._col_name = []
+        self._col_size = array('d')
+        self._col_tags = []
+        self._details_loaded = set()
+        self._selected = set()
+        self._cursor_idx = None
+        self._render_viewport(0)
         self._clear_details()
 
         # Set searching state and show stop button
         self.is_searching = True
-        self.search_stop_flag.clear()
         self.stop_btn.pack(side=tk.RIGHT, padx=10, pady=8)
         self.root.config(cursor="watch")
         self.status_var.set(f"Searching with {workers} workers...")
         self.progress["value"] = 0
 
+        # The search thread only records its progress; the UI thread polls it at a fixed rate
+        progress_state = [0, max_results]
+        search_done = threading.Event()
+
         def perform_search():
             try:
                 start_time = time.time()
 
-                def progress_callback(current: int, total: int, max_results: int):
-                    percent = (current / max_results) * 100
-                    self.root.after(0, lambda p=percent: self.progress.configure(value=p))
-                    self.root.after(0, lambda: self.status_var.set(f"Fetching: {current}/{max_results}"))
-
-                def result_callback(packages: List[PackageInfo]):
-                    for pkg in packages:
-                        self.root.after(0, lambda p=pkg: self._add_package_to_results(p))
-
                 packages = self.client.search_packages(
                     search_query,
                     date_filter=date_filter,
                     size_min=size_min,
                     max_results=max_results,
-                    progress_callback=progress_callback,
-                    result_callback=result_callback,
-                    fetch_details=self.fetch_details.get()
+                    progress_callback=partial(self._record_progress, progress_state),
+                    result_callback=partial(self._queue_results, stop_flag),
+                    fetch_details=self.fetch_details.get(),
+                    stop_check=stop_flag.is_set
                 )
+                search_done.set()
 
-                self.all_results = packages
                 elapsed = time.time() - start_time
-
-                self.root.after(0, lambda: self.status_var.set(f"Found {len(packages)} packages in {elapsed:.1f}s"))
-                self.root.after(0, lambda: self.results_count.config(text=f"{len(packages)} packages"))
-
-                stats = self.client.get_stats()
-                self.root.after(0, lambda: self.stats_label.config(
-                    text=f"Requests: {stats['requests']} | Cache: {stats['cache_hit_rate']}"
-                ))
+                self.root.after(0, self._show_search_summary, stop_flag, len(packages), elapsed, self.client.get_stats())
             except Exception as e:
                 logger.error(f"Search error: {e}")
-                self.root.after(0, lambda: messagebox.showerror("Search Error", str(e)))
+                self.root.after(0, messagebox.showerror, "Search Error", str(e))
             finally:
-                self.root.after(0, lambda: self.progress.configure(value=100))
-                self.root.after(0, lambda: self.root.config(cursor=""))
-                self.root.after(0, lambda: self.stop_btn.pack_forget())
-                self.is_searching = False
+                search_done.set()
+                self.root.after(0, self._finish_search, stop_flag)
 
         threading.Thread(target=perform_search, daemon=True).start()
+        self.root.after(PROGRESS_REFRESH_MS, self._pump_progress, progress_state, search_done, stop_flag, (0, max_results))
+
+    def _record_progress(self, state: List[int], current: int, total: int, max_results: int):
+        """Search thread progress callback; only stores the numbers for _pump_progress"""
+        state[0] = current
+        state[1] = max_results
+
+    def _queue_results(self, stop_flag: threading.Event, packages: List[PackageInfo]):
+        """Search thread result callback; queues packages for the next _flush_pending"""
+        with self._pending_lock:
+            # Checked under the lock so results of a search that was just replaced are dropped
+            if stop_flag.is_set():
+                return
+            self._pending_pkgs.extend(packages)
+            if not self._flush_scheduled:
+                self._flush_scheduled = True
+                self.root.after(RESULT_FLUSH_INTERVAL_MS, self._flush_pending)
+
+    def _pump_progress(self, state: List[int], done: threading.Event, stop_flag: threading.Event,
+                       shown: Tuple[int, int]):
+        """Redraw the progress bar from the search's progress state while it runs"""
+        if done.is_set() or stop_flag.is_set():
+            return
+        current, total = state
+        if (current, total) != shown:
+            self.progress.configure(value=(current / total) * 100)
+            self.status_var.set(f"Fetching: {current}/{total}")
+        self.root.after(PROGRESS_REFRESH_MS, self._pump_progress, state, done, stop_flag, (current, total))
+
+    def _show_search_summary(self, stop_flag: threading.Event, count: int, elapsed: float, stats: Dict[str, Any]):
+        """Report the result count and client stats of a finished search"""
+        if stop_flag is not self.search_stop_flag:
+            return  # A newer search owns the status bar
+        self.status_var.set(f"Found {count} packages in {elapsed:.1f}s")
+        self.results_count.config(text=f"{count} packages")
+        self.stats_label.config(
+            text=f"Requests: {stats['requests']} | Cache: {stats['cache_hit_rate'] * 100:.1f}%"
+        )
 
-    def _add_package_to_results(self, pkg: PackageInfo):
-        """Add a package to the results tree"""
-        downloads = pkg.downloads_last_week if pkg.downloads_last_week > 0 else ''
-        dependencies = pkg.dependencies_count if pkg.dependencies_count > 0 else ''
-        dependents = pkg.dependents_count if pkg.dependents_count > 0 else ''
-
-        # Create tags for color coding
-        size_tag = f"size_{self.result_counter}"
-        time_tag = f"time_{self.result_counter}"
-
-        item = self.results_tree.insert(
-            "",
-            "end",
-            text="[ ]",
-            values=(
-                self.result_counter,
-                pkg.name,
-                pkg.version,
-                pkg.file_count,
-                pkg.size_unpacked,
-                dependencies,
-                dependents,
-                downloads,
-                pkg.last_publish
-            ),
-            tags=(size_tag, time_tag)
+    def _finish_search(self, stop_flag: threading.Event):
+        """Reset the search controls once the search thread exits"""
+        if stop_flag is not self.search_stop_flag:
+            return  # A newer search is still running
+        self.is_searching = False
+        self.progress.configure(value=100)
+        self.root.config(cursor="")
+        if not self.is_downloading:
+            self.stop_btn.pack_forget()
+
+    def _flush_pending(self):
+        """Move a batch of streamed results into the list, rescheduling while more are queued"""
+        with self._pending_lock:
+            # Results still in flight when the search was stopped are dropped
+            if self.search_stop_flag.is_set():
+                self._pending_pkgs.clear()
+                self._flush_scheduled = False
+                return
+
+            count = min(len(self._pending_pkgs), RESULT_FLUSH_BATCH)
+            pkgs = [self._pending_pkgs.popleft() for _ in range(count)]
+            if self._pending_pkgs:
+                self.root.after(RESULT_FLUSH_INTERVAL_MS, self._flush_pending)
+            else:
+                self._flush_scheduled = False
+
+        if pkgs:
+            self._bulk_insert(pkgs)
+
+    def _bulk_insert(self, pkgs: List[PackageInfo]):
+        """Append packages to the results, redrawing the viewport at most once"""
+        start = self.result_counter
+        self.all_results.extend(pkgs)
+        self.result_counter += len(pkgs)
+
+        self._col_name.extend(pkg.name for pkg in pkgs)
+        for pkg in pkgs:
+            size = NPMClient._parse_size_to_bytes(pkg.size_unpacked)
+            self._col_size.append(float('nan') if size is None else size)
+
+        # Bucket the whole batch once; rendering then only looks the tags up
+        self._col_tags.extend(
+            (
+                SIZE_BUCKET_TAGS[0 if math.isnan(size) else bisect_right(SIZE_BUCKET_EDGES, size)],
+                f"time_{pkg.get_time_bucket()}"
+            )
+            for pkg, size in zip(pkgs, self._col_size[start:])
         )
 
-        # Configure color tags
-        self.results_tree.tag_configure(size_tag, foreground=pkg.get_size_color())
-        self.results_tree.tag_configure(time_tag, foreground=pkg.get_time_color())
+        if start < self._view_first + self._visible_rows:
+            self._render_viewport()
+        else:
+            total = self.result_counter
+            self.results_scrollbar.set(self._view_first / total, (self._view_first + len(self._row_items)) / total)
 
-        self.package_items[pkg.name] = item
-        self.result_counter += 1
+    def _add_package_to_results(self, pkg: PackageInfo):
+        """Append a single package to the results"""
+        self._bulk_insert([pkg])
 
     def _on_result_click(self, event):
-        region = self.results_tree.identify_region(event.x, event.y)
-        if region == "tree":
-            item = self.results_tree.identify_row(event.y)
-            if item:
-                icon = self.results_tree.item(item, "text")
-                self.results_tree.item(item, text="[X]" if icon == "[ ]" else "[ ]")
+        item = self.results_tree.identify_row(event.y)
+        index = self._row_index(item) if item else None
+        if index is None:
             return
 
-        selection = self.results_tree.selection()
-        if not selection:
+        self._cursor_idx = index
+        if self.results_tree.identify_region(event.x, event.y) == "tree":
+            self._toggle_index(index)
             return
 
-        item = selection[0]
-        values = self.results_tree.item(item, "values")
-        if values:
-            package_name = values[1]
-            if package_name:
-                self.current_package = package_name
-                self.root.config(cursor="watch")
-                self.status_var.set(f"Loading: {package_name}")
-
-                def fetch():
-                    try:
-                        pkg = self.client.get_comprehensive_data(package_name)
-                        if pkg:
-                            self.root.after(0, lambda: self._display_package(pkg))
-                    except Exception as e:
-                        logger.error(f"Error loading package: {e}")
-                        self.root.after(0, lambda: messagebox.showerror("Error", str(e)))
-                    finally:
-                        self.root.after(0, lambda: self.root.config(cursor=""))
-                        self.root.after(0, lambda: self.status_var.set("Ready"))
+        self._load_package_details(self._col_name[index], index)
+
+    def _load_package_details(self, package_name: str, index: Optional[int] = None):
+        """Fetch full package data in the background, superseding any load still in progress"""
+        self.current_package = package_name
+        if self._detail_future is not None:
+            self._detail_future.cancel()
+        self._detail_token += 1
+
+        # Results whose full data was already loaded are shown without another fetch
+        if index in self._details_loaded:
+            self.root.config(cursor="")
+            self._display_package(self.all_results[index])
+            return
+
+        self.root.config(cursor="watch")
+        self.status_var.set(f"Loading: {package_name}")
+
+        token = self._detail_token
+        self._detail_future = self._detail_executor.submit(
+            self.client.get_comprehensive_data, package_name, include_readme=True, include_file_tree=True
+        )
+        self._detail_future.add_done_callback(lambda f: self.root.after(0, self._on_detail_ready, token, f, index))
 
-                threading.Thread(target=fetch, daemon=True).start()
+    def _on_detail_ready(self, token: int, future: concurrent.futures.Future, index: Optional[int] = None):
+        """Display a finished details load unless a newer one has been requested"""
+        if token != self._detail_token:
+            return
+
+        self.root.config(cursor="")
+        self.status_var.set("Ready")
+        try:
+            pkg = future.result()
+        except Exception as e:
+            logger.error(f"Error loading package: {e}")
+            messagebox.showerror("Error", str(e))
+            return
+
+        if pkg:
+            if index is not None and index < len(self._col_name) and self._col_name[index] == pkg.name:
+                self.all_results[index] = pkg
+                self._details_loaded.add(index)
+            self._display_package(pkg)
 
     def _on_double_click(self, event):
         """Handle double-click on a package to open npm page"""
@@ -3673,228 +4681,316 @@ TTL: {self.cache.ttl_days} days"""
                 if package_name:
                     webbrowser.open(f"https://www.npmjs.com/package/{package_name}")
 
-    def _display_package(self, pkg: PackageInfo):
-        """Display package details with proper markdown rendering"""
-        # Clear overview content
-        for widget in self.overview_content.winfo_children():
-            widget.destroy()
+    def _show_overview(self, shown: bool):
+        """Switch the overview tab between the package skeleton and the placeholder"""
+        if shown:
+            self._overview_placeholder.pack_forget()
+            self.overview_frame.pack(fill=tk.BOTH, expand=True)
+        else:
+            self.overview_frame.pack_forget()
+            self._overview_placeholder.pack(fill=tk.BOTH, expand=True)
+            self._readme_token += 1
+            self._readme_stream = None
+            self._pending_readme = None
+
+    def _render_pending_readme(self):
+        """Start rendering the shown overview's README if it is pending and the overview tab is visible"""
+        if self.notebook.select() != str(self.overview_content):
+            return
+        pending = self._pending_readme
+        if pending is None:
+            return
+        self._pending_readme = None
+
+        pkg, plain = pending
+        readme = pkg.readme
+        token = self._readme_token
+        if plain:
+            # Long READMEs skip the markdown parse and go in line by line as plain text
+            self._stream_segments(token, [(line, ()) for line in readme.splitlines(True)])
+            return
 
-        # Clear dependencies and dependents trees
-        for item in self.deps_tree.get_children():
-            self.deps_tree.delete(item)
+        key = (pkg.name, pkg.version, hash(readme))
+        segments = self._readme_cache.get(key)
+        if segments is not None:
+            self._readme_cache.move_to_end(key)
+            self._stream_segments(token, segments)
+            return
 
-        for item in self.dependents_tree.get_children():
-            self.dependents_tree.delete(item)
+        # Parse the README off the UI thread, then insert it a chunk per tick
+        renderer = self.markdown_renderer
 
-        # Header with install command
-        header = ttk.Frame(self.overview_content)
-        header.pack(fill=tk.X, pady=(0, 15))
+        def parse():
+            try:
+                segments = renderer.to_segments(readme)
+                self.root.after_idle(self._cache_readme_segments, key, token, segments)
+            except Exception as e:
+                logger.error(f"Error rendering README: {e}")
 
-        ttk.Label(header, text=pkg.name, font=('Segoe UI', 14, 'bold')).pack(anchor=tk.W, padx=15, pady=(10, 2))
-        ttk.Label(header, text=f"v{pkg.version}", foreground=Theme.TEXT_SECONDARY).pack(anchor=tk.W, padx=15, pady=(0, 5))
+        threading.Thread(target=parse, daemon=True).start()
 
-        # Install command
-        install_frame = ttk.Frame(header)
-        install_frame.pack(anchor=tk.W, padx=15, pady=(0, 10))
+    def _cache_readme_segments(self, key: Tuple[str, str, int], token: int, segments: List[Tuple[str, tuple]]):
+        """Remember a parsed README for later views, then start inserting it"""
+        self._readme_cache[key] = segments
+        if len(self._readme_cache) > README_CACHE_SIZE:
+            self._readme_cache.popitem(last=False)
+        self._stream_segments(token, segments)
 
-        ttk.Label(install_frame, text="Install:").pack(side=tk.LEFT)
-        install_cmd = f"npm install {pkg.name}"
-        cmd_label = ttk.Label(install_frame, text=install_cmd, foreground=Theme.ACCENT, font=("Consolas", 9))
-        cmd_label.pack(side=tk.LEFT, padx=5)
+    def _copy_install_cmd(self):
+        """Copy the shown package's install command"""
+        self.root.clipboard_clear()
+        self.root.clipboard_append(self.overview_install_label.cget("text"))
+        self.status_var.set("Install command copied to clipboard")
 
-        # Copy install command
-        def copy_install_cmd():
-            self.root.clipboard_clear()
-            self.root.clipboard_append(install_cmd)
-            self.status_var.set("Install command copied to clipboard")
+    def _fill_overview(self, pkg: PackageInfo):
+        """Put a package into the overview widgets, showing only the sections it has content for"""
+        self.overview_name_label.config(text=pkg.name)
+        self.overview_version_label.config(text=f"v{pkg.version}")
+        self.overview_install_label.config(text=f"npm install {pkg.name}")
 
-        ttk.Button(install_frame, text="Copy", style="Secondary.TButton", command=copy_install_cmd).pack(side=tk.LEFT)
+        # Sections are repacked in order, so hidden ones come back in their place
+        for section in self._overview_sections:
+            section.pack_forget()
 
-        # Description
         if pkg.description:
-            desc_frame = ttk.Frame(self.overview_content)
-            desc_frame.pack(fill=tk.X, pady=(0, 15), padx=5)
-            ttk.Label(desc_frame, text=pkg.description, wraplength=600, justify=tk.LEFT).pack(anchor=tk.W)
+            self.overview_desc_label.config(text=pkg.description)
+            self.overview_desc_frame.pack(fill=tk.X, pady=(0, 15), padx=5)
 
-        # README section
+        # The README is only rendered once the overview tab is actually looked at
+        self._readme_token += 1
+        self._readme_stream = None
+        self._pending_readme = None
         if pkg.readme and pkg.readme.strip():
-            readme_frame = ttk.Frame(self.overview_content)
-            readme_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 15), padx=5)
-
-            ttk.Label(readme_frame, text="README", font=('Segoe UI', 12, 'bold')).pack(anchor=tk.W, pady=(0, 10))
-
-            # Create a frame for the README content
-            readme_container = ttk.Frame(readme_frame)
-            readme_container.pack(fill=tk.BOTH, expand=True)
-
-            # Create the markdown text widget
-            self.readme_text = tk.Text(
-                readme_container,
-                wrap='word',
-                bg=Theme.BG_SECONDARY,
-                fg=Theme.TEXT,
-                relief='flat',
-                padx=10,
-                pady=10,
-                font=("Segoe UI", 10)
-            )
-
-            # Initialize markdown renderer
-            self.markdown_renderer = MarkdownRenderer(self.readme_text)
-
-            # Render the README
-            self.markdown_renderer.render(pkg.readme)
-
-            # Add scrollbar
-            readme_scrollbar = ttk.Scrollbar(readme_container, orient=tk.VERTICAL, command=self.readme_text.yview)
-            self.readme_text.configure(yscrollcommand=readme_scrollbar.set)
-
-            self.readme_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-            readme_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-
-        # Enhanced info fields
-        info_data = [
-            ("Unpacked Size", pkg.size_unpacked),
-            ("Total Files", pkg.file_count),
-            ("Weekly Downloads", str(pkg.downloads_last_week) if pkg.downloads_last_week else 'N/A'),
-            ("Download Trend", pkg.downloads_trend),
-            ("Last Publish", pkg.last_publish),
-            ("Published Date", pkg.published_date),
-            ("Last Modified", pkg.modified_date),
-            ("License", pkg.license),
-            ("Author", pkg.author),
-            ("Dependencies", f"{pkg.dependencies_count} ({len(pkg.dependencies) if pkg.dependencies else 0} direct)"),
-            ("Dev Dependencies", str(pkg.dev_dependencies_count)),
-            ("Peer Dependencies", str(pkg.peer_dependencies_count)),
-            ("Dependents", str(pkg.dependents_count)),
-            ("Total Versions", str(pkg.total_versions)),
-            ("Maintainers", str(pkg.maintainers_count)),
-            ("Has TypeScript", "Yes" if pkg.has_typescript else "No"),
-            ("Has Tests", "Yes" if pkg.has_tests else "No"),
-            ("Has Readme", "Yes" if pkg.has_readme else "No"),
-            ("Quality Score", f"{pkg.score_quality:.2f}"),
-            ("Popularity Score", f"{pkg.score_popularity:.2f}"),
-            ("Maintenance Score", f"{pkg.score_maintenance:.2f}"),
-            ("Final Score", f"{pkg.score_final:.2f}"),
-        ]
-
-        for label, value in info_data:
-            if value and value != 'Unknown' and value != 'N/A' and value != '0':
-                row = ttk.Frame(self.overview_content)
-                row.pack(fill=tk.X, pady=3, padx=5)
-
-                ttk.Label(row, text=label, width=20, anchor=tk.W).pack(side=tk.LEFT)
-                ttk.Label(row, text=value, font=('Segoe UI', 9, 'bold'), anchor=tk.W).pack(
-                    side=tk.LEFT, fill=tk.X, expand=True
-                )
+            plain = len(pkg.readme) > self.settings.get_int('General', 'max_markdown_chars', MARKDOWN_MAX_CHARS)
+            if plain:
+                self.overview_readme_notice.pack(anchor=tk.W, pady=(0, 5), before=self.overview_readme_container)
+            else:
+                self.overview_readme_notice.pack_forget()
+
+            self.readme_text.config(state=tk.NORMAL)
+            self.readme_text.delete('1.0', 'end')
+            self.readme_text.insert('1.0', "Loading README\u2026")
+            self._pending_readme = (pkg, plain)
+            self.overview_readme_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 15), padx=5)
+
+        # One two-column table instead of a pair of labels per field
+        info_rows = pkg.overview_rows()
+        self.overview_info_tree.delete(*self.overview_info_tree.get_children())
+        for row in info_rows:
+            self.overview_info_tree.insert("", "end", values=row)
+        self.overview_info_tree.config(height=len(info_rows))
+        self.overview_info_tree.pack(fill=tk.X, padx=5)
 
-        # URLs section
         if pkg.homepage or pkg.repository:
-            ttk.Separator(self.overview_content, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=15)
-
-            urls_frame = ttk.Frame(self.overview_content)
-            urls_frame.pack(fill=tk.X, padx=5)
+            self.overview_urls_separator.pack(fill=tk.X, pady=15)
+            self.overview_urls_frame.pack(fill=tk.X, padx=5)
 
+            self.overview_homepage_link.pack_forget()
+            self.overview_repo_link.pack_forget()
             if pkg.homepage:
-                homepage_frame = ttk.Frame(urls_frame)
-                homepage_frame.pack(fill=tk.X, pady=2)
-
-                ttk.Label(homepage_frame, text="Homepage:", width=10, anchor=tk.W).pack(side=tk.LEFT)
-                homepage_btn = ttk.Button(
-                    homepage_frame,
-                    text=pkg.homepage,
-                    style="Secondary.TButton",
-                    command=lambda: self.open_url(pkg.homepage)
-                )
-                homepage_btn.pack(side=tk.LEFT, fill=tk.X, expand=True)
-
+                self.overview_homepage_link.config(text=f"Homepage:  {pkg.homepage}")
+                self.overview_homepage_link.pack(anchor=tk.W, pady=2)
             if pkg.repository:
-                repo_frame = ttk.Frame(urls_frame)
-                repo_frame.pack(fill=tk.X, pady=2)
-
-                ttk.Label(repo_frame, text="Repository:", width=10, anchor=tk.W).pack(side=tk.LEFT)
-                repo_btn = ttk.Button(
-                    repo_frame,
-                    text=pkg.repository,
-                    style="Secondary.TButton",
-                    command=lambda: self.open_url(pkg.repository)
-                )
-                repo_btn.pack(side=tk.LEFT, fill=tk.X, expand=True)
+                self.overview_repo_link.config(text=f"Repository:  {pkg.repository}")
+                self.overview_repo_link.pack(anchor=tk.W, pady=2)
 
-        # Keywords section
         if pkg.keywords:
-            ttk.Separator(self.overview_content, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=15)
+            count = len(pkg.keywords)
+            keywords_text = ', '.join(islice(pkg.keywords, KEYWORDS_SHOWN))
+            if count > KEYWORDS_SHOWN:
+                keywords_text = f"{keywords_text} ... and {count - KEYWORDS_SHOWN} more"
+
+            self.overview_keywords_separator.pack(fill=tk.X, pady=15)
+            self.overview_keywords_title.pack(anchor=tk.W, pady=(0, 10), padx=5)
+            self.overview_keywords_label.config(text=keywords_text)
+            self.overview_keywords_label.pack(anchor=tk.W, padx=5)
+
+    def _stream_segments(self, token: int, segments: List[Tuple[str, tuple]], start: int = 0):
+        """Insert the next batch of README segments, yielding to the event loop between batches"""
+        # A newer package has taken over the README widget
+        if token != self._readme_token:
+            return
 
-            ttk.Label(self.overview_content, text="Keywords", font=('Segoe UI', 10, 'bold')).pack(
-                anchor=tk.W, pady=(0, 10), padx=5
-            )
+        if start == 0:
+            self.readme_text.config(state=tk.NORMAL)
+            self.readme_text.delete('1.0', 'end')
 
-            keywords_text = ', '.join(pkg.keywords[:20])
-            if len(pkg.keywords) > 20:
-                keywords_text += f" ... and {len(pkg.keywords) - 20} more"
+        end = start + MARKDOWN_SEGMENTS_PER_TICK
+        self.markdown_renderer.insert_segments(segments[start:end])
+        if end >= len(segments):
+            return
+
+        # Past the first screens, the rest waits until the user scrolls near the end
+        if int(self.readme_text.index('end-1c').split('.')[0]) < README_PRELOAD_LINES:
+            self.root.after(1, self._stream_segments, token, segments, end)
+        else:
+            self._readme_stream = (token, segments, end)
+
+    def _on_readme_yscroll(self, first: str, last: str):
+        """Track the README view and resume inserting its segments when it nears the end"""
+        self.readme_scrollbar.set(first, last)
+        if float(last) > 0.9 and self._readme_stream is not None:
+            self.root.after_idle(self._stream_segments, *self._readme_stream)
+            self._readme_stream = None
+
+    def _display_package(self, pkg: PackageInfo):
+        """Display package details with proper markdown rendering"""
+        self._shown_pkg = pkg
+        self._fill_overview(pkg)
+        self._show_overview(True)
+        self._render_pending_readme()
+
+        # Only the visible tab is filled now; the others pick the package up when next opened
+        selected = self.notebook.tab(self.notebook.select(), "text")
+        for name, populate in self._tab_populators.items():
+            if name in self._tab_builders:
+                continue
+            if name == selected:
+                populate(pkg)
+            else:
+                self._stale_tabs.add(name)
 
-            ttk.Label(self.overview_content, text=keywords_text, wraplength=600, justify=tk.LEFT).pack(anchor=tk.W, padx=5)
+        self.status_var.set(f"Loaded: {pkg.name}")
 
-        # Update dependencies and dependents tabs with detailed information
+    def _show_dependencies(self, pkg: PackageInfo):
+        """Fill the dependencies and dependents trees"""
         if pkg.dependency_details:
-            for dep_name, details in pkg.dependency_details.items():
-                self.deps_tree.insert(
-                    "",
-                    "end",
-                    text="",
-                    values=(
-                        dep_name,
-                        details.get('version', 'N/A'),
-                        details.get('size', 'N/A'),
-                        details.get('files', 'N/A'),
-                        details.get('last_publish', 'N/A')
-                    )
+            deps_rows = [
+                (
+                    dep_name,
+                    details.get('version', 'N/A'),
+                    details.get('size', 'N/A'),
+                    details.get('files', 'N/A'),
+                    details.get('last_publish', 'N/A')
                 )
+                for dep_name, details in pkg.dependency_details.items()
+            ]
         else:
-            self.deps_tree.insert("", "end", text="", values=("No dependencies found", "", "", "", ""))
+            deps_rows = [("No dependencies found", "", "", "", "")]
+        self._fill_tree(self.deps_tree, deps_rows)
 
         if pkg.dependents:
-            for dep_name in pkg.dependents[:20]:  # Limit to 20 dependents
-                self.dependents_tree.insert("", "end", text="", values=(dep_name, "N/A", "N/A", "N/A"))
+            dependents_rows = [(dep_name, "N/A", "N/A", "N/A") for dep_name in pkg.dependents[:20]]  # Limit to 20 dependents
         elif pkg.dependents_count > 0:
-            self.dependents_tree.insert("", "end", text="", values=(f"{pkg.dependents_count} dependents (not loaded)", "", "", ""))
+            dependents_rows = [(f"{pkg.dependents_count} dependents (not loaded)", "", "", "")]
         else:
-            self.dependents_tree.insert("", "end", text="", values=("No dependents found", "", "", ""))
-
-        # Update JSON tab
+            dependents_rows = [("No dependents found", "", "", "")]
+        self._fill_tree(self.dependents_tree, dependents_rows)
+
+    def _fill_tree(self, tree: ttk.Treeview, rows: List[tuple]):
+        """Replace the rows of a tree while it is unmapped, so it redraws once"""
+        tree.grid_remove()
+        tree.delete(*tree.get_children())
+        for values in rows[:DEPS_DISPLAY_LIMIT]:
+            tree.insert("", "end", text="", values=values)
+        if len(rows) > DEPS_DISPLAY_LIMIT:
+            tree.insert("", "end", text="", values=(f"... and {len(rows) - DEPS_DISPLAY_LIMIT} more",))
+        tree.grid()
+
+    def _show_json(self, pkg: PackageInfo):
+        """Fill the JSON tab, loading only as much as has been scrolled into view"""
         self.json_text.delete('1.0', 'end')
-        json_data = json.dumps(pkg.to_dict(), indent=2)
-        self.json_text.insert('1.0', json_data)
+        self._close_json_file()
+        self._json_token += 1
+        token = self._json_token
+
+        # The whole document is encoded to a temp file off the UI thread
+        def encode():
+            try:
+                path = _dump_json_to_tempfile(pkg.to_dict())
+            except Exception as e:
+                logger.error(f"Error encoding package JSON: {e}")
+                return
+            # A stale token means another package or on_close got here first
+            if token != self._json_token:
+                _remove_json_file(path)
+                return
+            try:
+                self.root.after(0, self._open_json_file, token, path)
+            except (RuntimeError, tk.TclError):  # The window is already gone
+                _remove_json_file(path)
+
+        threading.Thread(target=encode, daemon=True).start()
+
+    def _open_json_file(self, token: int, path: str):
+        """Map an encoded JSON file and show its first piece, unless another package has replaced it"""
+        if token != self._json_token:
+            _remove_json_file(path)
+            return
+
+        try:
+            self._json_path = path
+            self._json_file = open(path, 'rb')
+            self._json_map = mmap.mmap(self._json_file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._json_offset = 0
+        except (OSError, ValueError) as e:
+            logger.error(f"Error opening package JSON: {e}")
+            self._close_json_file()
+            return
+        self._append_json_text()
 
-        # Update file tree tab
+    def _append_json_text(self):
+        """Read the next piece of the JSON file and append it"""
+        self._json_append_scheduled = False
+        data = self._json_map
+        if data is None:
+            return
+
+        start = self._json_offset
+        end = min(start + JSON_CHUNK_BYTES, len(data))
+        # Never split a UTF-8 sequence between two pieces
+        while end < len(data) and data[end] & 0xC0 == 0x80:
+            end -= 1
+        self.json_text.insert('end', data[start:end].decode('utf-8'))
+
+        self._json_offset = end
+        if end >= len(data):
+            self._close_json_file()
+
+    def _close_json_file(self):
+        """Unmap and delete the JSON tab's temp file"""
+        if self._json_map is not None:
+            self._json_map.close()
+            self._json_map = None
+        if self._json_file is not None:
+            self._json_file.close()
+            self._json_file = None
+        if self._json_path is not None:
+            _remove_json_file(self._json_path)
+            self._json_path = None
+
+    def _show_file_tree(self, pkg: PackageInfo):
+        """Load the package into the file tree tab"""
         if pkg.file_tree:
             self.file_tree_viewer.load_package(pkg.name, pkg.file_tree)
 
-        self.status_var.set(f"Loaded: {pkg.name}")
-
     def _clear_details(self):
         """Clear the details panels"""
-        # Clear overview content
-        for widget in self.overview_content.winfo_children():
-            widget.destroy()
-
-        self.json_text.delete('1.0', 'end')
-
-        ttk.Label(
-            self.overview_content,
-            text="Select a package to view details",
-            foreground=Theme.TEXT_MUTED,
-            font=("Segoe UI", 10, "italic")
-        ).pack(expand=True)
+        self._show_overview(False)
+        self._shown_pkg = None
+        if "JSON" not in self._tab_builders:
+            self._close_json_file()
+            self._json_token += 1
+            self.json_text.delete('1.0', 'end')
+
+    def _record_download_progress(self, current: int, total: int, result: Dict):
+        """Download thread progress callback; the UI is redrawn at most every PROGRESS_REFRESH_MS"""
+        self._download_progress = (current, total, result['package'])
+        if not self._download_progress_scheduled:
+            self._download_progress_scheduled = True
+            self.root.after(PROGRESS_REFRESH_MS, self._flush_download_progress)
+
+    def _flush_download_progress(self):
+        """Show the latest recorded download progress"""
+        self._download_progress_scheduled = False
+        if self._download_progress is None:
+            return
+        current, total, package = self._download_progress
+        self.progress.configure(value=(current / total) * 100)
+        self.status_var.set(f"Downloading: {current}/{total} - {package}")
 
     def _download_selected(self):
-        selected_packages = []
-
-        for item in self.results_tree.get_children():
-            if self.results_tree.item(item, "text") == "[X]":
-                values = self.results_tree.item(item, "values")
-                if values:
-                    selected_packages.append(values[1])
+        selected_packages = [self._col_name[i] for i in sorted(self._selected)]
 
         if not selected_packages:
             messagebox.showwarning("No Selection", "Please select at least one package")
@@ -3907,8 +5003,7 @@ TTL: {self.cache.ttl_days} days"""
             messagebox.showwarning("No Results", "No packages to download")
             return
 
-        package_names = [pkg.name for pkg in self.all_results]
-        self._confirm_and_download(package_names, "all packages")
+        self._confirm_and_download(list(self._col_name), "all packages")
 
     def _download_current(self):
         if not self.current_package:
@@ -3952,19 +5047,20 @@ TTL: {self.cache.ttl_days} days"""
         self.status_var.set(f"Downloading {len(packages)} packages...")
         self.progress["value"] = 0
 
+        # The Stop button cancels the downloads that have not started yet
+        self.is_downloading = True
+        self.download_stop_flag.clear()
+        self.stop_btn.pack(side=tk.RIGHT, padx=10, pady=8)
+
         def do_download():
             try:
-                def progress_callback(current: int, total: int, result: Dict):
-                    percent = (current / total) * 100
-                    self.root.after(0, lambda p=percent: self.progress.configure(value=p))
-                    self.root.after(0, lambda: self.status_var.set(
-                        f"Downloading: {current}/{total} - {result['package']}"
-                    ))
-
                 results = self.client.download_packages_concurrent(
                     packages,
-                    progress_callback=progress_callback
+                    progress_callback=self._record_download_progress,
+                    stop_event=self.download_stop_flag
                 )
+                # A throttled redraw still queued must not overwrite the final status
+                self._download_progress = None
 
                 success = sum(1 for r in results if r['success'])
                 failed = [r for r in results if not r['success']]
@@ -3998,58 +5094,74 @@ TTL: {self.cache.ttl_days} days"""
                     try:
                         if IS_WINDOWS:
                             os.startfile(batch_dir)
-                        elif IS_MAC:
-                            subprocess.run(['open', batch_dir])
                         else:
-                            subprocess.run(['xdg-open', batch_dir])
-                    except:
-                        pass
+                            # The file manager is started detached; nothing waits for it to exit
+                            subprocess.Popen(
+                                ['open' if IS_MAC else 'xdg-open', batch_dir],
+                                start_new_session=True,
+                                stdout=subprocess.DEVNULL,
+                                stderr=subprocess.DEVNULL
+                            )
+                    except OSError as e:
+                        logger.error(f"Error opening {batch_dir}: {e}")
             except Exception as e:
                 logger.error(f"Download error: {str(e)}")
                 self.root.after(0, lambda: messagebox.showerror("Download Error", str(e)))
             finally:
-                self.root.after(0, lambda: self.progress.configure(value=100))
-                self.root.after(0, lambda: self.root.config(cursor=""))
+                self.root.after(0, self._finish_download)
 
         threading.Thread(target=do_download, daemon=True).start()
 
+    def _finish_download(self):
+        """Reset the download controls once the download thread exits"""
+        self.is_downloading = False
+        self.progress.configure(value=100)
+        self.root.config(cursor="")
+        if not self.is_searching:
+            self.stop_btn.pack_forget()
+
     def open_npm_page(self):
         if self.current_package:
             self.open_url(f"https://www.npmjs.com/package/{self.current_package}")
 
-    def open_repo(self):
-        if self.current_package:
-            def fetch_repo():
-                try:
-                    pkg = self.client.get_comprehensive_data(self.current_package)
-                    if pkg and pkg.repository:
-                        self.root.after(0, lambda: self.open_url(pkg.repository))
-                    else:
-                        self.root.after(0, lambda: messagebox.showinfo(
-                            "No Repository",
-                            "No repository URL found"
-                        ))
-                except Exception as e:
-                    logger.error(f"Error opening repository: {e}")
+    def _current_pkg(self) -> Optional[PackageInfo]:
+        """The displayed package, if it is the current one"""
+        pkg = self._shown_pkg
+        if pkg is not None and pkg.name == self.current_package:
+            return pkg
+        return None
 
-            threading.Thread(target=fetch_repo, daemon=True).start()
+    def open_repo(self):
+        self._open_package_link("repository", "Repository")
 
     def open_homepage(self):
-        if self.current_package:
-            def fetch_homepage():
-                try:
-                    pkg = self.client.get_comprehensive_data(self.current_package)
-                    if pkg and pkg.homepage:
-                        self.root.after(0, lambda: self.open_url(pkg.homepage))
-                    else:
-                        self.root.after(0, lambda: messagebox.showinfo(
-                            "No Homepage",
-                            "No homepage URL found"
-                        ))
-                except Exception as e:
-                    logger.error(f"Error opening homepage: {e}")
+        self._open_package_link("homepage", "Homepage")
+
+    def _open_package_link(self, attr: str, label: str):
+        """Open a URL field of the current package, fetching the package only if it isn't displayed yet"""
+        pkg = self._current_pkg()
+        if pkg is not None:
+            self._open_link_or_notify(getattr(pkg, attr), label)
+        elif self.current_package:
+            # Still loading; the fetch runs on the detail pool rather than a new thread
+            future = self._detail_executor.submit(self.client.get_comprehensive_data, self.current_package)
+            future.add_done_callback(lambda f: self.root.after(0, self._on_link_fetched, f, attr, label))
+
+    def _on_link_fetched(self, future: concurrent.futures.Future, attr: str, label: str):
+        """Open a URL field of a package fetched by _open_package_link"""
+        try:
+            pkg = future.result()
+        except Exception as e:
+            logger.error(f"Error opening {label.lower()}: {e}")
+            return
+        self._open_link_or_notify(getattr(pkg, attr) if pkg else "", label)
 
-            threading.Thread(target=fetch_homepage, daemon=True).start()
+    def _open_link_or_notify(self, url: str, label: str):
+        """Open url, or tell the user the package has no such link"""
+        if url:
+            self.open_url(url)
+        else:
+            messagebox.showinfo(f"No {label}", f"No {label.lower()} URL found")
 
     def open_url(self, url: str):
         """Open a URL in the default browser"""
@@ -4068,27 +5180,15 @@ TTL: {self.cache.ttl_days} days"""
     def _on_file_tree_select(self, package_name: str):
         """Handle file tree selection"""
         if package_name != self.current_package:
-            self.current_package = package_name
-            self.root.config(cursor="watch")
-            self.status_var.set(f"Loading: {package_name}")
-
-            def fetch():
-                try:
-                    pkg = self.client.get_comprehensive_data(package_name)
-                    if pkg:
-                        self.root.after(0, lambda: self._display_package(pkg))
-                except Exception as e:
-                    logger.error(f"Error loading package: {e}")
-                    self.root.after(0, lambda: messagebox.showerror("Error", str(e)))
-                finally:
-                    self.root.after(0, lambda: self.root.config(cursor=""))
-                    self.root.after(0, lambda: self.status_var.set("Ready"))
-
-            threading.Thread(target=fetch, daemon=True).start()
+            self._load_package_details(package_name)
 
     def on_close(self):
         """Clean up when closing the application"""
         try:
+            self._detail_executor.shutdown(wait=False, cancel_futures=True)
+            self._json_token += 1  # An encode still running deletes its own file
+            self._close_json_file()
+            self.client.close()
             self.cache.close()
             self.search_history.close()
         except:
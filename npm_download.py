@@ -1,24 +1,138 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+try:
+    # Optional C-backed HTML parser; BeautifulSoup is used when unavailable
+    import lxml.html as LH
+    from lxml import etree
+except ImportError:
+    LH = None
+    etree = None
 import json
 import os
-import re
 import subprocess
 import threading
-import queue
 import concurrent.futures
 import datetime
 import time
+import sqlite3
+from collections import OrderedDict
+from urllib.parse import quote
+try:
+    # Optional HTTP/2 client for scraping many pages of www.npmjs.com over one connection
+    import httpx
+except ImportError:
+    httpx = None
+try:
+    # Optional fast JSON decoder for large registry documents
+    import orjson
+except ImportError:
+    orjson = None
+
+
+PACKAGE_CACHE_SIZE = 2000  # Registry documents kept in memory
+PACKAGE_CACHE_DB = os.path.join(os.path.expanduser("~"), ".npm_downloader_cache.db")
+PACKAGE_CACHE_TTL = 24 * 60 * 60  # Seconds a registry document on disk stays fresh
+PACKAGE_CACHE_DB_ROWS = 5000  # Registry documents kept on disk
+PACKAGE_CACHE_DB_BYTES = 256 * 1024 * 1024  # Total size of the documents kept on disk
+USER_AGENT = "npm-downloader/1.0"  # Sent with every request to the registry and npmjs.com
+
+# Package links on npmjs.com listing pages, compiled once when lxml is available
+PACKAGE_NAME_XPATH = etree.XPath('//a[@data-test="package-name"]') if etree is not None else None
+
+
+def parse_json(data):
+    """Decode JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_json(response):
+    """Decode a JSON response body, using orjson when available"""
+    return parse_json(response.content)
+
+
+def extract_package_names(response):
+    """Return the package names linked from an npmjs.com listing page"""
+    if LH is not None:
+        tree = LH.fromstring(response.content)
+        return [element.text_content().strip() for element in PACKAGE_NAME_XPATH(tree)]
+
+    soup = BeautifulSoup(response.text, 'html.parser')
+    return [element.text.strip() for element in soup.select('a[data-test="package-name"]')]
+
+
+def format_size(num_bytes):
+    """Format a byte count the way npmjs.com shows unpacked sizes"""
+    size = float(num_bytes)
+    for unit in ('B', 'kB', 'MB'):
+        if size < 1000:
+            return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1000
+    return f"{size:.1f} GB"
+
 
 class NpmAPI:
     def __init__(self):
         self.registry_url = "https://registry.npmjs.org"
         self.search_url = f"{self.registry_url}/-/v1/search"
+        self.npms_url = "https://api.npms.io/v2"
         self.download_dir = "npm_packages"
-        self.package_cache = {}  # Cache for package metadata
+        self.package_cache = OrderedDict()  # LRU of registry documents, backed by the disk cache
+        self.cache_lock = threading.Lock()
+        self.disk_cache = self._open_disk_cache()
         self.concurrency = 20  # Number of concurrent operations
+        self.session = requests.Session()  # Keeps connections alive across requests
+        self.session.headers['User-Agent'] = USER_AGENT
+        self.web_client = self.session  # Client used for www.npmjs.com pages
+        self.executor = None
+        self._setup_pool()
+
+    def _open_disk_cache(self):
+        """Open the on-disk registry document cache, dropping expired entries"""
+        try:
+            conn = sqlite3.connect(PACKAGE_CACHE_DB, check_same_thread=False)
+            conn.execute("CREATE TABLE IF NOT EXISTS packages (name TEXT PRIMARY KEY, fetched_at REAL, data BLOB)")
+            conn.execute("DELETE FROM packages WHERE fetched_at < ?", (time.time() - PACKAGE_CACHE_TTL,))
+            conn.commit()
+            return conn
+        except sqlite3.Error as e:
+            print(f"Package cache on disk disabled: {e}")
+            return None
+
+    def _setup_pool(self):
+        """Size the connection pool and the shared worker pool to the concurrency"""
+        adapter = HTTPAdapter(
+            pool_connections=self.concurrency,
+            pool_maxsize=self.concurrency,
+            max_retries=Retry(total=3, backoff_factor=0.2)
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        if httpx is not None:
+            try:
+                client = httpx.Client(
+                    http2=True,
+                    limits=httpx.Limits(max_connections=self.concurrency,
+                                        max_keepalive_connections=self.concurrency),
+                    headers={'User-Agent': USER_AGENT},
+                    follow_redirects=True
+                )
+            except ImportError:  # http2 needs the h2 package
+                client = None
+            if client is not None:
+                if self.web_client is not self.session:
+                    self.web_client.close()
+                self.web_client = client
+
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.concurrency)
 
     def search_packages(self, query, max_time_ago=None, time_unit=None, max_results=1000, progress_callback=None):
         """Search for packages matching query with concurrency, with optional time filter and pagination"""
@@ -30,10 +144,10 @@ class NpmAPI:
 
         def fetch_page(page_num):
             from_value = page_num * page_size
-            url = f"{self.search_url}?text={query}&size={page_size}&from={from_value}"
+            params = {'text': query, 'size': page_size, 'from': from_value}
 
             try:
-                response = requests.get(url)
+                response = self.session.get(self.search_url, params=params)
                 response.raise_for_status()
                 data = response.json()
                 if progress_callback:
@@ -43,21 +157,20 @@ class NpmAPI:
                 print(f"Error searching page {page_num}: {e}")
                 return []
 
-        # Use ThreadPoolExecutor for concurrent requests
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.concurrency) as executor:
-            future_to_page = {executor.submit(fetch_page, i): i for i in range(pages_to_fetch)}
+        # Fetch the pages concurrently on the shared worker pool
+        future_to_page = {self.executor.submit(fetch_page, i): i for i in range(pages_to_fetch)}
 
-            for future in concurrent.futures.as_completed(future_to_page):
-                page_results = future.result()
-                all_packages.extend(page_results)
+        for future in concurrent.futures.as_completed(future_to_page):
+            page_results = future.result()
+            all_packages.extend(page_results)
 
-                # Stop if we've reached the maximum
-                if len(all_packages) >= max_results:
-                    # Cancel any pending futures
-                    for pending_future in future_to_page:
-                        if not pending_future.done():
-                            pending_future.cancel()
-                    break
+            # Stop if we've reached the maximum
+            if len(all_packages) >= max_results:
+                # Cancel any pending futures
+                for pending_future in future_to_page:
+                    if not pending_future.done():
+                        pending_future.cancel()
+                break
 
         # Sort and limit the results
         all_packages = all_packages[:max_results]
@@ -75,7 +188,7 @@ class NpmAPI:
         if not package_info:
             return None
 
-        # Get additional details from the npm website including unpacked size and file count
+        # Fill in the details from the registry document and the npms.io analysis
         details = {
             'name': package_name,
             'version': package_info.get('dist-tags', {}).get('latest', 'Unknown'),
@@ -104,126 +217,23 @@ class NpmAPI:
                 except (ValueError, TypeError):
                     pass
 
-        # Scrape the npm website for additional details
-        url = f"https://www.npmjs.com/package/{package_name}"
+            # The registry reports the tarball's unpacked size and file count directly
+            dist = version_info.get('dist', {})
+            if dist.get('unpackedSize') is not None:
+                details['unpacked_size'] = format_size(dist['unpackedSize'])
+            if dist.get('fileCount') is not None:
+                details['file_count'] = str(dist['fileCount'])
+
+        # The npms.io analysis has the dependents count
+        url = f"{self.npms_url}/package/{quote(package_name, safe='')}"
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            response = requests.get(url, headers=headers)
+            response = self.session.get(url)
             response.raise_for_status()
-
-            soup = BeautifulSoup(response.text, 'html.parser')
-
-            # Use the specific XPaths by converting to CSS selectors
-            # /html/body/div/div/div[2]/main/div/div[3]/div[7]/p -> Unpacked Size
-            # Try multiple selectors to handle different page layouts
-            size_selectors = [
-                'div:nth-child(7) > p',
-                'main div:nth-child(3) > div:nth-child(7) > p',
-                'body > div > div > div:nth-child(2) > main > div > div:nth-child(3) > div:nth-child(7) > p'
-            ]
-
-            for selector in size_selectors:
-                size_element = soup.select(selector)
-                if size_element and 'Unpacked Size' in size_element[0].get_text():
-                    size_text = size_element[0].get_text().strip()
-                    size_match = re.search(r'Unpacked Size:\s*([\d\.]+\s*[KMG]?B)', size_text)
-                    if size_match:
-                        details['unpacked_size'] = size_match.group(1).strip()
-                        break
-
-            # /html/body/div/div/div[2]/main/div/div[3]/div[8]/p -> Total Files
-            files_selectors = [
-                'div:nth-child(8) > p',
-                'main div:nth-child(3) > div:nth-child(8) > p',
-                'body > div > div > div:nth-child(2) > main > div > div:nth-child(3) > div:nth-child(8) > p'
-            ]
-
-            for selector in files_selectors:
-                files_element = soup.select(selector)
-                if files_element and 'Total Files' in files_element[0].get_text():
-                    files_text = files_element[0].get_text().strip()
-                    files_match = re.search(r'Total Files:\s*(\d+)', files_text)
-                    if files_match:
-                        details['file_count'] = files_match.group(1).strip()
-                        break
-
-            # /html/body/div/div/div[2]/main/div/div[3]/div[9]/p/time -> Last Published
-            if details['last_published'] == 'Unknown':  # Only if not already set from API data
-                time_selectors = [
-                    'div:nth-child(9) > p > time',
-                    'main div:nth-child(3) > div:nth-child(9) > p > time',
-                    'body > div > div > div:nth-child(2) > main > div > div:nth-child(3) > div:nth-child(9) > p > time'
-                ]
-
-                for selector in time_selectors:
-                    time_element = soup.select(selector)
-                    if time_element:
-                        details['last_published'] = time_element[0].get_text().strip()
-                        break
-
-            # Find dependents count
-            dependents_selectors = [
-                'a[href*="/browse/depended/"]',
-                'a[href*="depends-on"]',
-                'a:contains("Depended by")'
-            ]
-
-            for selector in dependents_selectors:
-                try:
-                    dependents_element = soup.select_one(selector)
-                    if dependents_element:
-                        dependents_text = dependents_element.get_text().strip()
-                        dependents_match = re.search(r'(\d+)', dependents_text)
-                        if dependents_match:
-                            details['dependents_count'] = dependents_match.group(1).strip()
-                            break
-                except Exception:
-                    continue
-
-            # If we still haven't found the values, try a more generic approach
-            if details['unpacked_size'] == 'Unknown':
-                # Look for any paragraph containing "Unpacked Size"
-                for p in soup.find_all('p'):
-                    text = p.get_text().strip()
-                    if 'Unpacked Size' in text:
-                        size_match = re.search(r'([\d\.]+\s*[KMG]?B)', text)
-                        if size_match:
-                            details['unpacked_size'] = size_match.group(1).strip()
-                            break
-
-            if details['file_count'] == 'Unknown':
-                # Look for any paragraph containing "Total Files"
-                for p in soup.find_all('p'):
-                    text = p.get_text().strip()
-                    if 'Total Files' in text:
-                        files_match = re.search(r'(\d+)', text)
-                        if files_match:
-                            details['file_count'] = files_match.group(1).strip()
-                            break
-
-            # Try to get dependents
-            if 'dependents_count' in details and details['dependents_count'] != 'Unknown':
-                try:
-                    # We have a count, but we want some actual dependents for display
-                    # Just grab a few from the first page as examples
-                    dependents_url = f"https://www.npmjs.com/browse/depended/{package_name}"
-                    dep_response = requests.get(dependents_url, headers=headers)
-                    if dep_response.status_code == 200:
-                        dep_soup = BeautifulSoup(dep_response.text, 'html.parser')
-                        dep_elements = dep_soup.select('a[data-test="package-name"]')
-
-                        # Get up to 5 dependents as examples
-                        for i, elem in enumerate(dep_elements):
-                            if i >= 5:  # Limit to 5 to avoid too much data
-                                break
-                            details['dependents'].append(elem.get_text().strip())
-                except Exception as e:
-                    print(f"Error fetching dependents: {e}")
-
-        except requests.RequestException as e:
-            print(f"Error fetching package details from npm website: {e}")
+            dependents_count = load_json(response).get('collected', {}).get('npm', {}).get('dependentsCount')
+            if dependents_count is not None:
+                details['dependents_count'] = str(dependents_count)
+        except (requests.RequestException, ValueError) as e:
+            print(f"Error fetching package analysis from npms.io: {e}")
 
         # As a fallback, try to estimate size from dependencies count
         if details['unpacked_size'] == 'Unknown' and details['dependencies']:
@@ -250,44 +260,81 @@ class NpmAPI:
 
     def get_package_info(self, package_name):
         """Get detailed info about a specific package"""
-        # Check cache first
-        if package_name in self.package_cache:
-            return self.package_cache[package_name]
+        # Check the memory cache first, then the disk cache
+        with self.cache_lock:
+            if package_name in self.package_cache:
+                self.package_cache.move_to_end(package_name)
+                return self.package_cache[package_name]
+
+            row = None
+            if self.disk_cache is not None:
+                try:
+                    row = self.disk_cache.execute(
+                        "SELECT data FROM packages WHERE name = ? AND fetched_at >= ?",
+                        (package_name, time.time() - PACKAGE_CACHE_TTL)
+                    ).fetchone()
+                except sqlite3.Error as e:
+                    print(f"Error reading cached package {package_name}: {e}")
+
+        if row is not None:
+            try:
+                package_info = parse_json(row[0])
+                self._remember_package(package_name, package_info)
+                return package_info
+            except ValueError:
+                pass
 
         url = f"{self.registry_url}/{package_name}"
         try:
-            response = requests.get(url)
+            response = self.session.get(url)
             response.raise_for_status()
-            package_info = response.json()
-
-            # Cache the result
-            self.package_cache[package_name] = package_info
-            return package_info
-        except requests.RequestException as e:
+            package_info = load_json(response)
+        except (requests.RequestException, ValueError) as e:
             print(f"Error getting package info for {package_name}: {e}")
             return None
 
-    def get_dependencies(self, package_name, include_dev=False, max_depth=5, progress_callback=None):
-        """Get all dependencies of a package"""
-        visited = set()
-        dependency_queue = queue.Queue()
-        dependency_queue.put((package_name, 0))  # (package, depth)
-
-        all_dependencies = []
-        total_processed = 0
+        # Cache the result
+        self._remember_package(package_name, package_info, response.content)
+        return package_info
 
-        while not dependency_queue.empty():
-            current_package, depth = dependency_queue.get()
+    def _remember_package(self, package_name, package_info, raw=None):
+        """Add a registry document to the memory cache, and its raw JSON to the disk cache"""
+        with self.cache_lock:
+            self.package_cache[package_name] = package_info
+            self.package_cache.move_to_end(package_name)
+            if len(self.package_cache) > PACKAGE_CACHE_SIZE:
+                self.package_cache.popitem(last=False)
 
-            if current_package in visited or depth > max_depth:
-                continue
+            if raw is not None and self.disk_cache is not None:
+                try:
+                    self.disk_cache.execute(
+                        "INSERT OR REPLACE INTO packages (name, fetched_at, data) VALUES (?, ?, ?)",
+                        (package_name, time.time(), raw)
+                    )
+                    # Drop expired documents, then the oldest past the row or byte limit
+                    self.disk_cache.execute(
+                        "DELETE FROM packages WHERE fetched_at < ? OR name IN ("
+                        " SELECT name FROM (SELECT name,"
+                        "  ROW_NUMBER() OVER (ORDER BY fetched_at DESC) AS position,"
+                        "  SUM(LENGTH(data)) OVER (ORDER BY fetched_at DESC) AS total"
+                        "  FROM packages) WHERE position > ? OR total > ?)",
+                        (time.time() - PACKAGE_CACHE_TTL, PACKAGE_CACHE_DB_ROWS, PACKAGE_CACHE_DB_BYTES)
+                    )
+                    self.disk_cache.commit()
+                except sqlite3.Error as e:
+                    print(f"Error caching package {package_name}: {e}")
 
-            visited.add(current_package)
-            if current_package != package_name:  # Don't add the root package
-                all_dependencies.append(current_package)
+    def get_dependencies(self, package_name, include_dev=False, max_depth=5, progress_callback=None):
+        """Get all dependencies of a package"""
+        visited = {package_name}
+        current_level = [package_name]
+        depth = 0
+        total_processed = 0
 
-            if depth < max_depth:
-                package_info = self.get_package_info(current_package)
+        # Walk the tree a level at a time, fetching each level's packages concurrently
+        while current_level and depth < max_depth:
+            next_level = []
+            for package_info in self.executor.map(self.get_package_info, current_level):
                 if not package_info:
                     continue
 
@@ -306,31 +353,36 @@ class NpmAPI:
                     dependencies.extend(dev_dependencies)
 
                 for dep in dependencies:
-                    dependency_queue.put((dep, depth + 1))
+                    if dep not in visited:
+                        visited.add(dep)
+                        next_level.append(dep)
 
                 total_processed += 1
                 if progress_callback:
-                    progress_callback(total_processed, total_processed + dependency_queue.qsize())
+                    progress_callback(total_processed, total_processed + len(next_level))
+
+            current_level = next_level
+            depth += 1
 
-        return list(set(all_dependencies))
+        visited.discard(package_name)  # Don't add the root package
+        return list(visited)
 
     def get_dependents(self, package_name, max_pages=10, progress_callback=None):
         """Get packages that depend on this package using concurrent web scraping"""
-        dependents = []
+        dependents = set()
+
+        stop = threading.Event()  # Set once a page past the first comes back empty
 
         def scrape_page(page_num):
+            if stop.is_set():
+                return []
             page_dependents = []
             url = f"https://www.npmjs.com/browse/depended/{package_name}?offset={(page_num-1)*36}"
             try:
-                response = requests.get(url)
+                response = self.web_client.get(url, timeout=30)
                 response.raise_for_status()
 
-                soup = BeautifulSoup(response.text, 'html.parser')
-                package_elements = soup.select('a[data-test="package-name"]')
-
-                for element in package_elements:
-                    dependent_name = element.text.strip()
-                    page_dependents.append(dependent_name)
+                page_dependents.extend(extract_package_names(response))
 
                 if progress_callback:
                     progress_callback(page_num, max_pages)
@@ -340,21 +392,23 @@ class NpmAPI:
                 print(f"Error fetching dependents page {page_num}: {e}")
                 return []
 
-        # Use ThreadPoolExecutor for concurrent scraping
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.concurrency) as executor:
-            future_to_page = {executor.submit(scrape_page, i): i for i in range(1, max_pages + 1)}
+        # Scrape pages on the shared worker pool, a batch at a time in page order, so
+        # pages past the end are never requested once an empty page has been seen
+        for batch_start in range(1, max_pages + 1, self.concurrency):
+            batch_end = min(batch_start + self.concurrency, max_pages + 1)
+            future_to_page = {self.executor.submit(scrape_page, i): i for i in range(batch_start, batch_end)}
 
             for future in concurrent.futures.as_completed(future_to_page):
                 page_results = future.result()
                 # If no results on a page, we've reached the end
                 if not page_results and future_to_page[future] > 1:
-                    # Cancel any pending futures for higher page numbers
-                    for pending_future, page_num in future_to_page.items():
-                        if not pending_future.done() and page_num > future_to_page[future]:
-                            pending_future.cancel()
-                dependents.extend(page_results)
+                    stop.set()
+                dependents.update(page_results)  # The set drops names listed on more than one page
 
-        return list(set(dependents))  # Remove duplicates
+            if stop.is_set():
+                break
+
+        return list(dependents)
 
     def filter_by_time(self, packages, time_value, time_unit):
         """Filter packages by update time"""
@@ -453,9 +507,21 @@ class NpmAPI:
         """Set the directory where packages will be downloaded"""
         self.download_dir = directory
 
+    def close(self):
+        """Stop the worker pool and close the HTTP clients and the disk cache"""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        if self.web_client is not self.session:
+            self.web_client.close()
+        self.session.close()
+        with self.cache_lock:
+            if self.disk_cache is not None:
+                self.disk_cache.close()
+                self.disk_cache = None
+
     def set_concurrency(self, concurrency):
         """Set the number of concurrent operations"""
         self.concurrency = max(1, min(50, concurrency))  # Limit between 1 and 50
+        self._setup_pool()
 
 
 class NpmDownloaderUI:
@@ -468,7 +534,28 @@ class NpmDownloaderUI:
         self.api = NpmAPI()
         self.packages_to_download = []
         self.current_package = None
+        # Result details are fetched on their own pool so they never queue ahead of searches
+        self.detail_pool = concurrent.futures.ThreadPoolExecutor(max_workers=self.api.concurrency)
+        self.detail_futures = []
+        self.search_generation = 0  # Bumped per search so late work from an old search is dropped
         self.setup_ui()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
+    def on_close(self):
+        """Drop queued background work and close the window"""
+        self.detail_pool.shutdown(wait=False, cancel_futures=True)
+        self.api.close()
+        self.root.destroy()
+
+    def _insert_result_row(self, generation, item_id, values):
+        """Add a search result row unless a newer search has started"""
+        if generation == self.search_generation:
+            self.results_tree.insert("", "end", iid=item_id, values=values)
+
+    def _update_result_row(self, generation, item_id, values):
+        """Refresh a search result row unless a newer search has replaced it"""
+        if generation == self.search_generation and self.results_tree.exists(item_id):
+            self.results_tree.item(item_id, values=values)
 
     def setup_ui(self):
         """Set up the tkinter UI components"""
@@ -737,9 +824,15 @@ class NpmDownloaderUI:
             self.output_text.insert(tk.END, f"Time filter: {time_filter}\n")
         self.output_text.insert(tk.END, f"Max results: {max_results}\n")
 
+        # Start a new search generation and drop the detail fetches still queued for the last one
+        self.search_generation += 1
+        generation = self.search_generation
+        for future in self.detail_futures:
+            future.cancel()
+        detail_futures = self.detail_futures = []
+
         # Clear existing results
-        for i in self.results_tree.get_children():
-            self.results_tree.delete(i)
+        self.results_tree.delete(*self.results_tree.get_children())
 
         # Show the results frame
         self.results_frame.pack(fill=tk.BOTH, expand=True, after=self.general_frame)
@@ -784,6 +877,9 @@ class NpmDownloaderUI:
                             value=(bi / bt) * 100
                         ))
 
+                        if generation != self.search_generation:
+                            return  # A newer search has taken over the results
+
                         for result in batch:
                             try:
                                 package_data = result['package']
@@ -815,13 +911,16 @@ class NpmDownloaderUI:
                                 results_with_details.append(result_entry)
 
                                 # Add to UI immediately so user sees progress
-                                item_id = self.root.after(0, lambda pkg=result_entry: self.results_tree.insert(
-                                    "", "end",
-                                    values=(pkg['name'], pkg['version'], pkg['description'], pkg['size'], pkg['files'], pkg['date'])
+                                item_id = f"{generation}-{len(results_with_details) - 1}"
+                                self.root.after(0, lambda pkg=result_entry, iid=item_id: self._insert_result_row(
+                                    generation, iid,
+                                    (pkg['name'], pkg['version'], pkg['description'], pkg['size'], pkg['files'], pkg['date'])
                                 ))
 
                                 # Then fetch details in background
                                 def update_package_details(pkg_name, result_idx, tree_item):
+                                    if generation != self.search_generation:
+                                        return
                                     try:
                                         details = self.api.get_package_details(pkg_name)
                                         if details:
@@ -830,9 +929,10 @@ class NpmDownloaderUI:
                                             results_with_details[result_idx]['files'] = details.get('file_count', 'Unknown')
 
                                             # Update the tree item
-                                            self.root.after(0, lambda: self.results_tree.item(
+                                            self.root.after(0, lambda: self._update_result_row(
+                                                generation,
                                                 tree_item,
-                                                values=(
+                                                (
                                                     pkg_name,
                                                     results_with_details[result_idx]['version'],
                                                     results_with_details[result_idx]['description'],
@@ -844,19 +944,17 @@ class NpmDownloaderUI:
                                     except Exception as e:
                                         print(f"Error updating details for {pkg_name}: {str(e)}")
 
-                                # Start a separate thread for each package detail fetch
-                                threading.Thread(
-                                    target=update_package_details,
-                                    args=(package_name, len(results_with_details)-1, item_id),
-                                    daemon=True
-                                ).start()
-
-                                # Add a small delay between requests to avoid overwhelming the server
-                                time.sleep(0.1)
+                                # Fetch the details on the bounded detail pool, which caps the requests in flight
+                                detail_futures.append(self.detail_pool.submit(
+                                    update_package_details, package_name, len(results_with_details)-1, item_id
+                                ))
 
                             except Exception as e:
                                 print(f"Error processing search result: {str(e)}")
 
+                    if generation != self.search_generation:
+                        return
+
                     self.output_text.insert(tk.END, f"Processed {len(results_with_details)} packages with details.\n")
                     self.output_text.insert(tk.END, "Double-click on a package to see more details.\n")
                     self.status_var.set(f"Ready - Found {len(results_with_details)} packages")
@@ -898,8 +996,7 @@ class NpmDownloaderUI:
     def display_package_details(self, details):
         """Display package details in the UI"""
         # Clear previous details
-        for item in self.details_tree.get_children():
-            self.details_tree.delete(item)
+        self.details_tree.delete(*self.details_tree.get_children())
 
         # Add package information to treeview
         self.details_tree.insert("", "end", values=("Name", details['name']))